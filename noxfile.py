@@ -5,6 +5,7 @@
 # Core packages
 import os
 import pathlib
+import platform
 
 # 3rd party packages
 import nox
@@ -158,6 +159,39 @@ def unit_tests(session):
     session.run("pytest", "--cov", "tests/unit_tests")
 
 
+@nox.session(python=utils.versions)
+def benchmarks(session):
+    """Benchmark stages 3-5 on a synthetic batch.
+
+    Timings are only comparable on the same machine, so baselines are kept per
+    host outside the repository, in ``$SIERRA_BENCHMARK_STORAGE`` (default
+    ``$XDG_CACHE_HOME/sierra/benchmarks/<hostname>``). To save a baseline, and
+    later compare against it, failing if the mean time of any benchmark regresses
+    by more than 25%::
+
+      nox -s benchmarks -- --benchmark-save=baseline
+      nox -s benchmarks -- --benchmark-compare --benchmark-compare-fail=mean:25%
+
+    Pass ``--synth-size=large`` to benchmark with a bigger batch.
+    """
+    session.install(".")  # same as 'pip3 install .'
+    session.install(".[devel]")  # same as 'pip3 install .[devel]'
+    session.install("pytest-benchmark")
+
+    # Home directories are often shared between hosts on clusters
+    cache_root = pathlib.Path(os.environ.get("XDG_CACHE_HOME", "~/.cache"))
+    storage = os.environ.get(
+        "SIERRA_BENCHMARK_STORAGE",
+        cache_root.expanduser() / "sierra" / "benchmarks" / platform.node(),
+    )
+    session.run(
+        "pytest",
+        "tests/benchmarks",
+        f"--benchmark-storage={storage}",
+        *session.posargs,
+    )
+
+
 # 2024-11-19 [JRH]: This currently is just a paper-thin wrapper around the shell
 # scripts, which were implemented a long time ago. And it works. Some/all of the
 # stuff in these scripts should be migrated into python, where doing things like
@@ -170,6 +170,17 @@ class BootstrapCmdline(BaseCmdline):
                  Skip the usual startup package checks.  Only do this if you are
                  SURE you will never use the SIERRA functionality which requires
                  packages you don't have installed/can't install.
+
+                 Only the packages needed by the SIERRA core and the selected
+                 plugins are checked for.  Results from querying the OS package
+                 manager are cached per host in
+                 ``$XDG_CACHE_HOME/sierra/pkg-checks.json`` for a day; delete
+                 it to force a re-check.
+
+                 .. versionchanged:: 1.5.9
+
+                    Only check for packages the selected plugins need, and
+                    cache the results.
                  """,
             action="store_true",
         )
@@ -263,6 +274,10 @@ class BootstrapCmdline(BaseCmdline):
                      - ``storage.arrow`` - Experimental run outputs are stored
                        in a per-run directory as one or more apache arrow files.
 
+                     - ``storage.parquet`` - Experimental run outputs are
+                       stored in a per-run directory as one or more apache
+                       parquet files.
+
                  Regardless of the value of this option, SIERRA always generates
                  CSV files as it runs and averages outputs, generates graphs,
                  etc.
@@ -625,10 +640,92 @@ class CoreCmdline(BaseCmdline):
                  doing a LOT of processing, you may want to oversubscribe your
                  machine by passing a higher than default value to overcome
                  slowdown with high disk I/O.
+
+                 Library thread pools (polars, OpenMP, BLAS) in each worker are
+                 limited so that the total # of threads fits the available
+                 CPUs; see ``--processing-threads``.
                  """
             + self.stage_usage_doc([3, 4]),
             default=psutil.cpu_count(),
         )
+        self.multistage.add_argument(
+            "--processing-threads",
+            type=int,
+            help="""
+                 The # of threads each worker in results processing/graph
+                 generation can use, trading processes for threads.  If
+                 passed, ``--processing-parallelism`` is treated as a CPU
+                 budget, and is divided into workers with this many threads
+                 each; e.g., ``--processing-parallelism=64
+                 --processing-threads=8`` runs 8 workers with 8 threads each.
+                 Fewer, multithreaded workers use less memory, and scale more
+                 predictably on shared HPC nodes.
+
+                 If omitted, there are ``--processing-parallelism`` workers,
+                 and the available CPUs are divided evenly among them.
+
+                 Threads are limited via ``POLARS_MAX_THREADS``,
+                 ``OMP_NUM_THREADS``, etc., in the environment of each worker,
+                 unless they are already set.
+
+                 .. versionadded:: 1.5.9
+                 """
+            + self.stage_usage_doc([3, 4]),
+            default=None,
+        )
+        self.multistage.add_argument(
+            "--plot-quality",
+            choices=["fast", "publication"],
+            help="""
+                 How text (titles, labels, ticks, legends) on static graphs
+                 should be typeset:
+
+                     - ``fast`` - Use matplotlib's built-in math rendering, which
+                       supports most LaTeX math syntax.  Much faster, and
+                       doesn't require LaTeX to be installed.
+
+                     - ``publication`` - Use LaTeX, so that math renders exactly
+                       as it does in papers.  Typeset text is cached in
+                       ``$XDG_CACHE_HOME/sierra/tex``, and shared across all
+                       workers and batch experiments.
+
+                 .. versionadded:: 1.5.9
+                 """
+            + self.stage_usage_doc([3, 4, 5]),
+            default="publication",
+        )
+        self.multistage.add_argument(
+            "--profile",
+            choices=["cprofile", "pyinstrument", "trace"],
+            help="""
+                 Profile SIERRA itself, including the work done in worker
+                 processes during stages 3-5:
+
+                     - ``cprofile`` - Deterministic profiling with
+                       :py:mod:`cProfile`.  The profiles from all processes are
+                       merged into ``merged.prof`` and summarized in
+                       ``report.txt``.
+
+                     - ``pyinstrument`` - Sampling profiling with
+                       :program:`pyinstrument` (must be installed separately).
+                       Much lower overhead than ``cprofile``; results are in
+                       ``report.html`` and ``report.txt``.
+
+                     - ``trace`` - Record a timeline of spans (each stage and
+                       plugin, and gathering, reading, statistics kernels,
+                       writing, and rendering within them) in all processes.
+                       It is written to ``trace.json``, which can be opened
+                       with https://ui.perfetto.dev.
+
+                 Results for each stage are written to
+                 ``<batchroot>/statistics/exec/profile/stageN/``, or to
+                 ``<sierra_root>/<project>/profile/stage5/`` for stage 5.
+
+                 .. versionadded:: 1.5.9
+                 """
+            + self.stage_usage_doc([1, 2, 3, 4, 5]),
+            default=None,
+        )
         self.multistage.add_argument(
             "--exec-parallelism-paradigm",
             choices=["per-batch", "per-exp", "per-run", None],
@@ -699,6 +796,36 @@ class CoreCmdline(BaseCmdline):
                  """,
         )
 
+        self.stage2.add_argument(
+            "--exec-telemetry",
+            help="""
+                 Sample the process tree of each :term:`Experimental Run` as it
+                 executes, recording wall time, CPU usage, peak resident memory,
+                 and I/O bytes.  Results are written to a per-batch parquet
+                 table in ``<batchroot>/statistics/exec``, and a summary (slowest runs,
+                 memory high-water mark, per-experiment throughput) is printed
+                 at the end of stage 2.  Useful for sizing
+                 ``--exec-jobs-per-node`` and HPC allocations.
+
+                 For runs executed on remote hosts, only wall time is
+                 meaningful, as only the local side of the connection can be
+                 observed.
+                 """
+            + self.stage_usage_doc([2]),
+            action="store_true",
+        )
+
+        self.stage2.add_argument(
+            "--exec-telemetry-interval",
+            type=float,
+            help="""
+                 Interval in seconds between samples when ``--exec-telemetry``
+                 is passed.  Runs shorter than this may not be observed.
+                 """
+            + self.stage_usage_doc([2]),
+            default=1.0,
+        )
+
     def init_stage3(self) -> None:
         """
         Define cmdline arguments for stage 3.
@@ -735,6 +862,18 @@ class CoreCmdline(BaseCmdline):
                  should try to limit itself to using.  This is useful on systems
                  with limited memory, or on systems which are shared with other
                  users without per-user memory restrictions.
+
+                 The memory needed to process each file gathered from
+                 :term:`Experimental Runs <Experimental Run>` is estimated from
+                 its size on disk, and files are only processed once they fit
+                 in what is left of this budget (capped at the memory available
+                 when processing starts).  Files which are larger than the whole
+                 budget are processed alone.
+
+                 .. versionchanged:: 1.5.9
+
+                    Memory is budgeted per file, instead of waiting for
+                    system-wide free memory.
                  """
             + self.stage_usage_doc([3, 4]),
             default=90,
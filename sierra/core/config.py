@@ -3,99 +3,24 @@
 #  SPDX-License-Identifier: MIT
 """
 Contains all SIERRA hard-coded configuration in one place.
+
+This module only contains constants, because almost everything imports it:
+initialization of the graphics backends is done by
+:mod:`sierra.core.graphs.backends`, and only in processes which render graphs.
 """
 
 # Core packages
-import logging
 import typing as tp
-import packaging
+import packaging.version
 import os
-import ssl
-import contextlib
-import certifi
+import pathlib
 
 # 3rd party packages
-import holoviews as hv
 
 # Project packages
 from sierra.core import types
 
 
-################################################################################
-# Holoviews Configuration
-################################################################################
-def bokeh_init() -> None:
-    # Only needed when hv backend is bokeh
-    logging.getLogger("selenium").setLevel(logging.WARNING)
-    logging.getLogger("urllib3").setLevel(logging.WARNING)
-
-
-def mpl_init() -> None:
-    # Turn off MPL messages when the log level is set to DEBUG or
-    # higher. Otherwise you get HUNDREDS. Must be before import to suppress
-    # messages which occur during import.
-    #
-    # Only needed when the hv backend is mpl
-    logging.getLogger("matplotlib").setLevel(logging.WARNING)
-    logging.getLogger("PIL").setLevel(logging.WARNING)
-
-    import matplotlib as mpl  # noqa: PLC0415
-
-    mpl.rcParams["lines.linewidth"] = 3
-    mpl.rcParams["lines.markersize"] = 10
-    mpl.rcParams["figure.max_open_warning"] = 1000
-    mpl.rcParams["axes.formatter.limits"] = (-4, 4)
-
-    # Use latex to render all math, so that it matches how the math renders in
-    # papers.
-    mpl.rcParams["text.usetex"] = True
-
-    # Set MPL backend (headless for non-interactive use). Must be BEFORE
-    # importing pyplot reduce import loading time.
-    mpl.use("Agg")
-
-    import matplotlib.pyplot as plt  # noqa: PLC0415
-
-    # Set MPL style
-    plt.style.use("seaborn-v0_8-colorblind")
-
-
-def hv_ssl_init() -> None:
-    """Initialize SSL properly to ensure fork()ing works.
-
-    This should NOT be necessary, but it is until holoviews/other packages fix
-    this.
-
-    2025-11-24 [JRH]: This is ABSOLUTELY CRUCIAL to avoid SSL related errors in
-    the tornado package which hv uses.  By forcing initialization of SSL in the
-    main process before any forking happens, we (apparently) avoid memory
-    corruption which can happen otherwise.
-    """
-
-    # Disable SSL verification globally before any forks
-    os.environ["PYTHONHTTPSVERIFY"] = "0"
-    os.environ["SSL_CERT_FILE"] = certifi.where()
-
-    # Create SSL context in parent to "warm it up"
-    with contextlib.suppress(BaseException):
-        ssl.create_default_context()
-
-    # Override default context creator
-    ssl._create_default_https_context = ssl._create_unverified_context
-
-    # Pre-import tornado to initialize its SSL before fork
-    with contextlib.suppress(BaseException):
-        import tornado.netutil  # noqa: PLC0415
-
-
-hv_ssl_init()
-bokeh_init()
-mpl_init()
-
-hv.core.cache_size = 10
-hv.config.cache_size = 0
-hv.config.warning_level = 0
-
 ################################################################################
 # General Configuration
 ################################################################################
@@ -126,7 +51,7 @@ GRAPHS = {
 # These are the file extensions that files read/written by a given storage
 # plugin should have. Once processed by SIERRA they are written out as CSV files
 # with new extensions contextualizing them.
-STORAGE_EXT: types.StrDict = {"csv": ".csv", "arrow": ".arrow"}
+STORAGE_EXT: types.StrDict = {"csv": ".csv", "arrow": ".arrow", "parquet": ".parquet"}
 
 STATS: dict[str, types.StatisticsSpec] = {
     # The default for averaging
@@ -147,6 +72,15 @@ STATS: dict[str, types.StatisticsSpec] = {
     ),
 }
 
+# Extension for files bundling all statistics computed for a single output file
+# (``--dist-stats-bundle``). Columns are suffixed with the extension of the
+# statistic they contain, e.g., ``foo.mean``, ``foo.stddev``.
+STATS_BUNDLE_EXT = ".stats"
+
+# Extension for the exact <truth, predicted> counts computed from all runs for
+# output files used in confusion matrices.
+CONFUSION_COUNTS_EXT = ".counts"
+
 MODELS_EXT: types.StrDict = {"model": ".model", "legend": ".legend"}
 
 ARGOS: dict[str, tp.Any] = {
@@ -184,6 +118,16 @@ ROS: types.SimpleDict = {
     "inter_run_pause": 60,  # seconds
 }
 
+# Estimated ratio of the memory needed to process a gathered file in stage 3 to
+# its size on disk, by file extension. Processing makes a few copies of the
+# data, and text/compressed formats are bigger in memory than on disk.
+MEM_INFLATION: dict[str, float] = {
+    ".csv": 3.0,
+    ".arrow": 2.0,
+    ".parquet": 6.0,
+    "default": 4.0,
+}
+
 # 2025-06-23 [JRH]: These are empirically determined minimum values which
 # generally result in all data being processed in stage {3,4}. Change with
 # extreme caution.
@@ -207,3 +151,62 @@ GAZEBO = {
 GNU_PARALLEL: types.StrDict = {"cmdfile_stem": "commands", "cmdfile_ext": ".txt"}
 
 ENGINE = {"ping_timeout": 10}  # seconds
+
+SSH: dict[str, tp.Any] = {
+    # How long ssh master connections stay open after the last client
+    # disconnects, so they can be reused across experiments.
+    "control_persist": "10m",
+    # Max # of hosts to check connectivity to at once.
+    "check_fanout": 32,
+}
+
+FS: dict[str, tp.Any] = {
+    # Answer existence checks from cached directory listings.
+    "cache": True,
+    # Seconds a cached directory listing is trusted for. Bounds how stale
+    # existence checks can be w.r.t. files written by other processes.
+    "cache_ttl": 10.0,
+    # Retry policy for transient filesystem errors (ESTALE, EIO, timeouts,
+    # etc.). Delays are in seconds.
+    "retry_tries": 6,
+    "retry_delay": 0.1,
+    "retry_backoff": 2.0,
+}
+
+# Persistent per-user state which should survive across batch experiments
+# (e.g., tuning results).
+CACHE_ROOT = (
+    pathlib.Path(os.environ.get("XDG_CACHE_HOME", "~/.cache")).expanduser() / "sierra"
+)
+
+PLUGIN_INDEX: dict[str, tp.Any] = {
+    # Cache what plugins are on SIERRA_PLUGIN_PATH between invocations, instead
+    # of searching for them every time.
+    "cache": True,
+    "cache_leaf": "plugin-index.json",
+}
+
+PKG_CHECKS: dict[str, tp.Any] = {
+    # Cache the results of querying the OS package manager during startup
+    # checks, per host, so that they don't have to be repeated on every
+    # invocation.
+    "cache": True,
+    "cache_leaf": "pkg-checks.json",
+    "cache_ttl": 24 * 60 * 60,  # seconds
+}
+
+METRICS: dict[str, tp.Any] = {
+    # Per-batch file that timing/throughput metrics for each stage and plugin
+    # are appended to, in <batchroot>/statistics/exec.
+    "leaf": "metrics.jsonl",
+    # Seconds between samples of the memory used by SIERRA and its workers.
+    "rss_interval": 0.5,
+}
+
+EXEC_AUTOTUNE: dict[str, tp.Any] = {
+    "cache_leaf": "exec-autotune.json",
+    # Smaller concurrency levels within this fraction of the best measured
+    # throughput are preferred, since the difference is usually noise and
+    # leaves headroom on the node.
+    "tolerance": 0.05,
+}
@@ -11,6 +11,9 @@ import re
 import pwd
 import os
 import subprocess
+import asyncio
+import tempfile
+import pathlib
 import shutil
 import logging
 import argparse
@@ -213,81 +216,196 @@ def _parse_nodefile_line(line: str) -> tp.Optional[types.ParsedNodefileSpec]:
     )
 
 
+def ssh_cmd() -> str:
+    """
+    Get the ssh command to use for connecting to remote hosts.
+
+    Connections are multiplexed over a per-host master connection which persists
+    for a while after the last client exits, so connectivity checks and
+    successive runs launched by GNU parallel don't pay for ssh setup each
+    time. Pass to GNU parallel via ``--ssh``.
+    """
+    # Unix socket paths are limited to ~100 characters, so keep this short and
+    # let ssh hash the connection details (%C).
+    control_dir = pathlib.Path(tempfile.gettempdir()) / f"sierra-ssh-{os.getuid()}"
+    control_dir.mkdir(mode=0o700, exist_ok=True)
+
+    return (
+        "ssh "
+        "-o ControlMaster=auto "
+        f"-o ControlPath={control_dir}/%C "
+        f"-o ControlPersist={config.SSH['control_persist']}"
+    )
+
+
+def joblog_runtimes(joblogs: tp.Iterable[pathlib.Path]) -> dict[str, float]:
+    """
+    Compute the mean runtime of successful jobs on each host from GNU parallel
+    joblogs.
+
+    Hosts are identified by hostname only, so that they can be matched against
+    :class:`~sierra.core.types.ParsedNodefileSpec` regardless of how the login
+    was specified.
+    """
+    totals = {}  # type: dict[str, list[float]]
+
+    for joblog in joblogs:
+        with utils.utf8open(joblog, "r") as f:
+            lines = f.readlines()[1:]  # skip header
+
+        for line in lines:
+            fields = line.split("\t")
+            if len(fields) < 7 or fields[6].strip() != "0":
+                continue
+
+            # Host is ':' for local jobs, or the sshlogin (possibly including
+            # an ssh command)
+            host = fields[1].split()[-1].split("@")[-1]
+            totals.setdefault(host, []).append(float(fields[3]))
+
+    return {host: sum(t) / len(t) for host, t in totals.items()}
+
+
+def nodefile_weighted(
+    nodes: list[types.ParsedNodefileSpec],
+    cores_per_run: int,
+    runtimes: tp.Optional[dict[str, float]] = None,
+) -> list[str]:
+    """
+    Generate GNU parallel sshlogins weighted by each host's capacity.
+
+    Each host gets ``n_cores / cores_per_run`` job slots (at least 1), so
+    that hosts with more cores run proportionally more runs concurrently when
+    GNU parallel is run with ``--jobs 100%``. If observed ``runtimes`` (see
+    :func:`joblog_runtimes`) are available, hosts which are slower than the
+    median host lose slots in proportion, so fewer runs queue up behind them
+    and they don't set the finish time for the experiment.
+    """
+    runtimes = runtimes or {}
+    known = sorted(
+        {n.hostname: runtimes[n.hostname] for n in nodes if n.hostname in runtimes}.values()
+    )
+    median = known[(len(known) - 1) // 2] if known else None
+
+    ret = []
+    seen = set()
+    for node in nodes:
+        login = f"{node.login}@{node.hostname}"
+        if login in seen:
+            continue
+        seen.add(login)
+
+        slots = max(1, node.n_cores // max(1, cores_per_run))
+        if median is not None and node.hostname in runtimes:
+            speed = median / max(runtimes[node.hostname], 1e-6)
+            slots = max(1, int(slots * min(1.0, speed)))
+
+        if node.port != 22:
+            ret.append(f"{slots}/ssh -p {node.port} {login}")
+        else:
+            ret.append(f"{slots}/{login}")
+
+    return ret
+
+
 def check_connectivity(
     cmdopts: types.Cmdopts, login: str, hostname: str, port: int, host_type: str
 ) -> None:
     """
     Check if passwordless connection to the specified host+login works.
     """
-    hostname = hostname.split(":")[0]
-    _logger.info("Checking connectivity to %s", hostname)
-    ssh_diag = f"{host_type},port={port} via {login}@{hostname}"
-    nc_diag = f"{host_type},port={port} via {hostname}"
+    node = types.ParsedNodefileSpec(
+        hostname=hostname, n_cores=1, login=login, port=port
+    )
+    check_connectivity_all(cmdopts, [node], host_type)
+
+
+def check_connectivity_all(
+    cmdopts: types.Cmdopts, nodes: list[types.ParsedNodefileSpec], host_type: str
+) -> None:
+    """
+    Check if passwordless connection to all specified hosts works.
+
+    Hosts are checked concurrently, with at most ``config.SSH["check_fanout"]``
+    checks in flight at once. The ssh master connection opened for each host is
+    left running, so that subsequent connections can reuse it.
+
+    Raises :class:`subprocess.CalledProcessError` for the first host which could
+    not be reached, after all hosts have been checked.
+    """
+
+    async def _check_all() -> list[tp.Optional[BaseException]]:
+        sem = asyncio.Semaphore(config.SSH["check_fanout"])
+        return await asyncio.gather(
+            *[_check_host(cmdopts, node, host_type, sem) for node in nodes],
+            return_exceptions=True,
+        )
 
-    res = None
-    res2 = None
+    results = asyncio.run(_check_all())
+    failed = [r for r in results if isinstance(r, BaseException)]
+
+    if failed:
+        _logger.fatal("%s/%s %s hosts unreachable", len(failed), len(nodes), host_type)
+        raise failed[0]
+
+
+async def _check_host(
+    cmdopts: types.Cmdopts,
+    node: types.ParsedNodefileSpec,
+    host_type: str,
+    sem: asyncio.Semaphore,
+) -> None:
+    hostname = node.hostname.split(":")[0]
+    ssh_diag = f"{host_type},port={node.port} via {node.login}@{hostname}"
+    nc_diag = f"{host_type},port={node.port} via {hostname}"
+
+    checks = []
     if cmdopts["online_check_method"] == "ping+ssh":
-        try:
-            _logger.debug("Attempt to ping %s, type=%s", hostname, host_type)
-            timeout = config.ENGINE["ping_timeout"]
-            res = subprocess.run(
+        timeout = config.ENGINE["ping_timeout"]
+        checks.append(
+            (
                 f"ping -c 3 -W {timeout} {hostname}",
-                shell=True,
-                check=True,
-                capture_output=True,
-            )
-        except subprocess.CalledProcessError:
-            _logger.fatal("Unable to ping %s, type=%s", hostname, host_type)
-            _logger.fatal(
-                "stdout=%s, stderr=%s",
-                res.stdout.decode("utf-8") if res else None,
-                res.stderr.decode("utf-8") if res else None,
+                f"Unable to ping {hostname}, type={host_type}",
             )
-            raise
-        _logger.debug("%s is alive, type=%s", hostname, host_type)
+        )
     elif cmdopts["online_check_method"] == "nc+ssh":
-        try:
-            _logger.debug("Check for ssh tunnel to %s", nc_diag)
-            timeout = config.ENGINE["ping_timeout"]
-            res = subprocess.run(
-                f"nc -z {hostname} {port}",
-                shell=True,
-                check=True,
-                capture_output=True,
-            )
-        except subprocess.CalledProcessError:
-            _logger.fatal("No ssh tunnel to %s", nc_diag)
-            _logger.fatal(
-                "stdout=%s, stderr=%s",
-                res.stdout.decode("utf-8") if res else None,
-                res.stderr.decode("utf-8") if res else None,
-            )
-            raise
-        _logger.debug("ssh tunnel to %s alive", nc_diag)
-
-    try:
+        checks.append((f"nc -z {hostname} {node.port}", f"No ssh tunnel to {nc_diag}"))
 
-        _logger.debug("Verify ssh to %s", ssh_diag)
-        res2 = subprocess.run(
+    checks.append(
+        (
             (
-                f"ssh -p{port} "
+                f"{ssh_cmd()} -p{node.port} "
                 "-o PasswordAuthentication=no "
                 "-o StrictHostKeyChecking=no "
                 "-o BatchMode=yes "
-                f"{login}@{hostname} exit"
+                f"{node.login}@{hostname} exit"
             ),
-            shell=True,
-            check=True,
-            capture_output=True,
-        )
-    except subprocess.CalledProcessError:
-        _logger.fatal("Unable to connect to %s", ssh_diag)
-        _logger.fatal(
-            "stdout=%s, stderr=%s",
-            res2.stdout.decode("utf-8") if res2 else None,
-            res2.stderr.decode("utf-8") if res2 else None,
+            f"Unable to connect to {ssh_diag}",
         )
-        raise
+    )
+
+    async with sem:
+        _logger.info("Checking connectivity to %s", hostname)
+        for cmd, failmsg in checks:
+            _logger.debug("Run '%s'", cmd)
+            proc = await asyncio.create_subprocess_shell(
+                cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            stdout, stderr = await proc.communicate()
+
+            if proc.returncode != 0:
+                _logger.fatal(failmsg)
+                _logger.fatal(
+                    "stdout=%s, stderr=%s",
+                    stdout.decode("utf-8"),
+                    stderr.decode("utf-8"),
+                )
+                raise subprocess.CalledProcessError(
+                    proc.returncode, cmd, stdout, stderr
+                )
+
     _logger.info("%s@%s online", host_type, hostname)
 
 
@@ -337,8 +455,12 @@ def get_executable_arch_aware(base: str) -> str:
 __all__ = [
     "ExpShellCmdsGenerator",
     "check_connectivity",
+    "check_connectivity_all",
     "check_for_simulator",
     "cmdline_postparse_configure",
     "get_executable_arch_aware",
+    "joblog_runtimes",
+    "nodefile_weighted",
     "parse_nodefile",
+    "ssh_cmd",
 ]
@@ -409,7 +409,7 @@ class AttrChangeSet:
     def pickle(self, fpath: pathlib.Path, delete: bool = False) -> None:
         from sierra.core import utils  # noqa: PLC0415
 
-        if delete and utils.path_exists(fpath):
+        if delete and utils.path_exists(fpath, cached=False):
             fpath.unlink()
 
         with fpath.open("ab") as f:
@@ -447,7 +447,7 @@ class ElementRmList:
     def pickle(self, fpath: pathlib.Path, delete: bool = False) -> None:
         from sierra.core import utils  # noqa: PLC0415
 
-        if delete and utils.path_exists(fpath):
+        if delete and utils.path_exists(fpath, cached=False):
             fpath.unlink()
 
         with fpath.open("ab") as f:
@@ -504,7 +504,7 @@ class ElementAddList:
     def pickle(self, fpath: pathlib.Path, delete: bool = False) -> None:
         from sierra.core import utils  # noqa: PLC0415
 
-        if delete and utils.path_exists(fpath):
+        if delete and utils.path_exists(fpath, cached=False):
             fpath.unlink()
 
         with fpath.open("ab") as f:
@@ -0,0 +1,205 @@
+# Copyright 2026 John Harwell, All rights reserved.
+#
+#  SPDX-License-Identifier: MIT
+"""
+Filesystem access which is fast locally and robust on HPC filesystems.
+
+Two things are provided:
+
+- Existence checks backed by a per-directory listing cache: the first check
+  for anything in a directory lists the directory once with ``scandir()``, and
+  later checks for other files in the same directory are answered from the
+  listing. Listings are invalidated when SIERRA writes through
+  :mod:`~sierra.core.storage` or creates directories, at the start of each
+  pipeline stage, and after ``config.FS["cache_ttl"]`` seconds, to bound
+  staleness w.r.t. files written by other processes.
+
+- A retry/backoff policy (:func:`retry_transient`) which only retries errors
+  which are actually transient on networked/parallel filesystems (stale NFS
+  handles, I/O errors, timeouts, etc.); everything else (missing files, bad
+  permissions, malformed data) fails immediately.
+
+The policy is controlled by ``config.FS``.
+"""
+
+# Core packages
+import typing as tp
+import os
+import re
+import time
+import errno
+import pathlib
+import functools
+
+# 3rd party packages
+
+# Project packages
+from sierra.core import config
+
+TRANSIENT_ERRNOS = frozenset(
+    {
+        errno.ESTALE,
+        errno.EIO,
+        errno.ETIMEDOUT,
+        errno.EAGAIN,
+        errno.EBUSY,
+        errno.EINTR,
+        errno.ENOLCK,
+        errno.ECONNRESET,
+        errno.EREMOTEIO,
+    }
+)
+
+# Errors from polars and other libraries with rust I/O layers are wrapped in
+# their own exception types, with the OS error number in the message.
+_OS_ERROR_RE = re.compile(r"\(os error (\d+)\)")
+
+_Listing = tuple[float, tp.Optional[frozenset[str]], frozenset[str]]
+
+# Directory -> (time listed, names of non-symlink entries, names of symlinks).
+# Names are None if the directory doesn't exist.
+_listings = {}  # type: dict[str, _Listing]
+
+_F = tp.TypeVar("_F", bound=tp.Callable[..., tp.Any])
+
+
+def is_transient(e: BaseException) -> bool:
+    """Determine if an error is one which is worth retrying."""
+    if isinstance(e, TimeoutError):
+        return True
+
+    if isinstance(e, OSError) and e.errno is not None:
+        return e.errno in TRANSIENT_ERRNOS
+
+    res = _OS_ERROR_RE.search(str(e))
+    return res is not None and int(res.group(1)) in TRANSIENT_ERRNOS
+
+
+def retry_transient(func: _F) -> _F:
+    """Retry a function on transient filesystem errors.
+
+    Retries use exponential backoff, as configured by ``config.FS``. The policy
+    is looked up on each call, so it can be changed at runtime.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        tries = config.FS["retry_tries"]
+        delay = config.FS["retry_delay"]
+
+        for i in range(tries):
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                if not is_transient(e) or i == tries - 1:
+                    raise
+
+            time.sleep(delay)
+            delay *= config.FS["retry_backoff"]
+
+        return None
+
+    return tp.cast(_F, wrapper)
+
+
+def exists(path: tp.Union[pathlib.Path, str], cached: bool = True) -> bool:
+    """Check if a path exists.
+
+    Args:
+        path: The path to check.
+
+        cached: Use the listing cache. Pass False if the path may have been
+                created/deleted since the containing directory was last listed
+                by something which doesn't go through this module (e.g., a
+                bare ``open()``).
+    """
+    path = pathlib.Path(path).absolute()
+
+    if not cached or not config.FS["cache"]:
+        return _stat_exists(path)
+
+    name = path.name
+    if not name:
+        return _stat_exists(path)
+
+    listing = _listing(str(path.parent))
+    if listing is None:
+        return _stat_exists(path)
+
+    names, links = listing
+    if names is None:
+        return False
+
+    # Symlinks might be dangling
+    if name in links:
+        return _stat_exists(path)
+
+    return name in names
+
+
+def invalidate(path: tp.Optional[tp.Union[pathlib.Path, str]] = None) -> None:
+    """Drop cached listings affected by writing/creating ``path``.
+
+    The listings for ``path`` and all of its parents are dropped, since any of
+    them might have been created. If ``path`` is None, all listings are dropped.
+    """
+    if path is None:
+        _listings.clear()
+        return
+
+    path = pathlib.Path(path).absolute()
+    for p in [path, *path.parents]:
+        _listings.pop(str(p), None)
+
+
+def _listing(
+    dirpath: str,
+) -> tp.Optional[tuple[tp.Optional[frozenset[str]], frozenset[str]]]:
+    """Get the cached listing for a directory, listing it if needed.
+
+    Returns None if the directory can't be listed (but may still be
+    traversable).
+    """
+    now = time.monotonic()
+    cached = _listings.get(dirpath)
+    if cached is not None and now - cached[0] < config.FS["cache_ttl"]:
+        return cached[1], cached[2]
+
+    try:
+        names, links = _scan(dirpath)
+    except PermissionError:
+        return None
+
+    _listings[dirpath] = (now, names, links)
+    return names, links
+
+
+@retry_transient
+def _scan(dirpath: str) -> tuple[tp.Optional[frozenset[str]], frozenset[str]]:
+    names = set()
+    links = set()
+    try:
+        with os.scandir(dirpath) as it:
+            for entry in it:
+                (links if entry.is_symlink() else names).add(entry.name)
+    except (FileNotFoundError, NotADirectoryError):
+        return None, frozenset()
+
+    return frozenset(names), frozenset(links)
+
+
+@retry_transient
+def _stat_exists(path: pathlib.Path) -> bool:
+    try:
+        path.stat()
+    except OSError as e:
+        # Same as os.path.exists(), except that transient errors are raised so
+        # they can be retried.
+        if is_transient(e):
+            raise
+        return False
+
+    return True
+
+
+__all__ = ["exists", "invalidate", "is_transient", "retry_transient"]
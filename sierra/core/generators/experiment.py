@@ -236,7 +236,9 @@ class BatchExpCreator:
         # Commands file stored in batch input root
         if paradigm == "per-batch":
             path = self.pathset.root / config.GNU_PARALLEL["cmdfile_stem"]
-            if utils.path_exists(path.with_suffix(config.GNU_PARALLEL["cmdfile_ext"])):
+            if utils.path_exists(
+                path.with_suffix(config.GNU_PARALLEL["cmdfile_ext"]), cached=False
+            ):
                 path.with_suffix(config.GNU_PARALLEL["cmdfile_ext"]).unlink()
 
 
@@ -275,7 +277,7 @@ class ExpCreator:
         self.random_seeds = None
 
         if self.preserve_seeds:
-            if utils.path_exists(self.seeds_fpath):
+            if utils.path_exists(self.seeds_fpath, cached=False):
                 with self.seeds_fpath.open("rb") as f:
                     self.random_seeds = pickle.load(f)
 
@@ -344,8 +346,11 @@ class ExpCreator:
         engine.ExpConfigurer(self.cmdopts).for_exp(self.pathset.input_root)
 
         # Save seeds
-        if not utils.path_exists(self.seeds_fpath) or not self.preserve_seeds:
-            if utils.path_exists(self.seeds_fpath):
+        if (
+            not utils.path_exists(self.seeds_fpath, cached=False)
+            or not self.preserve_seeds
+        ):
+            if utils.path_exists(self.seeds_fpath, cached=False):
                 self.seeds_fpath.unlink()
             with self.seeds_fpath.open("ab") as f:
                 utils.pickle_dump(self.random_seeds, f)
@@ -452,7 +457,7 @@ class ExpCreator:
         # don't need to do that for per-run parallelism, because those files are
         # not.
         if paradigm == "per-exp" and utils.path_exists(
-            path.with_suffix(config.GNU_PARALLEL["cmdfile_ext"])
+            path.with_suffix(config.GNU_PARALLEL["cmdfile_ext"]), cached=False
         ):
             path.with_suffix(config.GNU_PARALLEL["cmdfile_ext"]).unlink()
 
@@ -1,26 +1,63 @@
 # Copyright 2021 John Harwell, All rights reserved.
 #
 #  SPDX-License-Identifier: MIT
-"""Container module for things related to graphs."""
+"""Container module for things related to graphs.
+
+The graph generation functions are imported on first use, and the graphics
+backends are initialized at the same time (see
+:mod:`~sierra.core.graphs.backends`). Lightweight submodules such as
+:mod:`~sierra.core.graphs.bcbridge`, which batch criteria import, can therefore
+be used without importing holoviews/matplotlib/bokeh.
+"""
 
 # Core packages
+import typing as tp
+import importlib
 
 # 3rd party packages
 
 # Project packages
-from .stacked_line import generate as stacked_line
-from .summary_line import generate as summary_line
-from .heatmap import generate_confusion as confusion_matrix
-from .heatmap import generate_numeric as heatmap
-from .heatmap import generate_dual_numeric as dual_heatmap
-from .network import generate as network
-from .pathset import PathSet
+
+# Exported name -> (submodule, attribute)
+_EXPORTS = {
+    "stacked_line": ("stacked_line", "generate"),
+    "summary_line": ("summary_line", "generate"),
+    "confusion_matrix": ("heatmap", "generate_confusion"),
+    "heatmap": ("heatmap", "generate_numeric"),
+    "dual_heatmap": ("heatmap", "generate_dual_numeric"),
+    "heatmap_sequence": ("heatmap", "generate_sequence"),
+    "network": ("network", "generate"),
+    "NetworkLayoutCache": ("network", "LayoutCache"),
+    "PathSet": ("pathset", "PathSet"),
+}
+
+
+def __getattr__(name: str) -> tp.Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from . import backends  # noqa: PLC0415
+
+    backends.initialize()
+
+    # Everything is bound at once, because importing a submodule binds it as an
+    # attribute of this package, which would otherwise shadow the exported
+    # function of the same name (e.g., heatmap).
+    for export, (module, attr) in _EXPORTS.items():
+        globals()[export] = getattr(
+            importlib.import_module(f".{module}", __name__), attr
+        )
+
+    return globals()[name]
+
 
 __all__ = [
+    "NetworkLayoutCache",
     "PathSet",
     "confusion_matrix",
     "dual_heatmap",
     "heatmap",
+    "heatmap_sequence",
     "network",
     "stacked_line",
     "summary_line",
@@ -0,0 +1,167 @@
+# Copyright 2020 John Harwell, All rights reserved.
+#
+#  SPDX-License-Identifier: MIT
+"""
+Initialization of the graphics backends (holoviews, matplotlib, bokeh).
+
+Initialization is expensive (importing matplotlib, loading styles, creating SSL
+contexts, ...), so it is done on demand by :func:`initialize` the first time a
+graph module is used, rather than whenever :mod:`sierra.core.config` is
+imported. Processes which don't render anything, such as stage 1-3 workers,
+never pay for it.
+
+Code which forks workers that render must call :func:`initialize` in the parent
+before forking, because SSL must be set up before any forking happens (see
+:func:`hv_ssl_init`).
+"""
+
+# Core packages
+import logging
+import os
+import ssl
+import contextlib
+
+# 3rd party packages
+import certifi
+
+# Project packages
+from sierra.core import config
+
+_state = {"initialized": False, "quality": "publication"}
+
+
+def initialize() -> None:
+    """Initialize all graphics backends.
+
+    Safe to call multiple times; only the first call in a process does
+    anything.
+    """
+    if _state["initialized"]:
+        return
+
+    hv_ssl_init()
+    bokeh_init()
+    mpl_init()
+
+    import holoviews as hv  # noqa: PLC0415
+
+    hv.core.cache_size = 10
+    hv.config.cache_size = 0
+    hv.config.warning_level = 0
+
+    _state["initialized"] = True
+    _mpl_quality_apply(_state["quality"])
+
+
+def mpl_quality_init(quality: str) -> None:
+    """Select how text on matplotlib graphs is typeset (``--plot-quality``).
+
+    If the backends have not been initialized yet, the selection is applied
+    when they are.
+    """
+    _state["quality"] = quality
+    if _state["initialized"]:
+        _mpl_quality_apply(quality)
+
+
+def bokeh_init() -> None:
+    # Only needed when hv backend is bokeh
+    logging.getLogger("selenium").setLevel(logging.WARNING)
+    logging.getLogger("urllib3").setLevel(logging.WARNING)
+
+
+def mpl_init() -> None:
+    # Turn off MPL messages when the log level is set to DEBUG or
+    # higher. Otherwise you get HUNDREDS. Must be before import to suppress
+    # messages which occur during import.
+    #
+    # Only needed when the hv backend is mpl
+    logging.getLogger("matplotlib").setLevel(logging.WARNING)
+    logging.getLogger("PIL").setLevel(logging.WARNING)
+
+    import matplotlib as mpl  # noqa: PLC0415
+
+    mpl.rcParams["lines.linewidth"] = 3
+    mpl.rcParams["lines.markersize"] = 10
+    mpl.rcParams["figure.max_open_warning"] = 1000
+    mpl.rcParams["axes.formatter.limits"] = (-4, 4)
+
+    # Use latex to render all math, so that it matches how the math renders in
+    # papers.
+    mpl.rcParams["text.usetex"] = True
+
+    # Set MPL backend (headless for non-interactive use). Must be BEFORE
+    # importing pyplot reduce import loading time.
+    mpl.use("Agg")
+
+    import matplotlib.pyplot as plt  # noqa: PLC0415
+
+    # Set MPL style
+    plt.style.use("seaborn-v0_8-colorblind")
+
+
+def _mpl_quality_apply(quality: str) -> None:
+    """Configure how text on matplotlib graphs is typeset.
+
+    - ``fast`` - Use matplotlib's built-in mathtext with a LaTeX-like font. No
+      external processes are spawned.
+
+    - ``publication`` - Use LaTeX, so that math renders exactly as it does in
+      papers. Typeset strings are cached under
+      :data:`~sierra.core.config.CACHE_ROOT`, so each distinct label is only
+      typeset once across all workers and batches.
+    """
+    import matplotlib as mpl  # noqa: PLC0415
+
+    if quality == "fast":
+        mpl.rcParams["text.usetex"] = False
+        mpl.rcParams["mathtext.fontset"] = "cm"
+        return
+
+    from matplotlib import texmanager  # noqa: PLC0415
+
+    mpl.rcParams["text.usetex"] = True
+
+    # By default the tex cache lives in matplotlib's cache dir, which falls back
+    # to a fresh temporary directory in every process if it isn't writable
+    # (common on HPC systems).
+    cache_dir = config.CACHE_ROOT / "tex"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    texmanager.TexManager._cache_dir = cache_dir
+
+
+def hv_ssl_init() -> None:
+    """Initialize SSL properly to ensure fork()ing works.
+
+    This should NOT be necessary, but it is until holoviews/other packages fix
+    this.
+
+    2025-11-24 [JRH]: This is ABSOLUTELY CRUCIAL to avoid SSL related errors in
+    the tornado package which hv uses.  By forcing initialization of SSL in the
+    main process before any forking happens, we (apparently) avoid memory
+    corruption which can happen otherwise.
+    """
+
+    # Disable SSL verification globally before any forks
+    os.environ["PYTHONHTTPSVERIFY"] = "0"
+    os.environ["SSL_CERT_FILE"] = certifi.where()
+
+    # Create SSL context in parent to "warm it up"
+    with contextlib.suppress(BaseException):
+        ssl.create_default_context()
+
+    # Override default context creator
+    ssl._create_default_https_context = ssl._create_unverified_context
+
+    # Pre-import tornado to initialize its SSL before fork
+    with contextlib.suppress(BaseException):
+        import tornado.netutil  # noqa: PLC0415
+
+
+__all__ = [
+    "bokeh_init",
+    "hv_ssl_init",
+    "initialize",
+    "mpl_init",
+    "mpl_quality_init",
+]
@@ -0,0 +1,161 @@
+#
+# Copyright 2026 John Harwell, All rights reserved.
+#
+# SPDX-License-Identifier: MIT
+#
+"""
+Shape-preserving decimation of long time series before plotting.
+
+Two methods are supported:
+
+- ``lttb`` - Largest-Triangle-Three-Buckets. Keeps the point in each bucket
+  which forms the largest triangle with the previously kept point and the
+  average of the next bucket. Visually the closest to the original for smooth
+  series.
+
+- ``minmax`` - Keeps the min and max of each bucket, so spikes and the full
+  envelope of noisy series are always retained.
+
+Selection is done on row indices rather than values, so the same rows can be
+taken from every dataframe which goes with a graph (``.stddev``, ``.model``,
+etc.) and everything on the graph stays aligned.
+"""
+
+# Core packages
+import typing as tp
+
+# 3rd party packages
+import numpy as np
+import polars as pl
+
+# Project packages
+
+METHODS = ["lttb", "minmax"]
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Select ``n_out`` row indices from a series using LTTB.
+
+    The first and last points are always kept. If the series is not longer than
+    ``n_out``, all indices are returned.
+    """
+    n = len(y)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+
+    x = x.astype(np.float64)
+    y = y.astype(np.float64)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    a = 0
+
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+
+        # Average of the next bucket (just the last point for the last bucket)
+        nlo, nhi = hi, edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[nlo:nhi].mean()
+        avg_y = np.nanmean(y[nlo:nhi]) if np.any(~np.isnan(y[nlo:nhi])) else y[a]
+
+        areas = np.abs(
+            (x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a])
+        )
+        areas[np.isnan(areas)] = -1.0
+
+        a = lo + int(np.argmax(areas))
+        selected[i + 1] = a
+
+    return selected
+
+
+def minmax_indices(y: np.ndarray, n_out: int) -> np.ndarray:
+    """Select ~``n_out`` row indices from a series using min/max bucketing.
+
+    The series is split into ``n_out // 2`` buckets and the rows holding the min
+    and max of each bucket are kept, along with the first and last points. If
+    the series is not longer than ``n_out``, all indices are returned.
+    """
+    n = len(y)
+    n_buckets = n_out // 2
+    if n <= n_out or n_buckets < 1:
+        return np.arange(n)
+
+    y = y.astype(np.float64)
+    edges = np.linspace(0, n, n_buckets + 1).astype(np.int64)
+    selected = [np.array([0, n - 1])]
+
+    for lo, hi in zip(edges[:-1], edges[1:]):
+        bucket = y[lo:hi]
+        if np.all(np.isnan(bucket)):
+            continue
+        selected.append(lo + np.array([np.nanargmin(bucket), np.nanargmax(bucket)]))
+
+    return np.unique(np.concatenate(selected))
+
+
+def rows_select(
+    df: pl.DataFrame,
+    cols: list[str],
+    max_points: int,
+    method: str = "lttb",
+    xcol: tp.Optional[str] = None,
+) -> tp.Optional[np.ndarray]:
+    """Compute the rows of ``df`` to keep so no more than ~``max_points`` remain.
+
+    Rows are selected from each column in ``cols`` independently with an equal
+    share of ``max_points``, and the union is returned sorted, so the features
+    of every plotted series are retained. Returns None if ``df`` is already
+    small enough.
+
+    Args:
+        df: The data to be plotted.
+
+        cols: The columns which will be plotted.
+
+        max_points: The target # of rows.
+
+        method: One of :data:`METHODS`.
+
+        xcol: The column containing the X values; row index if omitted.
+    """
+    if len(df) <= max_points or not cols:
+        return None
+
+    assert method in METHODS, f"Bad downsampling method '{method}'"
+
+    budget = max(max_points // len(cols), 3)
+    x = df[xcol].to_numpy() if xcol else np.arange(len(df))
+
+    selected = [
+        (
+            lttb_indices(x, df[c].to_numpy(), budget)
+            if method == "lttb"
+            else minmax_indices(df[c].to_numpy(), budget)
+        )
+        for c in cols
+    ]
+    return np.unique(np.concatenate(selected))
+
+
+def rows_take(df: pl.DataFrame, rows: tp.Optional[np.ndarray]) -> pl.DataFrame:
+    """Take the rows selected by :func:`rows_select` from a dataframe.
+
+    Rows past the end of ``df`` are ignored, so dataframes which are shorter
+    than the one the rows were selected from (e.g., models) can be used.
+    """
+    if rows is None:
+        return df
+
+    return df[rows[rows < len(df)]]
+
+
+__all__ = [
+    "METHODS",
+    "lttb_indices",
+    "minmax_indices",
+    "rows_select",
+    "rows_take",
+]
@@ -14,14 +14,13 @@ import pathlib
 
 # 3rd party packages
 import numpy as np
-import matplotlib.pyplot as plt
 import holoviews as hv
 import bokeh
 import polars as pl
 
 # Project packages
-from sierra.core import utils, config, storage, types
-from . import pathset as _pathset
+from sierra.core import utils, config, storage, types, statistics, profiling
+from . import pathset as _pathset, mplrender
 
 _logger = logging.getLogger(__name__)
 
@@ -39,10 +38,14 @@ def generate_confusion(  # noqa: PLR0913
     large_text: bool = False,
 ) -> bool:
     """
-    Generate a confusion matrix from a ``.mean`` file.
+    Generate a confusion matrix from a ``.counts`` or ``.mean`` file.
 
-    If the necessary ``.mean`` file does not exist, the graph is not generated.
-    Dataframe must be constructed with {truth,predicted} columns; e.g.::
+    ``.counts`` files contain the exact # of times each ``<truth, predicted>``
+    pair occurred across all runs, and are written during stage 3 by
+    :mod:`~sierra.plugins.proc.statistics`; if one exists it is used as-is.
+    Otherwise, pairs are counted from the ``.mean`` file. If neither exists, the
+    graph is not generated. Dataframes must be constructed with
+    {truth,predicted} columns; e.g.::
 
         truth,predicted
         a,a
@@ -53,12 +56,23 @@ def generate_confusion(  # noqa: PLR0913
         e,e
         ...
     """
-    hv.extension(backend, inline=False, logo=False)
-
     ofile_ext = _ofile_ext(backend)
+    counts_fpath = pathset.input_root / (input_stem + config.CONFUSION_COUNTS_EXT)
     input_fpath = pathset.input_root / (input_stem + config.STATS["mean"].exts["mean"])
     output_fpath = pathset.output_root / f"CM-{output_stem}.{ofile_ext}"
-    if not utils.path_exists(input_fpath):
+
+    if utils.path_exists(counts_fpath):
+        counts = statistics.confusion_counts(
+            [storage.df_read(counts_fpath, medium)],
+            truth_col,
+            predicted_col,
+            count_col="count",
+        )
+    elif utils.path_exists(input_fpath):
+        counts = statistics.confusion_counts(
+            [storage.df_read(input_fpath, medium)], truth_col, predicted_col
+        )
+    else:
         _logger.debug(
             "Not generating <batchroot>/%s: <batchroot>/%s does not exist",
             output_fpath.relative_to(pathset.batchroot.resolve()),
@@ -74,48 +88,39 @@ def generate_confusion(  # noqa: PLR0913
         else config.GRAPHS["text_size_small"]
     )
 
-    # Read .csv and get counts of each <truth, predicted> pair.
-    df = storage.df_read(input_fpath, medium)
+    # Counts are for every <truth, predicted> pair, sorted, so they are the
+    # rows of the matrix laid end to end. Normalize by row to get fractions
+    # rather than counts.
+    categories = counts[truth_col].unique(maintain_order=True).to_list()
+    grid = counts["count"].to_numpy().reshape(len(categories), len(categories))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        fractions = grid / grid.sum(axis=1, keepdims=True)
 
-    # Group by truth and predicted columns and count occurrences
-    confusion_df = df.group_by([truth_col, predicted_col]).agg(pl.len().alias("count"))
-
-    # Get category names. Need union in case the sets aren't the same.
-    categories = sorted(
-        set(df[truth_col].unique().to_list())
-        | set(df[predicted_col].unique().to_list())
-    )
-
-    # Create all combinations of categories
-    all_combinations = pl.DataFrame(
-        {
-            truth_col: [t for t in categories for _ in categories],
-            predicted_col: [p for _ in categories for p in categories],
-        }
+    confusion_df = counts.with_columns(
+        pl.Series("fraction", fractions.reshape(-1), dtype=pl.Float64)
     )
 
-    # Merge with actual data, filling missing combinations with 0
-    confusion_df = all_combinations.join(
-        confusion_df, on=[truth_col, predicted_col], how="left"
-    )
-
-    # Fill null counts with 0
-    confusion_df = confusion_df.with_columns(pl.col("count").fill_null(0))
-
-    # Normalize by row to get fractions rather than counts
-    # Calculate sum for each truth value
-    row_totals = confusion_df.group_by(truth_col).agg(
-        pl.col("count").sum().alias("row_total")
-    )
+    if backend == "matplotlib":
+        _render_confusion_mpl(
+            output_fpath,
+            confusion_df,
+            categories=categories,
+            truth_col=truth_col,
+            predicted_col=predicted_col,
+            title=title,
+            xlabels_rotate=xlabels_rotate,
+            large_text=large_text,
+        )
+        _logger.debug(
+            "Graph written to <batchroot>/%s",
+            output_fpath.relative_to(pathset.batchroot),
+        )
+        return True
 
-    # Join back and calculate fractions
-    confusion_df = confusion_df.join(row_totals, on=truth_col)
-    confusion_df = confusion_df.with_columns(
-        (pl.col("count") / pl.col("row_total")).alias("fraction")
-    )
+    if backend != "bokeh":
+        raise ValueError(f"Bad value for backend: {backend}")
 
-    # Drop the row_total column
-    confusion_df = confusion_df.drop("row_total")
+    hv.extension(backend, inline=False, logo=False)
 
     # Convert to pandas for holoviews
     confusion_pd = confusion_df.to_pandas()
@@ -124,18 +129,12 @@ def generate_confusion(  # noqa: PLR0913
     )
 
     # Finally, plot the data!
-    if backend == "matplotlib":
-        plot = hv.HeatMap(dataset).opts(show_values=True, alpha=0.65, cmap="RdYlGn")
-
-    elif backend == "bokeh":
-        plot = hv.HeatMap(dataset).opts(
-            colorbar=True,
-            tools=["hover"],
-            alpha=0.65,
-            cmap="RdYlGn",
-        )
-    else:
-        raise ValueError(f"Bad value for backend: {backend}")
+    plot = hv.HeatMap(dataset).opts(
+        colorbar=True,
+        tools=["hover"],
+        alpha=0.65,
+        cmap="RdYlGn",
+    )
 
     # Add labels
     plot.opts(xlabel="Predicted Label")
@@ -149,18 +148,13 @@ def generate_confusion(  # noqa: PLR0913
             "ticks": text_size["tick_label"],
         }
     )
-    if backend == "matplotlib":
-        # Add colorbar.
-        # 2025-07-08 [JRH]: backend_opts is a mpl-specific Workaround; doing
-        # colorbar_opts={"label": ...} doesn't work for unknown reasons.
-        plot.opts(colorbar=True, backend_opts={"colorbar.label": ""})
 
     # Add title
     plot.opts(title=title)
     if xlabels_rotate:
         plot.opts(xrotation=90)
 
-    _save(plot, output_fpath, backend)
+    _save(plot, output_fpath)
 
     _logger.debug(
         "Graph written to <batchroot>/%s",
@@ -207,8 +201,6 @@ def generate_numeric(  # noqa: PLR0913
     in that cell. The names of these columns are configurable.
 
     """
-    hv.extension(backend, inline=False, logo=False)
-
     ofile_ext = _ofile_ext(backend)
     input_fpath = pathset.input_root / (input_stem + ext)
     output_fpath = pathset.output_root / f"HM-{output_stem}.{ofile_ext}"
@@ -231,6 +223,33 @@ def generate_numeric(  # noqa: PLR0913
     # Read .csv and create raw heatmap from default configuration
     df = storage.df_read(input_fpath, medium)
 
+    if backend == "matplotlib":
+        _render_numeric_mpl(
+            output_fpath,
+            df,
+            colnames,
+            title=title,
+            xlabel=xlabel,
+            ylabel=ylabel,
+            zlabel=zlabel,
+            xticklabels=xticklabels,
+            yticklabels=yticklabels,
+            xticks=xticks,
+            yticks=yticks,
+            transpose=transpose,
+            large_text=large_text,
+        )
+        _logger.debug(
+            "Graph written to <batchroot>/%s",
+            output_fpath.relative_to(pathset.batchroot),
+        )
+        return True
+
+    if backend != "bokeh":
+        raise ValueError(f"Bad value for backend: {backend}")
+
+    hv.extension(backend, inline=False, logo=False)
+
     # Convert to pandas for holoviews
     df_pd = df.to_pandas()
     dataset = hv.Dataset(df_pd, kdims=[colnames[0], colnames[1]], vdims=colnames[2])
@@ -239,19 +258,7 @@ def generate_numeric(  # noqa: PLR0913
     if transpose:
         dataset.data = dataset.data.transpose()
 
-    # Plot heatmap, without showing the Z-value in each cell, which generally
-    # obscures things more than it helps. Plus, statistical significance isn't
-    # observable from a heatmap, so numerical values are kind of moot.
-    if backend == "matplotlib":
-        plot = hv.HeatMap(
-            dataset, kdims=[colnames[0], colnames[1]], vdims=[colnames[2]]
-        ).opts(show_values=False)
-    elif backend == "bokeh":
-        plot = hv.HeatMap(
-            dataset, kdims=[colnames[0], colnames[1]], vdims=[colnames[2]]
-        )
-    else:
-        raise ValueError(f"Bad value for backend: {backend}")
+    plot = hv.HeatMap(dataset, kdims=[colnames[0], colnames[1]], vdims=[colnames[2]])
 
     if not xticks:
         xticks = dataset.data[colnames[0]]
@@ -279,13 +286,7 @@ def generate_numeric(  # noqa: PLR0913
     # Add title
     plot.opts(title=title)
 
-    if backend == "matplotlib":
-        # Add colorbar.
-        # 2025-07-08 [JRH]: backend_opts is a mpl-specific Workaround; doing
-        # colorbar_opts={"label": ...} doesn't work for unknown reasons.
-        plot.opts(colorbar=True, backend_opts={"colorbar.label": zlabel})
-
-    _save(plot, output_fpath, backend)
+    _save(plot, output_fpath)
 
     _logger.debug(
         "Graph written to <batchroot>/%s",
@@ -318,8 +319,6 @@ def generate_dual_numeric(  # noqa: PLR0913
     If there are not exactly two file paths passed, the graph is not generated.
 
     """
-    hv.extension("matplotlib", inline=False, logo=False)
-
     output_fpath = (
         pathset.output_root / f"HM-{output_stem}.{config.GRAPHS['static_type']}"
     )
@@ -339,62 +338,149 @@ def generate_dual_numeric(  # noqa: PLR0913
         )
         return False
 
-    # Convert polars DataFrames to pandas for holoviews
-    dfs_pd = [df.to_pandas() for df in dfs]
+    fig = mplrender.figure(ncols=2)
+    axes = fig.subplots(1, 2)
 
-    yticks = np.arange(len(dfs_pd[0].columns))
-    xticks = dfs_pd[0].index
+    for ax, df in zip(axes, dfs):
+        # Rows are X, columns are Y
+        im = ax.imshow(df.to_numpy().T, origin="lower", aspect="auto")
+        cbar = fig.colorbar(im, ax=ax)
+        if zlabel:
+            cbar.set_label(zlabel, fontsize=text_size["xyz_label"])
 
-    # Plot heatmaps
-    plot = hv.Image(dfs_pd[0]) + hv.Image(dfs_pd[1])
+        # Add X,Y ticks
+        if xticklabels:
+            ax.set_xticks(np.arange(len(df)), xticklabels)
+        if yticklabels:
+            ax.set_yticks(np.arange(len(df.columns)), yticklabels)
 
-    # Add X,Y ticks
-    if xticklabels:
-        plot.opts(xformatter=lambda x: xticklabels[list(xticks).index(x)])
-    if yticklabels:
-        plot.opts(yformatter=lambda y: yticklabels[list(yticks).index(y)])
+        mplrender.decorate(ax, text_size, None, xlabel, ylabel)
 
-    # Add labels
-    plot.opts(xlabel=xlabel)
-    plot.opts(ylabel=ylabel)
+    fig.suptitle(title, fontsize=text_size["title"])
+    mplrender.save(fig, output_fpath)
 
-    # Set fontsizes
-    plot.opts(
-        fontsize={
-            "title": text_size["title"],
-            "labels": text_size["xyz_label"],
-            "ticks": text_size["tick_label"],
-        }
+    _logger.debug(
+        "Graph written to <batchroot>/%s",
+        output_fpath.relative_to(pathset.batchroot),
     )
-    # Add title
-    plot.opts(title=title)
+    return True
 
-    # Add colorbar.
-    plot.opts(
-        hv.opts.Layout(shared_axes=False),
-        hv.opts.Image(
-            colorbar=True,
-            colorbar_position="right",
-            backend_opts={"colorbar.label": zlabel},
-        ),
-    )
 
-    # Output figures
-    plot.opts(fig_inches=config.GRAPHS["base_size"])
+def generate_sequence(  # noqa: PLR0913
+    pathset: _pathset.PathSet,
+    input_stems: list[str],
+    *,
+    medium: str,
+    title: str,
+    colnames: tuple[str, str, str] = ("x", "y", "z"),
+    xlabel: tp.Optional[str] = "",
+    ylabel: tp.Optional[str] = "",
+    zlabel: tp.Optional[str] = "",
+    large_text: bool = False,
+    ext=config.STATS["mean"].exts["mean"],
+    video_fpath: tp.Optional[pathlib.Path] = None,
+    ffmpeg_opts: str = "",
+    write_frames: bool = True,
+) -> int:
+    """
+    Generate a sequence of X vs. Y vs. Z heatmaps, one per input frame.
+
+    Each frame has the same format as for :func:`generate_numeric`, and the
+    frames are expected to share the same X,Y grid. All frames are drawn on the
+    same figure, with the same color limits (computed across all frames), so
+    that videos rendered from them don't flicker. Only the image data is updated
+    and redrawn between frames (see :class:`.mplrender.FrameSequence`).
+
+    Frames are rendered in the order given; output images are named
+    ``HM-<input stem>``. If ``video_fpath`` is passed, frames are also piped
+    straight into :program:`ffmpeg` to create a video (see
+    :class:`.mplrender.VideoStream`); writing the images themselves can then be
+    disabled with ``write_frames=False``. Returns the # of frames rendered.
+    """
+    input_fpaths = [pathset.input_root / (stem + ext) for stem in input_stems]
+    input_fpaths = [f for f in input_fpaths if utils.path_exists(f)]
+    if not input_fpaths:
+        _logger.debug(
+            "Not generating heatmap sequence: no inputs in <batchroot>/%s",
+            pathset.input_root.relative_to(pathset.batchroot.resolve()),
+        )
+        return 0
 
-    hv.save(
-        plot,
-        output_fpath,
-        fig=config.GRAPHS["static_type"],
-        dpi=config.GRAPHS["dpi"],
+    title = "\n".join(textwrap.wrap(title, 40))
+    text_size = mplrender.text_sizes(large_text)
+
+    # Pass 1: global color limits
+    vmin, vmax = _zlims_calc(input_fpaths, medium, colnames[2])
+
+    # Pass 2: render. The first frame fixes the grid axes.
+    df = storage.df_read(input_fpaths[0], medium)
+    xs, ys, grid = grid_from_df(df, colnames)
+
+    fig = mplrender.figure()
+    ax = fig.add_subplot()
+    im = ax.imshow(
+        grid,
+        origin="lower",
+        aspect="auto",
+        interpolation="nearest",
+        vmin=vmin,
+        vmax=vmax,
     )
-    plt.close("all")
+    _set_ticks(ax.set_xticks, xs, None, None)
+    _set_ticks(ax.set_yticks, ys, None, None)
+
+    cbar = fig.colorbar(im, ax=ax)
+    if zlabel:
+        cbar.set_label(zlabel, fontsize=text_size["xyz_label"])
+    cbar.ax.tick_params(labelsize=text_size["tick_label"])
+    mplrender.decorate(ax, text_size, title, xlabel, ylabel)
+
+    frames = mplrender.FrameSequence(fig, [im])
+    video = None
+    if video_fpath is not None:
+        utils.dir_create_checked(video_fpath.parent, exist_ok=True)
+        video = mplrender.VideoStream(video_fpath, ffmpeg_opts)
+
+    ofile_ext = config.GRAPHS["static_type"]
+    for i, fpath in enumerate(input_fpaths):
+        if i > 0:
+            df = storage.df_read(fpath, medium)
+            _, _, grid = grid_from_df(df, colnames, xs, ys)
+            im.set_data(grid)
+
+        frame = frames.frame()
+        if write_frames:
+            frames.save(pathset.output_root / f"HM-{fpath.stem}.{ofile_ext}", frame)
+        if video is not None:
+            video.write(frame)
+
+    fig.clear()
+
+    if write_frames:
+        _logger.debug(
+            "%s graphs written to <batchroot>/%s",
+            len(input_fpaths),
+            pathset.output_root.relative_to(pathset.batchroot),
+        )
 
-    _logger.debug(
-        "Graph written to <batchroot>/%s",
-        output_fpath.relative_to(pathset.batchroot),
-    )
-    return True
+    if video is not None and video.close():
+        _logger.debug(
+            "Video with %s frames written to %s", len(input_fpaths), video_fpath
+        )
+
+    return len(input_fpaths)
+
+
+def _zlims_calc(
+    input_fpaths: list[pathlib.Path], medium: str, zcol: str
+) -> tuple[float, float]:
+    vmin, vmax = np.inf, -np.inf
+    for fpath in input_fpaths:
+        z = storage.df_read(fpath, medium)[zcol]
+        vmin = min(vmin, z.min())
+        vmax = max(vmax, z.max())
+
+    return vmin, vmax
 
 
 def _ofile_ext(backend: str) -> tp.Optional[str]:
@@ -407,17 +493,8 @@ def _ofile_ext(backend: str) -> tp.Optional[str]:
     return None
 
 
-def _save(plot: hv.Overlay, output_fpath: pathlib.Path, backend: str) -> None:
-    if backend == "matplotlib":
-        hv.save(
-            plot.opts(fig_inches=config.GRAPHS["base_size"]),
-            output_fpath,
-            fig=config.GRAPHS["static_type"],
-            dpi=config.GRAPHS["dpi"],
-        )
-        plt.close("all")
-
-    elif backend == "bokeh":
+def _save(plot: hv.Overlay, output_fpath: pathlib.Path) -> None:
+    with profiling.span("render", path=output_fpath.name):
         fig = hv.render(plot)
 
         # 2025-12-02 [JRH]: We don't set dimensions, because that makes the
@@ -430,4 +507,140 @@ def _save(plot: hv.Overlay, output_fpath: pathlib.Path, backend: str) -> None:
             f.write(html)
 
 
-__all__ = ["generate_confusion", "generate_dual_numeric", "generate_numeric"]
+def grid_from_df(
+    df: pl.DataFrame,
+    colnames: tuple[str, str, str],
+    xs: tp.Optional[np.ndarray] = None,
+    ys: tp.Optional[np.ndarray] = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Convert an {x,y,z} dataframe into a 2D grid of Z values.
+
+    Returns the sorted unique X values, the sorted unique Y values, and the
+    grid, indexed as ``[y, x]``. Cells without a value are NaN. If ``xs`` and
+    ``ys`` are passed, they are used as the grid axes instead of the values in
+    the dataframe, so that a sequence of frames all map onto the same grid.
+    """
+    x = df[colnames[0]].to_numpy()
+    y = df[colnames[1]].to_numpy()
+    xs = np.unique(x) if xs is None else xs
+    ys = np.unique(y) if ys is None else ys
+
+    grid = np.full((len(ys), len(xs)), np.nan)
+    grid[np.searchsorted(ys, y), np.searchsorted(xs, x)] = df[colnames[2]].to_numpy()
+
+    return xs, ys, grid
+
+
+def _render_numeric_mpl(  # noqa: PLR0913
+    output_fpath: pathlib.Path,
+    df: pl.DataFrame,
+    colnames: tuple[str, str, str],
+    *,
+    title: str,
+    xlabel: tp.Optional[str],
+    ylabel: tp.Optional[str],
+    zlabel: tp.Optional[str],
+    xticklabels: tp.Optional[list[str]],
+    yticklabels: tp.Optional[list[str]],
+    xticks: tp.Optional[list[float]],
+    yticks: tp.Optional[list[float]],
+    transpose: bool,
+    large_text: bool,
+) -> None:
+    text_size = mplrender.text_sizes(large_text)
+    xs, ys, grid = grid_from_df(df, colnames)
+
+    if transpose:
+        xs, ys, grid = ys, xs, grid.T
+
+    fig = mplrender.figure()
+    ax = fig.add_subplot()
+
+    # Plot heatmap, without showing the Z-value in each cell, which generally
+    # obscures things more than it helps. Plus, statistical significance isn't
+    # observable from a heatmap, so numerical values are kind of moot.
+    im = ax.imshow(grid, origin="lower", aspect="auto", interpolation="nearest")
+
+    # Cells are placed at their index, so ticks are the index of the X/Y value
+    # in the grid.
+    _set_ticks(ax.set_xticks, xs, xticks, xticklabels)
+    _set_ticks(ax.set_yticks, ys, yticks, yticklabels)
+
+    cbar = fig.colorbar(im, ax=ax)
+    if zlabel:
+        cbar.set_label(zlabel, fontsize=text_size["xyz_label"])
+    cbar.ax.tick_params(labelsize=text_size["tick_label"])
+
+    mplrender.decorate(ax, text_size, title, xlabel, ylabel)
+    mplrender.save(fig, output_fpath)
+
+
+def _set_ticks(
+    setter: tp.Callable,
+    values: np.ndarray,
+    ticks: tp.Optional[list[float]],
+    labels: tp.Optional[list[str]],
+) -> None:
+    if labels:
+        positions = (
+            np.searchsorted(values, ticks) if ticks else np.arange(len(labels))
+        )
+        setter(positions, labels)
+    elif len(values) <= 50:
+        setter(np.arange(len(values)), [f"{v:g}" for v in values])
+
+
+def _render_confusion_mpl(  # noqa: PLR0913
+    output_fpath: pathlib.Path,
+    confusion_df: pl.DataFrame,
+    *,
+    categories: list,
+    truth_col: str,
+    predicted_col: str,
+    title: str,
+    xlabels_rotate: bool,
+    large_text: bool,
+) -> None:
+    text_size = mplrender.text_sizes(large_text)
+
+    # Rows are truth, columns are predicted
+    ordered = confusion_df.sort([truth_col, predicted_col])
+    grid = (
+        ordered["fraction"].fill_nan(0.0).to_numpy().reshape(len(categories), -1)
+    )
+
+    fig = mplrender.figure()
+    ax = fig.add_subplot()
+    im = ax.imshow(
+        grid, origin="lower", aspect="auto", alpha=0.65, cmap="RdYlGn", vmin=0, vmax=1
+    )
+
+    for i in range(len(categories)):
+        for j in range(len(categories)):
+            ax.text(
+                j,
+                i,
+                f"{grid[i, j]:.2f}",
+                ha="center",
+                va="center",
+                fontsize=text_size["tick_label"],
+            )
+
+    labels = [str(c) for c in categories]
+    ax.set_xticks(
+        np.arange(len(categories)), labels, rotation=90 if xlabels_rotate else 0
+    )
+    ax.set_yticks(np.arange(len(categories)), labels)
+    fig.colorbar(im, ax=ax)
+
+    mplrender.decorate(ax, text_size, title, "Predicted Label", "True Label")
+    mplrender.save(fig, output_fpath)
+
+
+__all__ = [
+    "generate_confusion",
+    "generate_dual_numeric",
+    "generate_numeric",
+    "generate_sequence",
+    "grid_from_df",
+]
@@ -0,0 +1,277 @@
+#
+# Copyright 2026 John Harwell, All rights reserved.
+#
+# SPDX-License-Identifier: MIT
+#
+"""
+Direct matplotlib rendering for static (``matplotlib`` backend) graphs.
+
+Static graphs are drawn straight onto an Agg canvas from NumPy buffers, rather
+than going through holoviews, which is only used for interactive (``bokeh``)
+graphs. Figures are not registered with pyplot, so nothing accumulates in the
+pyplot figure manager between graphs, and the same figure object is reused
+for every graph generated in a given process.
+"""
+
+# Core packages
+import typing as tp
+import pathlib
+import logging
+import subprocess
+
+# 3rd party packages
+import numpy as np
+import matplotlib.image
+from matplotlib.artist import Artist
+from matplotlib.figure import Figure
+from matplotlib.axes import Axes
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+# Project packages
+from sierra.core import config, profiling
+from . import backends
+
+_logger = logging.getLogger(__name__)
+
+# All graph modules draw through this one, so this covers them being imported
+# directly rather than through sierra.core.graphs.
+backends.initialize()
+
+# Reusable figures, keyed by # of side-by-side plots
+_FIGURES = {}  # type: dict[int, Figure]
+
+
+def figure(ncols: int = 1) -> Figure:
+    """Get a blank figure to draw on, sized for ``ncols`` side-by-side plots.
+
+    The returned figure is shared by all graphs with the same layout in the
+    current process, so it must be passed to :func:`save` before the next call.
+    """
+    if ncols not in _FIGURES:
+        size = config.GRAPHS["base_size"]
+        fig = Figure(figsize=(size * ncols, size), dpi=config.GRAPHS["dpi"])
+        FigureCanvasAgg(fig)
+        _FIGURES[ncols] = fig
+
+    fig = _FIGURES[ncols]
+    fig.clear()
+    return fig
+
+
+def text_sizes(large_text: bool) -> dict[str, int]:
+    return (
+        config.GRAPHS["text_size_large"]
+        if large_text
+        else config.GRAPHS["text_size_small"]
+    )
+
+
+def decorate(
+    ax: Axes,
+    text_size: dict[str, int],
+    title: tp.Optional[str] = None,
+    xlabel: tp.Optional[str] = None,
+    ylabel: tp.Optional[str] = None,
+) -> None:
+    """Set the title, axis labels, and font sizes for a plot."""
+    if title:
+        ax.set_title(title, fontsize=text_size["title"])
+    if xlabel:
+        ax.set_xlabel(xlabel, fontsize=text_size["xyz_label"])
+    if ylabel:
+        ax.set_ylabel(ylabel, fontsize=text_size["xyz_label"])
+
+    ax.tick_params(axis="both", which="both", labelsize=text_size["tick_label"])
+
+
+def legend(ax: Axes, text_size: dict[str, int]) -> None:
+    """Add a legend below the plot, if anything on it is labeled."""
+    handles, labels = ax.get_legend_handles_labels()
+    labeled = [(h, lab) for h, lab in zip(handles, labels) if lab and lab[0] != "_"]
+    if not labeled:
+        return
+
+    ax.legend(
+        *zip(*labeled),
+        loc="upper center",
+        bbox_to_anchor=(0.5, -0.1),
+        ncol=min(len(labeled), 3),
+        fontsize=text_size["legend_label"],
+    )
+
+
+def save(fig: Figure, output_fpath: pathlib.Path) -> None:
+    # Drawing happens lazily in savefig(), so this is where nearly all of the
+    # rendering time goes.
+    with profiling.span("render", path=output_fpath.name):
+        fig.savefig(
+            output_fpath,
+            format=config.GRAPHS["static_type"],
+            dpi=config.GRAPHS["dpi"],
+            bbox_inches="tight",
+        )
+    fig.clear()
+
+
+class FrameSequence:
+    """Render a sequence of frames in which only a few artists change.
+
+    Everything else in the figure (axes, ticks, colorbars, titles, etc.) is
+    drawn once; for each frame only the changed artists are redrawn on top of a
+    saved copy of the background, and the canvas buffer is written out
+    directly. Frames are cropped to the tight bounding box of the figure as
+    computed for the first frame, so all frames have the same size.
+
+    Attributes:
+        fig: The figure to render from.
+
+        artists: The artists which change between frames.
+    """
+
+    def __init__(self, fig: Figure, artists: list[Artist]) -> None:
+        self.fig = fig
+        self.artists = artists
+
+        for a in artists:
+            a.set_animated(True)
+
+        canvas = fig.canvas
+        canvas.draw()
+        self._background = canvas.copy_from_bbox(fig.bbox)
+
+        # Crop box, in pixels from the top-left of the canvas buffer.
+        renderer = canvas.get_renderer()
+        dpi = fig.dpi
+        pad = 0.1
+        tight = fig.get_tightbbox(renderer).padded(pad)
+        height = fig.bbox.height
+        self._rows = slice(
+            max(int(height - tight.y1 * dpi), 0), int(height - tight.y0 * dpi)
+        )
+        self._cols = slice(max(int(tight.x0 * dpi), 0), int(tight.x1 * dpi))
+
+    def frame(self) -> np.ndarray:
+        """Render the current state of the artists to an RGBA array."""
+        canvas = self.fig.canvas
+        canvas.restore_region(self._background)
+        for a in self.artists:
+            self.fig.draw_artist(a)
+
+        return np.asarray(canvas.buffer_rgba())[self._rows, self._cols]
+
+    def save(
+        self, output_fpath: pathlib.Path, frame: tp.Optional[np.ndarray] = None
+    ) -> None:
+        """Write a frame to disk; the current frame is rendered if not passed."""
+        matplotlib.image.imsave(
+            output_fpath,
+            self.frame() if frame is None else frame,
+            format=config.GRAPHS["static_type"],
+            dpi=config.GRAPHS["dpi"],
+        )
+
+
+def ffmpeg_rawvideo_cmd(
+    output_fpath: pathlib.Path, width: int, height: int, ffmpeg_opts: str
+) -> list[str]:
+    """Get the :program:`ffmpeg` cmd to encode raw RGB frames read from stdin.
+
+    ``ffmpeg_opts`` appear between the input and output specifications, just as
+    for ``--render-cmd-opts``.
+    """
+    return [
+        "ffmpeg",
+        "-y",
+        "-loglevel",
+        "error",
+        "-nostats",
+        "-f",
+        "rawvideo",
+        "-pix_fmt",
+        "rgb24",
+        "-s",
+        f"{width}x{height}",
+        "-i",
+        "-",
+        *ffmpeg_opts.split(),
+        str(output_fpath),
+    ]
+
+
+class VideoStream:
+    """Encode frames into a video by piping them straight into :program:`ffmpeg`.
+
+    Frames are written as raw RGB buffers, so no intermediate images are
+    written to (or read back from) disk. :program:`ffmpeg` is started when the
+    first frame arrives, because the frame size isn't known until then.
+
+    Attributes:
+        output_fpath: The video to create.
+
+        ffmpeg_opts: :program:`ffmpeg` options to appear between the input and
+                     output specifications.
+    """
+
+    def __init__(self, output_fpath: pathlib.Path, ffmpeg_opts: str) -> None:
+        self.output_fpath = output_fpath
+        self.ffmpeg_opts = ffmpeg_opts
+        self.n_frames = 0
+        self._proc = None  # type: tp.Optional[subprocess.Popen]
+
+    def __enter__(self) -> "VideoStream":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def write(self, frame: np.ndarray) -> None:
+        """Append an RGB(A) frame to the video; alpha is dropped."""
+        if self._proc is None:
+            cmd = ffmpeg_rawvideo_cmd(
+                self.output_fpath, frame.shape[1], frame.shape[0], self.ffmpeg_opts
+            )
+            _logger.trace("Run cmd: %s", " ".join(cmd))
+            self._proc = subprocess.Popen(
+                cmd,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+            )
+
+        assert self._proc.stdin is not None
+        self._proc.stdin.write(np.ascontiguousarray(frame[..., :3]).tobytes())
+        self.n_frames += 1
+
+    def close(self) -> bool:
+        """Finish encoding; returns True if the video was written successfully."""
+        if self._proc is None:
+            return False
+
+        # We use communicate(), not wait() to avoid issues with IO buffers
+        # becoming full.
+        _, stderr_raw = self._proc.communicate()
+        proc = self._proc
+        self._proc = None
+
+        if proc.returncode != 0:
+            _logger.error(
+                "Encoding %s failed: return code=%d, stderr: %s",
+                self.output_fpath,
+                proc.returncode,
+                stderr_raw.decode("ascii", errors="replace"),
+            )
+            return False
+
+        return True
+
+
+__all__ = [
+    "FrameSequence",
+    "VideoStream",
+    "decorate",
+    "ffmpeg_rawvideo_cmd",
+    "figure",
+    "legend",
+    "save",
+    "text_sizes",
+]
@@ -7,6 +7,7 @@
 YAML schemas for graphs.
 """
 # Core packages
+import typing as tp
 
 # 3rd party packages
 import strictyaml
@@ -50,6 +51,8 @@ stacked_line = strictyaml.Map(
         strictyaml.Optional("points"): strictyaml.Bool(),
         strictyaml.Optional("logy"): strictyaml.Bool(),
         strictyaml.Optional("backend"): strictyaml.Str(),
+        strictyaml.Optional("max_points"): strictyaml.Int(),
+        strictyaml.Optional("downsample"): strictyaml.Str(),
     }
 )
 """
@@ -93,3 +96,38 @@ network = strictyaml.Map(
 """
 Schema for :func:`~sierra.core.graphs.network` graphs.
 """
+
+
+def columns(target: dict) -> tp.Optional[list[str]]:
+    """Get the columns of its source file that a graph target uses.
+
+    Any column the target *might* use is included, so not all of them are
+    necessarily present in the file.
+
+    Returns:
+        The columns, or ``None`` if the target uses all columns, or it isn't
+        known which ones it uses.
+
+    .. versionadded:: 1.5.9
+    """
+    graph_type = target.get("type")
+
+    if graph_type == "stacked_line":
+        return target.get("cols")
+
+    if graph_type == "summary_line" and "col" in target:
+        return [target["col"]]
+
+    if graph_type == "heatmap":
+        # Intra-experiment heatmaps are of x,y,z columns, and inter-experiment
+        # heatmaps are of a single column.
+        cols = [target.get(c, c) for c in ["x", "y", "z"]]
+        return [*cols, target["col"]] if "col" in target else cols
+
+    if graph_type == "confusion_matrix":
+        return [
+            target.get("truth_col", "truth"),
+            target.get("predicted_col", "predicted"),
+        ]
+
+    return None
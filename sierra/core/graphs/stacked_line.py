@@ -12,14 +12,14 @@ import logging
 import pathlib
 
 # 3rd party packages
+import numpy as np
 import polars as pl
 import holoviews as hv
-import matplotlib.pyplot as plt
 import bokeh
 
 # Project packages
-from sierra.core import config, utils, storage, models
-from . import pathset
+from sierra.core import config, utils, storage, models, statistics, profiling
+from . import pathset, mplrender, downsample
 
 _logger = logging.getLogger(__name__)
 
@@ -52,6 +52,9 @@ def generate(  # noqa: PLR0913
     cols: tp.Optional[list[str]] = None,
     logyscale: bool = False,
     ext: str = config.STATS["mean"].exts["mean"],
+    *,
+    max_points: tp.Optional[int] = None,
+    downsample_method: str = "lttb",
 ) -> bool:
     """Generate a line graph from a set of columns in a file.
 
@@ -65,9 +68,12 @@ def generate(  # noqa: PLR0913
 
     Ideally, model predictions/stddev calculations would be in derived classes,
     but I can't figure out a good way to easily pull that stuff out of here.
-    """
-    hv.extension(backend, inline=False, logo=False)
 
+    If ``max_points`` is passed and the data has more rows than that, it is
+    decimated with ``downsample_method`` (see
+    :mod:`~sierra.core.graphs.downsample`) before plotting. The same rows are
+    taken from the .stddev/.model files, so everything stays aligned.
+    """
     input_fpath = paths.input_root / (input_stem + ext)
     output_fpath = paths.output_root / "SLN-{}.{}".format(
         output_stem, _ofile_ext(backend)
@@ -79,7 +85,9 @@ def generate(  # noqa: PLR0913
         else config.GRAPHS["text_size_small"]
     )
 
-    if not utils.path_exists(input_fpath):
+    dfs = _read_data(paths.input_root, input_stem, ext, stats, medium, cols)
+
+    if "mean" not in dfs:
         _logger.debug(
             "Not generating <batchroot>/%s: <batchroot>/%s does not exist",
             output_fpath.relative_to(paths.batchroot),
@@ -87,7 +95,7 @@ def generate(  # noqa: PLR0913
         )
         return False
 
-    df = storage.df_read(input_fpath, medium)
+    df = dfs.pop("mean")
 
     # Use xticks if provided, otherwise default to using row indices as xticks
     dfcols = df.columns
@@ -101,77 +109,109 @@ def generate(  # noqa: PLR0913
     else:
         df = df.with_columns(pl.col("index").cast(pl.Float64).alias("xticks"))
 
-    # Convert to pandas for holoviews compatibility
-    df_pd = df.to_pandas()
-
-    dataset = hv.Dataset(
-        data=df_pd,
-        kdims=["index"],
-        vdims=cols if cols else list(dfcols),
-    )
     assert len(df) == len(
         df["xticks"]
     ), "Length mismatch between xticks,# data points: {} vs {}".format(
         len(df["xticks"]), len(df)
     )
 
-    model = _read_models(paths.model_root, input_stem, medium)
-    stat_dfs = _read_stats(stats, paths.input_root, input_stem, medium)
+    rows = None
+    if max_points:
+        rows = downsample.rows_select(
+            df, cols if cols else list(dfcols), max_points, downsample_method
+        )
+        df = downsample.rows_take(df, rows)
 
-    # Plot stats if they have been computed FIRST, so they appear behind the
-    # actual data.
-    if stats and "conf95" in stats and "stddev" in stat_dfs:
-        plot = _plot_stats_stddev(dataset, stat_dfs["stddev"])
-        plot *= _plot_selected_cols(dataset, model, legend, points, backend)
-    elif (
-        stats and "bw" in stats and all(k in stat_dfs for k in config.STATS["bw"].exts)
+    model = _read_models(paths.model_root, input_stem, medium, rows)
+    stat_dfs = {k: downsample.rows_take(v, rows) for k, v in dfs.items()}
+
+    plot_stddev = bool(stats and "conf95" in stats and "stddev" in stat_dfs)
+
+    if (
+        not plot_stddev
+        and stats
+        and "bw" in stats
+        and all(k in stat_dfs for k in config.STATS["bw"].exts)
     ):
         # 2025-10-06 [JRH]: This is a limitation of hv (I think). Manually
         # specifying bw plots around each datapoint on a graph can easily exceed
         # the max # of things that can be in a single overlay.
         _logger.warning("bw statistics not implemented for stacked_line graphs")
-        plot = _plot_selected_cols(dataset, model, legend, points, backend)
+
+    if backend == "matplotlib":
+        _render_mpl(
+            output_fpath,
+            df,
+            cols if cols else list(dfcols),
+            model_info=model,
+            stat_dfs=stat_dfs if plot_stddev else {},
+            title=title,
+            xlabel=xlabel,
+            ylabel=ylabel,
+            show_points=points,
+            legend=legend,
+            logyscale=logyscale,
+            large_text=large_text,
+        )
     else:
-        # Plot specified columns from dataframe.
-        plot = _plot_selected_cols(dataset, model, legend, points, backend)
-
-    # Let the backend decide # of columns; can override with
-    # legend_cols=N in the future if desired.
-    plot.opts(legend_position="bottom")
-
-    # Add title
-    plot.opts(title=title)
-
-    # Add X,Y labels
-    if xlabel is not None:
-        plot.opts(xlabel=xlabel)
-
-    if ylabel is not None:
-        plot.opts(ylabel=ylabel)
-
-    # Set fontsizes
-    plot.opts(
-        fontsize={
-            "title": text_size["title"],
-            "labels": text_size["xyz_label"],
-            "ticks": text_size["tick_label"],
-            "legend": text_size["legend_label"],
-        },
-    )
+        hv.extension(backend, inline=False, logo=False)
 
-    if logyscale:
-        _min = min(dataset[vdim].min() for vdim in dataset.vdims)
-        _max = max(dataset[vdim].max() for vdim in dataset.vdims)
+        # Convert to pandas for holoviews compatibility
+        df_pd = df.to_pandas()
+
+        dataset = hv.Dataset(
+            data=df_pd,
+            kdims=["index"],
+            vdims=cols if cols else list(dfcols),
+        )
+
+        # Plot stats if they have been computed FIRST, so they appear behind
+        # the actual data.
+        if plot_stddev:
+            plot = _plot_stats_stddev(dataset, stat_dfs["stddev"])
+            plot *= _plot_selected_cols(dataset, model, legend, points, backend)
+        else:
+            # Plot specified columns from dataframe.
+            plot = _plot_selected_cols(dataset, model, legend, points, backend)
+
+        # Let the backend decide # of columns; can override with
+        # legend_cols=N in the future if desired.
+        plot.opts(legend_position="bottom")
+
+        # Add title
+        plot.opts(title=title)
+
+        # Add X,Y labels
+        if xlabel is not None:
+            plot.opts(xlabel=xlabel)
+
+        if ylabel is not None:
+            plot.opts(ylabel=ylabel)
 
+        # Set fontsizes
         plot.opts(
-            logy=True,
-            ylim=(
-                _min * 0.9,
-                _max * 1.1,
-            ),
+            fontsize={
+                "title": text_size["title"],
+                "labels": text_size["xyz_label"],
+                "ticks": text_size["tick_label"],
+                "legend": text_size["legend_label"],
+            },
         )
 
-    _save(plot, output_fpath, backend)
+        if logyscale:
+            _min = min(dataset[vdim].min() for vdim in dataset.vdims)
+            _max = max(dataset[vdim].max() for vdim in dataset.vdims)
+
+            plot.opts(
+                logy=True,
+                ylim=(
+                    _min * 0.9,
+                    _max * 1.1,
+                ),
+            )
+
+        _save(plot, output_fpath)
+
     _logger.debug(
         "Graph written to <batchroot>/%s",
         output_fpath.relative_to(paths.batchroot),
@@ -179,16 +219,8 @@ def generate(  # noqa: PLR0913
     return True
 
 
-def _save(plot: hv.Overlay, output_fpath: pathlib.Path, backend: str) -> None:
-    if backend == "matplotlib":
-        hv.save(
-            plot.opts(fig_inches=config.GRAPHS["base_size"]),
-            output_fpath,
-            fig=config.GRAPHS["static_type"],
-            dpi=config.GRAPHS["dpi"],
-        )
-        plt.close("all")
-    elif backend == "bokeh":
+def _save(plot: hv.Overlay, output_fpath: pathlib.Path) -> None:
+    with profiling.span("render", path=output_fpath.name):
         fig = hv.render(plot)
 
         # 2025-12-02 [JRH]: We don't set dimensions, because that makes the
@@ -201,6 +233,66 @@ def _save(plot: hv.Overlay, output_fpath: pathlib.Path, backend: str) -> None:
             f.write(html)
 
 
+def _render_mpl(  # noqa: PLR0913
+    output_fpath: pathlib.Path,
+    df: pl.DataFrame,
+    cols: list[str],
+    *,
+    model_info: models.ModelInfo,
+    stat_dfs: dict[str, pl.DataFrame],
+    title: str,
+    xlabel: tp.Optional[str],
+    ylabel: tp.Optional[str],
+    show_points: bool,
+    legend: tp.Optional[list[str]],
+    logyscale: bool,
+    large_text: bool,
+) -> None:
+    text_size = mplrender.text_sizes(large_text)
+    fig = mplrender.figure()
+    ax = fig.add_subplot()
+    x = df["index"].to_numpy()
+
+    # Plot stats if they have been computed FIRST, so they appear behind the
+    # actual data.
+    if "stddev" in stat_dfs:
+        for c in cols:
+            y = df[c].to_numpy()
+            stddev = stat_dfs["stddev"][c].abs().to_numpy()
+            ax.fill_between(x, y - 2 * stddev, y + 2 * stddev, alpha=0.5)
+
+    # Plot the points for each curve if configured to do so, OR if there aren't
+    # that many. If you print them and there are a lot, you essentially get
+    # really fat lines which doesn't look good.
+    marker = "o" if len(df) <= 50 or show_points else None
+    for i, c in enumerate(cols):
+        ax.plot(x, df[c].to_numpy(), marker=marker, label=legend[i] if legend else "")
+
+    # Plot models if they have been computed
+    if model_info.dataset:
+        mx = model_info.dataset[model_info.dataset.kdims[0]]
+        for i, vdim in enumerate(model_info.dataset.vdims):
+            my = model_info.dataset[vdim]
+            ax.plot(
+                mx,
+                my,
+                linestyle="--",
+                marker="o" if len(my) <= 50 or show_points else None,
+                label=model_info.legend[i],
+            )
+
+    if logyscale:
+        values = df.select(cols)
+        ax.set_yscale("log")
+        ax.set_ylim(
+            values.min_horizontal().min() * 0.9, values.max_horizontal().max() * 1.1
+        )
+
+    mplrender.decorate(ax, text_size, title, xlabel, ylabel)
+    mplrender.legend(ax, text_size)
+    mplrender.save(fig, output_fpath)
+
+
 def _plot_selected_cols(
     dataset: hv.Dataset,
     model_info: models.ModelInfo,
@@ -297,25 +389,28 @@ def _plot_stats_stddev(dataset: hv.Dataset, stddev_df: pl.DataFrame) -> hv.NdOve
     )
 
 
-def _read_stats(
-    setting: tp.Optional[str], stats_root: pathlib.Path, input_stem: str, medium: str
+def _read_data(
+    stats_root: pathlib.Path,
+    input_stem: str,
+    ext: str,
+    setting: tp.Optional[str],
+    medium: str,
+    cols: tp.Optional[list[str]] = None,
 ) -> dict[str, pl.DataFrame]:
-    dfs = {}  # type: tp.Dict[str, pl.DataFrame]
-    settings = []
+    """Read the data and any statistics for a graph.
 
-    if setting == "none":
-        return dfs
-
-    settings = ["conf95", "bw"] if setting == "all" else [setting]
-
-    if setting in settings:
-        exts = config.STATS[setting].exts
+    Everything is read in one go, so that bundled statistics only need a single
+    read, and only the columns which are plotted are read. The data is under the
+    ``mean`` key.
+    """
+    exts = config.STATS[setting].exts if setting in ["conf95", "bw"] else {}
+    dfs = statistics.read(
+        stats_root, input_stem, {"mean": ext, **exts}, medium, columns=cols
+    )
 
+    if "mean" in dfs:
         for k in exts:
-            ipath = stats_root / (input_stem + exts[k])
-            if utils.path_exists(ipath):
-                dfs[k] = storage.df_read(ipath, medium)
-            else:
+            if k not in dfs:
                 _logger.warning("%s not found for '%s'", exts[k], input_stem)
 
     return dfs
@@ -324,7 +419,10 @@ def _read_stats(
 # 2024/09/13 [JRH]: The union is for compatability with type checkers in
 # python {3.8,3.11}.
 def _read_models(
-    model_root: tp.Optional[pathlib.Path], input_stem: str, medium: str
+    model_root: tp.Optional[pathlib.Path],
+    input_stem: str,
+    medium: str,
+    rows: tp.Optional[np.ndarray] = None,
 ) -> models.ModelInfo:
 
     if model_root is None:
@@ -342,7 +440,7 @@ def _read_models(
     cols = list(df.columns)
 
     # Add index and convert to pandas for holoviews
-    df = df.with_row_index("index")
+    df = downsample.rows_take(df.with_row_index("index"), rows)
     df_pd = df.to_pandas()
 
     info.dataset = hv.Dataset(data=df_pd, kdims=["index"], vdims=cols)
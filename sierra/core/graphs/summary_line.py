@@ -16,12 +16,11 @@ import logging
 # 3rd party packages
 import polars as pl
 import holoviews as hv
-import matplotlib.pyplot as plt
 import bokeh
 
 # Project packages
-from sierra.core import config, utils, storage, models
-from . import pathset
+from sierra.core import config, utils, storage, models, types, statistics, profiling
+from . import pathset, mplrender
 
 _logger = logging.getLogger(__name__)
 
@@ -84,8 +83,6 @@ def generate(  # noqa: PLR0913
                      experiment.
 
     """
-    hv.extension(backend, inline=False, logo=False)
-
     if backend == "matplotlib":
         ofile_ext = config.GRAPHS["static_type"]
     elif backend == "bokeh":
@@ -96,7 +93,17 @@ def generate(  # noqa: PLR0913
     input_fpath = paths.input_root / (input_stem + config.STATS["mean"].exts["mean"])
     output_fpath = paths.output_root / f"SM-{output_stem}.{ofile_ext}"
 
-    if not utils.path_exists(input_fpath):
+    # Read the data and any statistics in one go, so that bundled statistics
+    # only need a single read.
+    stat_exts = _stat_exts(stats)
+    stat_dfs = statistics.read(
+        paths.input_root,
+        input_stem,
+        {"mean": config.STATS["mean"].exts["mean"], **stat_exts},
+        medium,
+    )
+
+    if "mean" not in stat_dfs:
         _logger.debug(
             "Not generating <batchroot>/%s: <batchroot>/%s does not exist",
             output_fpath.relative_to(paths.batchroot),
@@ -109,16 +116,16 @@ def generate(  # noqa: PLR0913
         if large_text
         else config.GRAPHS["text_size_small"]
     )
-    df = storage.df_read(input_fpath, medium)
+    df = stat_dfs.pop("mean")
+    for k in stat_exts:
+        if k not in stat_dfs:
+            _logger.warning("%s file not found for '%s'", stat_exts[k], input_stem)
+
     # Column 0 is the 'Experiment ID' index, which we don't want included as
     # a vdim
     cols = df.columns[1:]
     df = df.with_columns(pl.Series("xticks", xticks))
 
-    # Convert to pandas for HoloViews compatibility
-    df_pd = df.to_pandas()
-    dataset = hv.Dataset(data=df_pd.reset_index(), kdims=["xticks"], vdims=cols)
-
     assert len(df) == len(
         xticks
     ), "Length mismatch between xticks,# data points: {} vs {}".format(
@@ -127,55 +134,68 @@ def generate(  # noqa: PLR0913
 
     model_info = _read_model_info(paths.model_root, input_stem, medium, xticks)
 
-    # Add statistics according to configuration
-    stat_dfs = _read_stats(stats, medium, paths.input_root, input_stem)
-    plot = _plot_stats(dataset, stats, stat_dfs, backend)
+    if backend == "matplotlib":
+        _render_mpl(
+            output_fpath,
+            df,
+            cols,
+            legend=legend,
+            model_info=model_info,
+            stats=stats,
+            stat_dfs=stat_dfs,
+            title=title,
+            xlabel=xlabel,
+            ylabel=ylabel,
+            xticklabels=xticklabels,
+            logyscale=logyscale,
+            large_text=large_text,
+        )
+    else:
+        hv.extension(backend, inline=False, logo=False)
 
-    # Add legend
-    plot.opts(legend_position="bottom")
+        # Convert to pandas for HoloViews compatibility
+        df_pd = df.to_pandas()
+        dataset = hv.Dataset(data=df_pd.reset_index(), kdims=["xticks"], vdims=cols)
 
-    # Plot lines after stats so they show on top
-    plot *= _plot_lines(dataset, model_info, legend, backend)
+        plot = _plot_stats(dataset, stats, stat_dfs, backend)
 
-    # Add X,Y labels
-    plot.opts(ylabel=ylabel, xlabel=xlabel)
+        # Add legend
+        plot.opts(legend_position="bottom")
 
-    # Configure ticks (must be last so not overwritten by what you get from
-    # plotting the lines)
-    plot = _plot_ticks(plot, logyscale, xticks, xticklabels)
+        # Plot lines after stats so they show on top
+        plot *= _plot_lines(dataset, model_info, legend, backend)
 
-    # Set fontsizes
-    plot.opts(
-        fontsize={
-            "title": text_size["title"],
-            "labels": text_size["xyz_label"],
-            "ticks": text_size["tick_label"],
-            "legend": text_size["legend_label"],
-        },
-    )
+        # Add X,Y labels
+        plot.opts(ylabel=ylabel, xlabel=xlabel)
 
-    # Add title
-    plot.opts(title=title)
+        # Configure ticks (must be last so not overwritten by what you get from
+        # plotting the lines)
+        plot = _plot_ticks(plot, logyscale, xticks, xticklabels)
 
-    if backend == "matplotlib":
-        hv.save(
-            plot.opts(fig_inches=config.GRAPHS["base_size"]),
-            output_fpath,
-            fig=config.GRAPHS["static_type"],
-            dpi=config.GRAPHS["dpi"],
+        # Set fontsizes
+        plot.opts(
+            fontsize={
+                "title": text_size["title"],
+                "labels": text_size["xyz_label"],
+                "ticks": text_size["tick_label"],
+                "legend": text_size["legend_label"],
+            },
         )
-        plt.close("all")
-    elif backend == "bokeh":
-        fig = hv.render(plot)
 
-        # 2025-12-02 [JRH]: We don't set dimensions, because that makes the
-        # interactive plots fixed size, which makes them unsuitable for
-        # embedding into webpages.
-        fig.sizing_mode = "scale_width"
+        # Add title
+        plot.opts(title=title)
+
+        with profiling.span("render", path=output_fpath.name):
+            fig = hv.render(plot)
 
-        html = bokeh.embed.file_html(fig, resources=bokeh.resources.INLINE)
-        with utils.utf8open(output_fpath, "w") as f:
-            f.write(html)
+            # 2025-12-02 [JRH]: We don't set dimensions, because that makes the
+            # interactive plots fixed size, which makes them unsuitable for
+            # embedding into webpages.
+            fig.sizing_mode = "scale_width"
+
+            html = bokeh.embed.file_html(fig, resources=bokeh.resources.INLINE)
+            with utils.utf8open(output_fpath, "w") as f:
+                f.write(html)
 
     _logger.debug(
         "Graph written to <batchroot>/%s", output_fpath.relative_to(paths.batchroot)
@@ -184,6 +204,101 @@ def generate(  # noqa: PLR0913
     return True
 
 
+def _render_mpl(  # noqa: PLR0913
+    output_fpath: pathlib.Path,
+    df: pl.DataFrame,
+    cols: list[str],
+    *,
+    legend: list[str],
+    model_info: models.ModelInfo,
+    stats: tp.Optional[str],
+    stat_dfs: dict[str, pl.DataFrame],
+    title: str,
+    xlabel: str,
+    ylabel: str,
+    xticklabels: tp.Optional[list[str]],
+    logyscale: bool,
+    large_text: bool,
+) -> None:
+    text_size = mplrender.text_sizes(large_text)
+    fig = mplrender.figure()
+    ax = fig.add_subplot()
+    x = df["xticks"].to_numpy()
+
+    # Plot stats FIRST, so they appear behind the actual data.
+    if _stats_ok(stats, stat_dfs, "conf95"):
+        for c in cols:
+            y = df[c].to_numpy()
+            stddev = stat_dfs["stddev"][c].abs().to_numpy()
+            ax.fill_between(x, y - 2 * stddev, y + 2 * stddev, alpha=0.5)
+
+    if _stats_ok(stats, stat_dfs, "bw"):
+        for c in cols:
+            ax.bxp(
+                [
+                    {
+                        "med": stat_dfs["median"][c].item(j),
+                        "q1": stat_dfs["q1"][c].item(j),
+                        "q3": stat_dfs["q3"][c].item(j),
+                        "whislo": stat_dfs["whislo"][c].item(j),
+                        "whishi": stat_dfs["whishi"][c].item(j),
+                    }
+                    for j in range(len(df))
+                ],
+                positions=x,
+                widths=0.4,
+                showfliers=False,
+                manage_ticks=False,
+                medianprops={"color": "darkred", "linewidth": 2},
+            )
+
+    for i, c in enumerate(cols):
+        ax.plot(x, df[c].to_numpy(), marker="o", label=legend[i])
+
+    # TODO: This currently only works for a single model being put onto a
+    # summary line graph.
+    if model_info.dataset:
+        mx = model_info.dataset[model_info.dataset.kdims[0]]
+        for i, vdim in enumerate(model_info.dataset.vdims):
+            my = model_info.dataset[vdim]
+            ax.plot(
+                mx,
+                my,
+                linestyle="--",
+                marker="o" if len(my) <= 50 else None,
+                label=model_info.legend[i],
+            )
+
+    if logyscale:
+        ax.set_yscale("log")
+
+    # For ordered, qualitative data
+    if xticklabels is not None:
+        ax.set_xticks(x, xticklabels, rotation=90)
+
+    mplrender.decorate(ax, text_size, title, xlabel, ylabel)
+    mplrender.legend(ax, text_size)
+    mplrender.save(fig, output_fpath)
+
+
+def _stats_ok(
+    setting: tp.Optional[str], stat_dfs: dict[str, pl.DataFrame], kind: str
+) -> bool:
+    if setting not in [kind, "all"]:
+        return False
+
+    if not all(k in stat_dfs for k in config.STATS[kind].exts):
+        _logger.warning(
+            "Cannot plot %s statistics: missing some statistics: %s vs %s",
+            kind,
+            stat_dfs.keys(),
+            config.STATS[kind].exts,
+        )
+        return False
+
+    return True
+
+
 def _plot_lines(
     dataset: hv.Dataset,
     model_info: models.ModelInfo,
@@ -412,57 +527,16 @@ def _plot_ticks(
     return plot
 
 
-def _read_stats(
-    setting: str, medium: str, stats_root: pathlib.Path, input_stem: str
-) -> dict[str, pl.DataFrame]:
-    dfs = {}
+def _stat_exts(setting: tp.Optional[str]) -> types.StrDict:
+    exts = {}
 
-    dfs.update(_read_conf95_stats(setting, medium, stats_root, input_stem))
-    dfs.update(_read_bw_stats(setting, medium, stats_root, input_stem))
-    return dfs
-
-
-def _read_conf95_stats(
-    setting: str,
-    medium: str,
-    stats_root: pathlib.Path,
-    input_stem: str,
-) -> dict[str, pl.DataFrame]:
-    dfs = {}
-
-    exts = config.STATS["conf95"].exts
     if setting in ["conf95", "all"]:
-        for k in exts:
-            ipath = stats_root / (input_stem + exts[k])
-
-            if utils.path_exists(ipath):
-                dfs[k] = storage.df_read(ipath, medium)
-            else:
-                _logger.warning("%s file not found for '%s'", exts[k], input_stem)
-
-    return dfs
-
-
-def _read_bw_stats(
-    setting: str,
-    medium: str,
-    stats_root: pathlib.Path,
-    input_stem: str,
-) -> dict[str, pl.DataFrame]:
-    dfs = {}
-
-    exts = config.STATS["bw"].exts
+        exts.update(config.STATS["conf95"].exts)
 
     if setting in ["bw", "all"]:
-        for k in exts:
-            ipath = stats_root / (input_stem + exts[k])
-
-            if utils.path_exists(ipath):
-                dfs[k] = storage.df_read(ipath, medium)
-            else:
-                _logger.warning("%s file not found for '%s'", exts[k], input_stem)
+        exts.update(config.STATS["bw"].exts)
 
-    return dfs
+    return exts
 
 
 # 2024/09/13 [JRH]: The union is for compatability with type checkers in
@@ -8,12 +8,14 @@ import dataclasses
 import typing as tp
 
 # 3rd party packages
-import holoviews as hv
 
 # Project packages
 
+if tp.TYPE_CHECKING:
+    import holoviews as hv
+
 
 @dataclasses.dataclass
 class ModelInfo:
-    dataset: hv.Dataset = None
+    dataset: "hv.Dataset" = None
     legend: list[str] = dataclasses.field(default_factory=lambda: [])
@@ -0,0 +1,402 @@
+# Copyright 2026 John Harwell, All rights reserved.
+#
+#  SPDX-License-Identifier: MIT
+"""
+Machine-readable timing/throughput metrics for each pipeline stage and plugin.
+
+Each time a stage or a plugin within a stage runs (see :func:`measure`), records
+are appended to ``<batchroot>/statistics/exec/metrics.jsonl`` (stage 5:
+``<sierra_root>/<project>/metrics.jsonl``), one JSON object per line:
+
+- ``invocation`` - When SIERRA was invoked; groups the records from a single
+  invocation.
+
+- ``host`` - The host SIERRA ran on.
+
+- ``stage``, ``plugin`` - What was measured; ``plugin`` is null for the stage
+  as a whole.
+
+- ``exp`` - The :term:`Experiment` the record is for, or null for totals
+  across the batch.
+
+- ``wall_secs``, ``cpu_secs`` - Elapsed time, and CPU time used by SIERRA and
+  all of its worker processes.
+
+- ``rss_peak`` - Peak memory used by SIERRA and all of its worker processes,
+  in bytes. Sampled every ``config.METRICS["rss_interval"]`` seconds, so very
+  short spikes can be missed.
+
+- ``files_read``, ``bytes_read``, ``files_written``, ``bytes_written`` - Files
+  read/written via ``--storage`` plugins, and their on-disk sizes.
+
+Per-experiment records only contain what can be attributed to a single
+experiment: wall time for each experiment in stage 2, and files read/written
+under the experiment's directories.
+
+To compare the most recent metrics for each stage/plugin in two batches::
+
+  python3 -m sierra.core.pipeline.metrics BATCH_A BATCH_B
+
+where ``BATCH_A`` and ``BATCH_B`` are batch roots or ``metrics.jsonl`` files.
+"""
+
+# Core packages
+import typing as tp
+import os
+import sys
+import json
+import time
+import atexit
+import shutil
+import socket
+import pathlib
+import datetime
+import tempfile
+import threading
+import contextlib
+import collections
+from dataclasses import dataclass, field
+
+# 3rd party packages
+import psutil
+import polars as pl
+
+# Project packages
+from sierra.core import config
+
+_ENV_DIR = "SIERRA_METRICS_DIR"
+
+_FIELDS = [
+    "wall_secs",
+    "cpu_secs",
+    "rss_peak",
+    "files_read",
+    "bytes_read",
+    "files_written",
+    "bytes_written",
+]
+
+_SCHEMA = {
+    "invocation": pl.String,
+    "host": pl.String,
+    "stage": pl.Int64,
+    "plugin": pl.String,
+    "exp": pl.String,
+    "wall_secs": pl.Float64,
+    "cpu_secs": pl.Float64,
+    "rss_peak": pl.Int64,
+    "files_read": pl.Int64,
+    "bytes_read": pl.Int64,
+    "files_written": pl.Int64,
+    "bytes_written": pl.Int64,
+}
+
+_state: dict[str, tp.Any] = {
+    "path": None,
+    # Where each process logs the files it reads/writes
+    "dir": os.environ.get(_ENV_DIR),
+    "exp_names": frozenset(),
+    "invocation": None,
+    # The stages/plugins currently being measured, innermost last
+    "frames": [],
+    # (pid, file) for the I/O log of this process
+    "io": None,
+}
+
+
+@dataclass
+class _Frame:
+    stage: int
+    plugin: tp.Optional[str]
+    totals: collections.Counter = field(default_factory=collections.Counter)
+    exps: dict[str, collections.Counter] = field(
+        default_factory=lambda: collections.defaultdict(collections.Counter)
+    )
+
+
+def initialize(path: tp.Optional[pathlib.Path], exp_names: tp.Iterable[str]) -> None:
+    """Select where metrics are written.
+
+    Args:
+        path: The file to append metrics to, or None to disable metrics.
+
+        exp_names: The names of the experiments in the batch, for attributing
+                   reads/writes to experiments.
+    """
+    _state["path"] = path
+    _state["exp_names"] = frozenset(exp_names)
+    _state["invocation"] = datetime.datetime.now().isoformat(timespec="seconds")
+
+    if path is None:
+        _state["dir"] = None
+        os.environ.pop(_ENV_DIR, None)
+        return
+
+    io_dir = tempfile.mkdtemp(prefix="sierra-metrics-")
+    atexit.register(shutil.rmtree, io_dir, ignore_errors=True)
+    _state["dir"] = io_dir
+    os.environ[_ENV_DIR] = io_dir
+
+
+@contextlib.contextmanager
+def measure(stage: int, plugin: tp.Optional[str] = None) -> tp.Iterator[None]:
+    """Measure a pipeline stage, or a plugin within a stage.
+
+    Measurements can be nested; reads/writes inside a plugin count towards the
+    plugin and the stage.
+    """
+    if _state["path"] is None:
+        yield
+        return
+
+    frame = _Frame(stage, plugin)
+    _state["frames"].append(frame)
+
+    sampler = _PeakRSS()
+    start_wall = time.monotonic()
+    start_cpu = _cpu_secs()
+    try:
+        yield
+    finally:
+        frame.totals["wall_secs"] = time.monotonic() - start_wall
+        frame.totals["cpu_secs"] = _cpu_secs() - start_cpu
+        frame.totals["rss_peak"] = sampler.stop()
+
+        _drain(frame)
+        _state["frames"].pop()
+        if _state["frames"]:
+            parent = _state["frames"][-1]
+            for k in ["files_read", "bytes_read", "files_written", "bytes_written"]:
+                parent.totals[k] += frame.totals[k]
+
+        _write(frame)
+
+
+def add(exp: tp.Optional[str] = None, **fields: float) -> None:
+    """Add to the metrics for the innermost stage/plugin being measured.
+
+    Args:
+        exp: The experiment to add to, or None to add to the totals.
+
+        fields: The metrics to add to (e.g., ``wall_secs``).
+    """
+    if not _state["frames"]:
+        return
+
+    frame = _state["frames"][-1]
+    counts = frame.totals if exp is None else frame.exps[exp]
+    counts.update(fields)
+
+
+def io(op: str, path: pathlib.Path) -> None:
+    """Record that a file was read (``op="r"``) or written (``op="w"``).
+
+    This is called by :mod:`sierra.core.storage` in whatever process does the
+    read/write; each process logs to its own file, so no locking is needed.
+    """
+    if _state["dir"] is None:
+        return
+
+    try:
+        nbytes = path.stat().st_size
+    except OSError:
+        nbytes = 0
+
+    _io_file().write(f"{op}\t{nbytes}\t{path}\n")
+
+
+def load(path: pathlib.Path) -> pl.DataFrame:
+    """Read metrics from a ``metrics.jsonl`` file or the batch root containing it."""
+    if path.is_dir():
+        leaf = config.METRICS["leaf"]
+        candidates = [path / "statistics" / "exec" / leaf, path / leaf]
+        path = next((p for p in candidates if p.exists()), candidates[0])
+
+    return pl.read_ndjson(path, schema=_SCHEMA)
+
+
+def compare(a: pl.DataFrame, b: pl.DataFrame) -> pl.DataFrame:
+    """Compare the most recent metrics for each stage/plugin in two batches.
+
+    Returns:
+        One row per stage/plugin, with the wall time, CPU time, peak RSS, and
+        I/O throughput from each batch, and the % change from ``a`` to ``b``.
+    """
+    metrics = ["wall_secs", "cpu_secs", "rss_mb", "io_mb_per_sec"]
+
+    def _totals(df: pl.DataFrame, suffix: str) -> pl.DataFrame:
+        latest = pl.col("invocation") == pl.col("invocation").max().over(
+            "stage", "plugin"
+        )
+        io_mb = (pl.col("bytes_read") + pl.col("bytes_written")) / 1e6
+        return (
+            df.filter(pl.col("exp").is_null())
+            .filter(latest)
+            .select(
+                "stage",
+                pl.col("plugin").fill_null("-"),
+                pl.col("wall_secs"),
+                pl.col("cpu_secs"),
+                rss_mb=pl.col("rss_peak") / 1e6,
+                io_mb_per_sec=io_mb / pl.col("wall_secs"),
+            )
+            .rename({m: f"{m}_{suffix}" for m in metrics})
+        )
+
+    joined = _totals(a, "a").join(
+        _totals(b, "b"), on=["stage", "plugin"], how="full", coalesce=True
+    )
+
+    cols = []
+    for m in metrics:
+        change = (pl.col(f"{m}_b") - pl.col(f"{m}_a")) / pl.col(f"{m}_a") * 100
+        cols.extend(
+            [
+                pl.col(f"{m}_a").round(2),
+                pl.col(f"{m}_b").round(2),
+                change.round(1).alias(f"{m}_%"),
+            ]
+        )
+
+    return joined.select("stage", "plugin", *cols).sort("stage", "plugin")
+
+
+def main(argv: list[str]) -> int:
+    if len(argv) != 2:
+        print(__doc__)
+        return 1
+
+    df = compare(load(pathlib.Path(argv[0])), load(pathlib.Path(argv[1])))
+    with pl.Config(
+        tbl_rows=-1,
+        tbl_cols=-1,
+        tbl_width_chars=250,
+        tbl_hide_dataframe_shape=True,
+        tbl_hide_column_data_types=True,
+    ):
+        print(df)
+
+    return 0
+
+
+class _PeakRSS:
+    """Sample the memory used by this process and its children in the background."""
+
+    def __init__(self) -> None:
+        self.peak = 0
+        self._done = threading.Event()
+        self._proc = psutil.Process()
+        self._sample()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> int:
+        self._done.set()
+        self._thread.join()
+        self._sample()
+        return self.peak
+
+    def _run(self) -> None:
+        while not self._done.wait(config.METRICS["rss_interval"]):
+            self._sample()
+
+    def _sample(self) -> None:
+        rss = 0
+        for proc in [self._proc, *self._proc.children(recursive=True)]:
+            with contextlib.suppress(psutil.Error):
+                rss += proc.memory_info().rss
+
+        self.peak = max(self.peak, rss)
+
+
+def _cpu_secs() -> float:
+    # Only includes children which have been waited on, which pool workers are
+    # once the pool is closed.
+    t = os.times()
+    return t.user + t.system + t.children_user + t.children_system
+
+
+def _io_file() -> tp.TextIO:
+    pid = os.getpid()
+    if _state["io"] is not None and _state["io"][0] == pid:
+        return _state["io"][1]
+
+    # Line buffered, so that the log is complete even if the process dies
+    # without cleaning up (e.g., pool workers).
+    path = pathlib.Path(_state["dir"]) / f"{pid}.tsv"
+    f = path.open("a", buffering=1, encoding="utf-8")
+    _state["io"] = (pid, f)
+    return f
+
+
+def _drain(frame: _Frame) -> None:
+    """Add the reads/writes logged by all processes to the frame."""
+    if _state["io"] is not None and _state["io"][0] == os.getpid():
+        _state["io"][1].close()
+        _state["io"] = None
+
+    exps = {}  # type: dict[pathlib.Path, tp.Optional[str]]
+    for log in pathlib.Path(_state["dir"]).glob("*.tsv"):
+        with log.open("r", encoding="utf-8") as f:
+            lines = f.readlines()
+        log.unlink()
+
+        for line in lines:
+            fields = line.rstrip("\n").split("\t", 2)
+            if len(fields) != 3:  # Partial last line from a killed worker
+                continue
+
+            op, nbytes, path = fields[0], int(fields[1]), pathlib.Path(fields[2])
+            if path.parent not in exps:
+                exps[path.parent] = next(
+                    (p for p in path.parent.parts if p in _state["exp_names"]), None
+                )
+
+            kind = "read" if op == "r" else "written"
+            counts = [frame.totals]
+            if exps[path.parent] is not None:
+                counts.append(frame.exps[exps[path.parent]])
+
+            for c in counts:
+                c[f"files_{kind}"] += 1
+                c[f"bytes_{kind}"] += nbytes
+
+
+def _write(frame: _Frame) -> None:
+    common = {
+        "invocation": _state["invocation"],
+        "host": socket.gethostname(),
+        "stage": frame.stage,
+        "plugin": frame.plugin,
+    }
+    records = [{**common, "exp": None, **_fields(frame.totals)}]
+    records.extend(
+        {**common, "exp": exp, **_fields(counts)}
+        for exp, counts in sorted(frame.exps.items())
+    )
+
+    path = _state["path"]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a", encoding="utf-8") as f:
+        for r in records:
+            f.write(json.dumps(r) + "\n")
+
+
+def _fields(counts: collections.Counter) -> dict[str, tp.Any]:
+    res = {}  # type: dict[str, tp.Any]
+    for k in _FIELDS:
+        if k in counts:
+            res[k] = counts[k]
+        elif k.startswith(("files_", "bytes_")):
+            res[k] = 0
+        else:
+            res[k] = None
+
+    return res
+
+
+__all__ = ["add", "compare", "initialize", "io", "load", "main", "measure"]
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
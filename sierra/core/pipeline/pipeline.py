@@ -19,7 +19,9 @@ import yaml
 
 # Project packages
 import sierra.core.plugin as pm
-from sierra.core import config, utils, batchroot, types
+from sierra.core import config, utils, batchroot, types, fs, profiling
+from sierra.core.graphs import backends
+from sierra.core.pipeline import metrics
 
 from sierra.core.pipeline.stage1.pipeline_stage1 import PipelineStage1
 from sierra.core.pipeline.stage2.pipeline_stage2 import PipelineStage2
@@ -85,31 +87,70 @@ class Pipeline:
     def run(self) -> None:
         """
         Run pipeline stages 1-5 as configured.
+
+        Cached directory listings are dropped before each stage, because each
+        stage consumes files written by the previous one, often from other
+        processes.
         """
+        backends.mpl_quality_init(self.cmdopts["plot_quality"])
+
+        if self.pathset is not None:
+            profile_root = self.pathset.stat_exec_root / "profile"
+        else:
+            profile_root = (
+                self.cmdopts["sierra_root"] / self.cmdopts["project"] / "profile"
+            )
+        profiling.initialize(self.cmdopts["profile"], profile_root)
+        self._metrics_init()
+
         if 1 in self.args.pipeline:
-            PipelineStage1(
-                self.cmdopts,
-                self.pathset,
-                self.controller,
-                self.batch_criteria,
-            ).run()
+            fs.invalidate()
+            with profiling.stage("stage1"), metrics.measure(1):
+                PipelineStage1(
+                    self.cmdopts,
+                    self.pathset,
+                    self.controller,
+                    self.batch_criteria,
+                ).run()
 
         if 2 in self.args.pipeline:
-            PipelineStage2(self.cmdopts, self.pathset).run(self.batch_criteria)
+            fs.invalidate()
+            with profiling.stage("stage2"), metrics.measure(2):
+                PipelineStage2(self.cmdopts, self.pathset).run(self.batch_criteria)
 
         if 3 in self.args.pipeline:
-            PipelineStage3(self.main_config, self.cmdopts, self.pathset).run(
-                self.batch_criteria
-            )
+            fs.invalidate()
+            with profiling.stage("stage3"), metrics.measure(3):
+                PipelineStage3(self.main_config, self.cmdopts, self.pathset).run(
+                    self.batch_criteria
+                )
 
         if 4 in self.args.pipeline:
-            PipelineStage4(self.main_config, self.cmdopts, self.pathset).run(
-                self.batch_criteria
-            )
+            fs.invalidate()
+            with profiling.stage("stage4"), metrics.measure(4):
+                PipelineStage4(self.main_config, self.cmdopts, self.pathset).run(
+                    self.batch_criteria
+                )
 
         # not part of default pipeline
         if 5 in self.args.pipeline:
-            PipelineStage5(self.main_config, self.cmdopts).run(self.args)
+            fs.invalidate()
+            with profiling.stage("stage5"), metrics.measure(5):
+                PipelineStage5(self.main_config, self.cmdopts).run(self.args)
+
+    def _metrics_init(self) -> None:
+        leaf = config.METRICS["leaf"]
+        if self.pathset is not None:
+            path = self.pathset.stat_exec_root / leaf
+        else:
+            path = self.cmdopts["sierra_root"] / self.cmdopts["project"] / leaf
+
+        # Stage 5 compares batches, so there is no single set of experiments
+        exp_names = (
+            [] if 5 in self.args.pipeline else self.batch_criteria.gen_exp_names()
+        )
+
+        metrics.initialize(path, exp_names)
 
     def _init_cmdopts(self, shortforms: types.Cmdopts) -> types.Cmdopts:
         longforms = {
@@ -126,12 +167,17 @@ class Pipeline:
             "exp_range": self.args.exp_range,
             "engine": self.args.engine,
             "processing_parallelism": self.args.processing_parallelism,
+            "processing_threads": self.args.processing_threads,
+            "plot_quality": self.args.plot_quality,
+            "profile": self.args.profile,
             "exec_parallelism_paradigm": self.args.exec_parallelism_paradigm,
             "expdef": self.args.expdef,
             # stage 1
             "preserve_seeds": self.args.preserve_seeds,
             # stage 2
             "nodefile": self.args.nodefile,
+            "exec_telemetry": self.args.exec_telemetry,
+            "exec_telemetry_interval": self.args.exec_telemetry_interval,
             # stage 3
             "proc": self.args.proc,
             "df_verify": self.args.df_verify,
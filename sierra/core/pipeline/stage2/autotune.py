@@ -0,0 +1,183 @@
+# Copyright 2026 John Harwell, All rights reserved.
+#
+#  SPDX-License-Identifier: MIT
+"""Calibrated selection of ``--exec-jobs-per-node``.
+
+Before the batch runs, a few :term:`Experimental Runs <Experimental Run>` from
+the first experiment to run are executed at several concurrency levels around
+the default computed by the ``--engine``/``--execenv`` plugins, and the level
+with the highest throughput (runs/hour) is used for the rest of the batch.
+
+The chosen level is cached per host/engine/scenario/execenv in
+``$XDG_CACHE_HOME/sierra``, so later batches on the same node start tuned
+without re-calibrating.
+
+Calibration runs use the real experiment inputs, so their outputs are
+overwritten when the experiment is executed for real.
+"""
+
+# Core packages
+import json
+import time
+import socket
+import logging
+import pathlib
+import typing as tp
+
+# 3rd party packages
+import psutil
+
+# Project packages
+from sierra.core import types, config, utils, batchroot
+
+_logger = logging.getLogger(__name__)
+
+
+def levels_calc(base: int, n_cpus: int, n_avail: int) -> list[int]:
+    """Compute the concurrency levels to calibrate.
+
+    Levels bracket ``base`` (the untuned default) by a factor of 2 in each
+    direction, without exceeding the # of logical cores or the # of runs
+    available to calibrate with.
+    """
+    upper = max(1, min(n_cpus, n_avail))
+    candidates = {max(1, base // 2), base, base * 2}
+    return sorted({min(c, upper) for c in candidates})
+
+
+def level_select(throughput: dict[int, float], tolerance: float) -> int:
+    """Select the concurrency level to use from calibration results.
+
+    The smallest level whose throughput is within ``tolerance`` of the best is
+    chosen.
+    """
+    best = max(throughput.values())
+    return min(j for j, t in throughput.items() if t >= best * (1.0 - tolerance))
+
+
+class ConcurrencyTuner:
+    """Pick the # of concurrent runs/node via calibration or the cache.
+
+    Attributes:
+        cmdopts: Dictionary of parsed cmdline options.
+
+        pathset: Paths for the batch experiment.
+
+        shell: The shell to run calibration commands in.
+    """
+
+    def __init__(
+        self,
+        cmdopts: types.Cmdopts,
+        pathset: batchroot.PathSet,
+        shell: tp.Any,
+        cache_path: tp.Optional[pathlib.Path] = None,
+    ) -> None:
+        self.cmdopts = cmdopts
+        self.pathset = pathset
+        self.shell = shell
+        self.cache_path = cache_path or (
+            config.CACHE_ROOT / config.EXEC_AUTOTUNE["cache_leaf"]
+        )
+
+    def __call__(self, cmdfile: pathlib.Path) -> int:
+        """Return the # of concurrent runs/node to use.
+
+        Falls back to the current ``--exec-jobs-per-node`` if calibration is not
+        possible.
+        """
+        base = self.cmdopts["exec_jobs_per_node"] or 1
+        key = self.cache_key()
+
+        cached = self.cache_load().get(key)
+        if cached is not None:
+            _logger.info(
+                "Using cached --exec-jobs-per-node=%s for %s (%.1f runs/hour)",
+                cached["jobs_per_node"],
+                key,
+                cached["runs_per_hour"],
+            )
+            return cached["jobs_per_node"]
+
+        with utils.utf8open(cmdfile, "r") as f:
+            lines = [line for line in f.readlines() if line.strip()]
+
+        levels = levels_calc(base, psutil.cpu_count(), len(lines))
+        _logger.info("Calibrating --exec-jobs-per-node with levels %s", levels)
+
+        throughput = {}
+        for j in levels:
+            runs_per_hour = self._calibrate(lines[:j], j)
+            if runs_per_hour is None:
+                _logger.warning(
+                    "Calibration at level %s failed; using --exec-jobs-per-node=%s",
+                    j,
+                    base,
+                )
+                return base
+
+            _logger.info("Level %s: %.1f runs/hour", j, runs_per_hour)
+            throughput[j] = runs_per_hour
+
+        chosen = level_select(throughput, config.EXEC_AUTOTUNE["tolerance"])
+        _logger.info(
+            "Selected --exec-jobs-per-node=%s (default was %s)", chosen, base
+        )
+
+        self.cache_store(
+            key, {"jobs_per_node": chosen, "runs_per_hour": throughput[chosen]}
+        )
+        return chosen
+
+    def cache_key(self) -> str:
+        return "|".join(
+            [
+                socket.gethostname(),
+                str(psutil.cpu_count()),
+                self.cmdopts["engine"],
+                self.cmdopts["execenv"],
+                self.cmdopts["scenario"],
+            ]
+        )
+
+    def cache_load(self) -> dict[str, tp.Any]:
+        if not self.cache_path.exists():
+            return {}
+
+        try:
+            with utils.utf8open(self.cache_path, "r") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            _logger.warning("Ignoring unreadable autotune cache %s", self.cache_path)
+            return {}
+
+    def cache_store(self, key: str, entry: dict[str, tp.Any]) -> None:
+        cache = self.cache_load()
+        cache[key] = entry
+        utils.dir_create_checked(self.cache_path.parent, exist_ok=True)
+        with utils.utf8open(self.cache_path, "w") as f:
+            json.dump(cache, f, indent=2)
+
+    def _calibrate(self, lines: list[str], n_jobs: int) -> tp.Optional[float]:
+        calib_root = self.pathset.scratch_root / "autotune"
+        utils.dir_create_checked(calib_root, exist_ok=True)
+
+        cmdfile = calib_root / f"commands-j{n_jobs}.txt"
+        with utils.utf8open(cmdfile, "w") as f:
+            f.writelines(lines)
+
+        spec = types.ShellCmdSpec(
+            cmd=f'parallel --jobs {n_jobs} --no-notice < "{cmdfile}"',
+            shell=True,
+            wait=True,
+        )
+
+        start = time.time()
+        if not self.shell.run_from_spec(spec):
+            return None
+
+        elapsed = max(time.time() - start, 1e-6)
+        return len(lines) * 3600.0 / elapsed
+
+
+__all__ = ["ConcurrencyTuner", "level_select", "levels_calc"]
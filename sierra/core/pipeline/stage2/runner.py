@@ -11,12 +11,15 @@ import sys
 import datetime
 import logging
 import pathlib
+import typing as tp
 
 # 3rd party packages
 
 # Project packages
 from sierra.core.variables import batch_criteria as bc
 from sierra.core import types, config, engine, utils, batchroot, execenv
+from sierra.core.pipeline.stage2 import telemetry, autotune
+from sierra.core.pipeline import metrics
 import sierra.core.plugin as pm
 
 
@@ -38,7 +41,16 @@ class ExpShell:
         self.procs = []  # type: list[subprocess.Popen]
         self.exec_strict = exec_strict
 
-    def run_from_spec(self, spec: types.ShellCmdSpec) -> bool:
+    def run_from_spec(
+        self,
+        spec: types.ShellCmdSpec,
+        monitor: tp.Optional[telemetry.ProcessTreeMonitor] = None,
+    ) -> bool:
+        """Run a shell command.
+
+        If a ``monitor`` is passed, the process tree of the command is sampled
+        while it runs; only commands which are waited on can be monitored.
+        """
         self.logger.trace("Cmd: %s", spec.cmd)
 
         # We use a special marker at the end of the cmd's output to know when
@@ -58,9 +70,16 @@ class ExpShell:
             self.procs.append(proc)
             return True
 
+        if monitor is not None:
+            monitor.start(proc.pid)
+
         # We use communicate(), not wait() to avoid issues with IO buffers
         # becoming full (e.g., you get deadlocks with wait() regularly).
-        stdout_raw, stderr_raw = proc.communicate()
+        try:
+            stdout_raw, stderr_raw = proc.communicate()
+        finally:
+            if monitor is not None:
+                monitor.stop()
 
         # Update the environment for all commands
         if spec.env:
@@ -188,6 +207,10 @@ class BatchExpRunner:
         now = datetime.datetime.now()
         exec_times_fpath = self.pathset.stat_exec_root / now.strftime("%Y-%m-%e-%H:%M")
 
+        tel = telemetry.BatchTelemetry(
+            self.cmdopts, self.pathset, [e.name for e in exp_all]
+        )
+
         # Start a new process for the experiment shell so pre-run commands have
         # an effect (if they set environment variables, etc.).
         shell = ExpShell(self.cmdopts["exec_strict"])
@@ -203,9 +226,12 @@ class BatchExpRunner:
             configurer = engine.ExpConfigurer(self.cmdopts)
             parallelism_paradigm = configurer.parallelism_paradigm()
 
+        if self.cmdopts.get("exec_autotune", False) and exp_to_run:
+            self._autotune(shell, parallelism_paradigm, exp_to_run[0], exp_all)
+
         if parallelism_paradigm == "per-batch":
             ParallelRunner(
-                self.pathset, self.cmdopts, exec_times_fpath, exp_all, shell
+                self.pathset, self.cmdopts, exec_times_fpath, exp_all, shell, tel
             )(exp_to_run)
 
         else:
@@ -234,6 +260,7 @@ class BatchExpRunner:
                     exec_times_fpath,
                     execenv_generator,
                     shell,
+                    tel,
                 )
                 runner(exp.name, exp_num)
 
@@ -245,6 +272,53 @@ class BatchExpRunner:
                 for spec in engine_generator.post_exp_cmds():
                     shell.run_from_spec(spec)
 
+        tel.finalize(exec_times_fpath.name)
+
+    def _autotune(
+        self,
+        shell: ExpShell,
+        parallelism_paradigm: str,
+        first_exp: pathlib.Path,
+        exp_all: list[pathlib.Path],
+    ) -> None:
+        if self.cmdopts["execenv"] not in ["hpc.local", "hpc.slurm", "hpc.pbs"]:
+            self.logger.warning(
+                "--exec-autotune only supported when runs execute on the node "
+                "SIERRA is running on; not tuning for --execenv=%s",
+                self.cmdopts["execenv"],
+            )
+            return
+
+        stem = config.GNU_PARALLEL["cmdfile_stem"]
+        ext = config.GNU_PARALLEL["cmdfile_ext"]
+
+        # Calibration runs need the same environment as the real runs, so the
+        # {execenv, engine}-specific setup/cleanup cmds are run around them in
+        # the same order.
+        if parallelism_paradigm == "per-batch":
+            cmdfile = (self.pathset.root / stem).with_suffix(ext)
+            execenv_batch = execenv.BatchShellCmdsGenerator(self.cmdopts)
+            engine_batch = engine.BatchShellCmdsGenerator(self.cmdopts)
+            pre = execenv_batch.pre_batch_cmds() + engine_batch.pre_batch_cmds()
+            post = execenv_batch.post_batch_cmds() + engine_batch.post_batch_cmds()
+        else:
+            cmdfile = (first_exp / stem).with_suffix(ext)
+            exp_num = exp_all.index(first_exp)
+            execenv_exp = execenv.ExpShellCmdsGenerator(self.cmdopts, exp_num)
+            engine_exp = engine.ExpShellCmdsGenerator(self.cmdopts, exp_num)
+            pre = execenv_exp.pre_exp_cmds() + engine_exp.pre_exp_cmds()
+            post = execenv_exp.post_exp_cmds() + engine_exp.post_exp_cmds()
+
+        for spec in pre:
+            shell.run_from_spec(spec)
+
+        tuner = autotune.ConcurrencyTuner(self.cmdopts, self.pathset, shell)
+        try:
+            self.cmdopts["exec_jobs_per_node"] = tuner(cmdfile)
+        finally:
+            for spec in post:
+                shell.run_from_spec(spec)
+
 
 class SequentialRunner:
     """
@@ -262,11 +336,13 @@ class SequentialRunner:
         exec_times_fpath: pathlib.Path,
         generator: execenv.ExpShellCmdsGenerator,
         shell: ExpShell,
+        tel: tp.Optional[telemetry.BatchTelemetry] = None,
     ) -> None:
 
         self.exec_times_fpath = exec_times_fpath
         self.shell = shell
         self.generator = generator
+        self.telemetry = tel
         self.cmdopts = cmdopts
         self.pathset = pathset
         self.logger = logging.getLogger(__name__)
@@ -306,7 +382,12 @@ class SequentialRunner:
         }
 
         for spec in self.generator.exec_exp_cmds(exec_opts):
-            if not self.shell.run_from_spec(spec):
+            monitor = self.telemetry.monitor(exp_name) if self.telemetry else None
+            ok = self.shell.run_from_spec(spec, monitor)
+            if self.telemetry:
+                self.telemetry.collect(monitor)
+
+            if not ok:
                 self.logger.error(
                     "Check outputs in %s for full details",
                     exec_opts["exp_scratch_root"],
@@ -315,6 +396,7 @@ class SequentialRunner:
         elapsed = int(time.time() - start)
         sec = datetime.timedelta(seconds=elapsed)
         self.logger.info("Per-exp%s elapsed time: %s", exp_num, sec)
+        metrics.add(exp_name, wall_secs=time.time() - start)
 
         with utils.utf8open(self.exec_times_fpath, "a") as f:
             f.write("exp" + str(exp_num) + ": " + str(sec) + "\n")
@@ -334,11 +416,13 @@ class ParallelRunner:
         exec_times_fpath: pathlib.Path,
         exp_all: list[pathlib.Path],
         shell: ExpShell,
+        tel: tp.Optional[telemetry.BatchTelemetry] = None,
     ) -> None:
 
         self.exec_times_fpath = exec_times_fpath
         self.shell = shell
         self.exp_all = exp_all
+        self.telemetry = tel
         self.cmdopts = cmdopts
         self.pathset = pathset
         self.logger = logging.getLogger(__name__)
@@ -378,7 +462,12 @@ class ParallelRunner:
             self.shell.run_from_spec(spec)
 
         for spec in execenv_generator.exec_batch_cmds(exec_opts):
-            if not self.shell.run_from_spec(spec):
+            monitor = self.telemetry.monitor() if self.telemetry else None
+            ok = self.shell.run_from_spec(spec, monitor)
+            if self.telemetry:
+                self.telemetry.collect(monitor)
+
+            if not ok:
                 self.logger.error(
                     "Check outputs in %s for full details",
                     exec_opts["batch_scratch_root"],
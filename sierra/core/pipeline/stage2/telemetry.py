@@ -0,0 +1,381 @@
+# Copyright 2026 John Harwell, All rights reserved.
+#
+#  SPDX-License-Identifier: MIT
+"""Per-run resource telemetry for :term:`Experimental Runs <Experimental Run>`.
+
+During stage 2 the commands which actually execute runs (usually GNU parallel)
+are launched from :class:`~sierra.core.pipeline.stage2.runner.ExpShell`, via a
+shell. Each direct child of GNU parallel is a single run (it spawns one shell
+per line in the commands file), so by periodically walking the process tree
+rooted at each of its children we can attribute CPU, memory, and I/O usage to
+individual runs without any cooperation from the :term:`Engine`.
+
+Runs executed on remote hosts (e.g., via ssh) can only be observed from the
+local side of the connection; wall time is still accurate, but CPU/memory/I/O
+reflect the local ssh client only.
+"""
+
+# Core packages
+import re
+import threading
+import time
+import logging
+import pathlib
+import typing as tp
+from dataclasses import dataclass, field
+
+# 3rd party packages
+import psutil
+import polars as pl
+
+# Project packages
+from sierra.core import types, storage, utils, batchroot, config
+
+_logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RunTelemetry:
+    """Resource usage accumulated for a single :term:`Experimental Run`.
+
+    ``cpu_secs``, ``read_bytes``, and ``write_bytes`` are tracked per-process
+    and summed when the run finishes, because processes in the run's tree can
+    exit (and take their counters with them) between samples.
+    """
+
+    exp: str
+    run: str
+    cmd: str
+    start: float
+    end: float
+    cpu_percent_max: float = 0.0
+    rss_peak: int = 0
+    proc_cpu_secs: dict[int, float] = field(default_factory=dict)
+    proc_read_bytes: dict[int, int] = field(default_factory=dict)
+    proc_write_bytes: dict[int, int] = field(default_factory=dict)
+
+    @property
+    def wall_secs(self) -> float:
+        return max(self.end - self.start, 0.0)
+
+    @property
+    def cpu_secs(self) -> float:
+        return sum(self.proc_cpu_secs.values())
+
+    @property
+    def read_bytes(self) -> int:
+        return sum(self.proc_read_bytes.values())
+
+    @property
+    def write_bytes(self) -> int:
+        return sum(self.proc_write_bytes.values())
+
+    @property
+    def cpu_percent_mean(self) -> float:
+        if self.wall_secs == 0:
+            return 0.0
+        return 100.0 * self.cpu_secs / self.wall_secs
+
+
+class ProcessTreeMonitor:
+    """Sample the process tree rooted at a single shell command.
+
+    Sampling happens in a background thread, so that it can proceed while
+    :class:`~sierra.core.pipeline.stage2.runner.ExpShell` blocks waiting for the
+    command to finish.
+
+    Attributes:
+        interval: Seconds between samples.
+
+        exp_names: Names of all experiments which could be running under the
+                   monitored process. Used to attribute runs to experiments when
+                   more than one experiment executes concurrently (i.e.,
+                   ``per-batch`` parallelism).
+
+        default_exp: Experiment to attribute runs to if the experiment cannot
+                     be determined from the run's command line.
+    """
+
+    _RUN_RE = re.compile(r"_run(\d+)")
+
+    def __init__(
+        self,
+        interval: float,
+        exp_names: list[str],
+        default_exp: tp.Optional[str] = None,
+    ) -> None:
+        self.interval = interval
+        self.exp_names = exp_names
+        self.default_exp = default_exp
+        self.runs = {}  # type: dict[int, RunTelemetry]
+
+        self._procs = {}  # type: dict[int, psutil.Process]
+        self._stop = threading.Event()
+        self._thread = None  # type: tp.Optional[threading.Thread]
+        self._root = None  # type: tp.Optional[psutil.Process]
+        self._launcher = None  # type: tp.Optional[psutil.Process]
+
+    def start(self, pid: int) -> None:
+        """Start sampling the process tree rooted at ``pid``."""
+        try:
+            self._root = psutil.Process(pid)
+        except psutil.NoSuchProcess:
+            return
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> list[RunTelemetry]:
+        """Stop sampling and return telemetry for all observed runs."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+        return list(self.runs.values())
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            self.sample()
+            self._stop.wait(self.interval)
+
+    def sample(self) -> None:
+        """Take one sample of all runs currently executing."""
+        assert self._root is not None
+
+        now = time.time()
+        try:
+            children = self._find_launcher().children(recursive=False)
+        except psutil.NoSuchProcess:
+            return
+
+        for child in children:
+            if child.pid not in self.runs:
+                self.runs[child.pid] = self._new_run(child, now)
+
+            run = self.runs[child.pid]
+            run.end = now
+
+            try:
+                tree = [child, *child.children(recursive=True)]
+            except psutil.NoSuchProcess:
+                continue
+
+            cpu_percent = 0.0
+            rss = 0
+            for p in tree:
+                proc = self._procs.setdefault(p.pid, p)
+                try:
+                    with proc.oneshot():
+                        cpu_percent += proc.cpu_percent(interval=None)
+                        rss += proc.memory_info().rss
+                        times = proc.cpu_times()
+                        run.proc_cpu_secs[proc.pid] = times.user + times.system
+                        self._sample_io(proc, run)
+                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                    continue
+
+            run.cpu_percent_max = max(run.cpu_percent_max, cpu_percent)
+            run.rss_peak = max(run.rss_peak, rss)
+
+    def _find_launcher(self) -> psutil.Process:
+        """Find the process which runs are launched from.
+
+        This is GNU parallel, which is usually not the monitored process
+        itself, but a child of the shell it is run in. If GNU parallel isn't
+        running (yet), runs are taken to be the direct children of the
+        monitored process.
+        """
+        assert self._root is not None
+
+        if self._launcher is not None:
+            return self._launcher
+
+        for proc in [self._root, *self._root.children(recursive=True)]:
+            try:
+                cmdline = proc.cmdline()
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                continue
+
+            # GNU parallel is a perl script, so it can show up as either
+            # "parallel ..." or "perl /usr/bin/parallel ...".
+            if any(pathlib.PurePath(arg).name == "parallel" for arg in cmdline[:2]):
+                # It may have been sampled as a run before it exec()ed
+                self.runs.pop(proc.pid, None)
+                self._launcher = proc
+                return proc
+
+        return self._root
+
+    @staticmethod
+    def _sample_io(proc: psutil.Process, run: RunTelemetry) -> None:
+        # Not available on OSX
+        if not hasattr(proc, "io_counters"):
+            return
+
+        io = proc.io_counters()
+        run.proc_read_bytes[proc.pid] = io.read_bytes
+        run.proc_write_bytes[proc.pid] = io.write_bytes
+
+    def _new_run(self, child: psutil.Process, now: float) -> RunTelemetry:
+        try:
+            cmd = " ".join(child.cmdline())
+            start = child.create_time()
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            cmd = ""
+            start = now
+
+        exp = next((e for e in self.exp_names if f"/{e}/" in cmd), self.default_exp)
+        res = self._RUN_RE.search(cmd)
+        run = f"run{res.group(1)}" if res else f"pid{child.pid}"
+
+        return RunTelemetry(
+            exp=exp or "",
+            run=run,
+            cmd=cmd,
+            start=start,
+            end=now,
+        )
+
+
+class BatchTelemetry:
+    """Collect per-run telemetry across a :term:`Batch Experiment`.
+
+    Results are written to a single table in ``<batchroot>/statistics/exec``
+    and summarized on stdout at the end of stage 2.
+    """
+
+    def __init__(
+        self, cmdopts: types.Cmdopts, pathset: batchroot.PathSet, exp_names: list[str]
+    ) -> None:
+        self.enabled = cmdopts["exec_telemetry"]
+        self.interval = cmdopts["exec_telemetry_interval"]
+        self.pathset = pathset
+        self.exp_names = exp_names
+        self.runs = []  # type: list[RunTelemetry]
+
+    def monitor(
+        self, exp_name: tp.Optional[str] = None
+    ) -> tp.Optional[ProcessTreeMonitor]:
+        """Get a monitor for the next shell command, if telemetry is enabled."""
+        if not self.enabled:
+            return None
+
+        return ProcessTreeMonitor(self.interval, self.exp_names, exp_name)
+
+    def collect(self, monitor: tp.Optional[ProcessTreeMonitor]) -> None:
+        if monitor is not None:
+            self.runs.extend(monitor.runs.values())
+
+    def to_df(self) -> pl.DataFrame:
+        return pl.DataFrame(
+            {
+                "exp": [r.exp for r in self.runs],
+                "run": [r.run for r in self.runs],
+                "start": [r.start for r in self.runs],
+                "wall_secs": [r.wall_secs for r in self.runs],
+                "cpu_secs": [r.cpu_secs for r in self.runs],
+                "cpu_percent_mean": [r.cpu_percent_mean for r in self.runs],
+                "cpu_percent_max": [r.cpu_percent_max for r in self.runs],
+                "rss_peak": [r.rss_peak for r in self.runs],
+                "read_bytes": [r.read_bytes for r in self.runs],
+                "write_bytes": [r.write_bytes for r in self.runs],
+            },
+            schema={
+                "exp": pl.String,
+                "run": pl.String,
+                "start": pl.Float64,
+                "wall_secs": pl.Float64,
+                "cpu_secs": pl.Float64,
+                "cpu_percent_mean": pl.Float64,
+                "cpu_percent_max": pl.Float64,
+                "rss_peak": pl.Int64,
+                "read_bytes": pl.Int64,
+                "write_bytes": pl.Int64,
+            },
+        )
+
+    def finalize(self, stem: str) -> tp.Optional[pathlib.Path]:
+        """Write the telemetry table and log a summary.
+
+        The table is written as parquet, so that it keeps its column types and
+        can be analyzed with the same tools as other columnar outputs.
+
+        Returns the path to the written table, or None if nothing was
+        collected.
+        """
+        if not self.enabled:
+            return None
+
+        if not self.runs:
+            _logger.warning("No run telemetry collected during stage 2")
+            return None
+
+        df = self.to_df()
+        ext = config.STORAGE_EXT["parquet"]
+        opath = self.pathset.stat_exec_root / f"{stem}-telemetry{ext}"
+        utils.dir_create_checked(opath.parent, exist_ok=True)
+        storage.df_write(df, opath, "storage.parquet")
+        _logger.info(
+            "Run telemetry written to <batchroot>/%s",
+            opath.relative_to(self.pathset.root),
+        )
+
+        _log_summary(df)
+        return opath
+
+
+def _log_summary(df: pl.DataFrame, n_slowest: int = 5) -> None:
+    slowest = df.sort("wall_secs", descending=True).head(n_slowest)
+    _logger.info(
+        "Slowest runs:\n%s",
+        "\n".join(
+            f"  {r['exp']}/{r['run']}: {r['wall_secs']:.1f}s, "
+            f"cpu={r['cpu_percent_mean']:.0f}%, rss={_fmt_bytes(r['rss_peak'])}"
+            for r in slowest.iter_rows(named=True)
+        ),
+    )
+
+    peak = df.sort("rss_peak", descending=True).row(0, named=True)
+    _logger.info(
+        "Memory high-water: %s (%s/%s)",
+        _fmt_bytes(peak["rss_peak"]),
+        peak["exp"],
+        peak["run"],
+    )
+
+    per_exp = (
+        df.with_columns((pl.col("start") + pl.col("wall_secs")).alias("end"))
+        .group_by("exp")
+        .agg(
+            pl.len().alias("n_runs"),
+            pl.col("start").min(),
+            pl.col("end").max(),
+            pl.col("cpu_percent_mean").mean(),
+            pl.col("rss_peak").max(),
+        )
+        .sort("exp")
+    )
+    lines = []
+    for r in per_exp.iter_rows(named=True):
+        span = max(r["end"] - r["start"], 1e-6)
+        lines.append(
+            f"  {r['exp']}: {r['n_runs']} runs, "
+            f"{r['n_runs'] * 3600.0 / span:.1f} runs/hour, "
+            f"cpu={r['cpu_percent_mean']:.0f}%/run, "
+            f"rss={_fmt_bytes(r['rss_peak'])}/run"
+        )
+    _logger.info("Per-experiment throughput:\n%s", "\n".join(lines))
+
+
+def _fmt_bytes(n: float) -> str:
+    for unit in ["B", "KiB", "MiB", "GiB"]:
+        if abs(n) < 1024.0:
+            return f"{n:.1f}{unit}"
+        n /= 1024.0
+
+    return f"{n:.1f}TiB"
+
+
+__all__ = ["BatchTelemetry", "ProcessTreeMonitor", "RunTelemetry"]
@@ -9,6 +9,8 @@ Classes for gathering :term:`Raw Output Data`  files in a batch.
 # Core packages
 import re
 import multiprocessing as mp
+import multiprocessing.managers
+import contextlib
 import typing as tp
 import time
 import datetime
@@ -20,7 +22,7 @@ import psutil
 import polars as pl
 
 # Project packages
-from sierra.core import types, utils, storage
+from sierra.core import types, utils, storage, profiling, config
 
 
 class GatherSpec:
@@ -38,6 +40,10 @@ class GatherSpec:
          collate-col: The name of the column associated with the file, as
                       configured. Will be None for statistics generation, and
                       non-None for collation.
+
+         cols: The columns to read from the file; see
+               :func:`~sierra.core.storage.df_read`. ``None`` reads all of
+               them.
     """
 
     def __init__(
@@ -45,10 +51,12 @@ class GatherSpec:
         exp_name: str,
         item_stem_path: pathlib.Path,
         collate_col: tp.Union[str, None],
+        cols: tp.Optional[list[str]] = None,
     ):
         self.exp_name = exp_name
         self.item_stem_path = item_stem_path
         self.collate_col = collate_col
+        self.cols = cols
 
     def __repr__(self) -> str:
         return f"{self.exp_name}: {self.item_stem_path}"
@@ -63,14 +71,131 @@ class ProcessSpec:
 
         exp_run_names: The names of the parent experimental runs.
 
-        dfs: The gathered dataframes. Indices match those in ``exp_run_names``.
+        run_output_roots: The output root of each run.
+
+        paths: The gathered file from each run. Indices match those in
+               ``exp_run_names`` and ``run_output_roots``.
+
+        footprint: The estimated # bytes of memory needed to process the
+                   gathered files; see :class:`MemoryBudget`.
+
+    .. versionchanged:: 1.5.9
 
+       ``dfs`` contains lazy scans instead of dataframes, which are created
+       from ``paths`` when they are processed.
     """
 
-    def __init__(self, gather: GatherSpec) -> None:
+    def __init__(self, gather: GatherSpec, medium: str) -> None:
         self.gather = gather
+        self.medium = medium
         self.exp_run_names = []  # type: tp.List[str]
-        self.dfs = []  # type: tp.List[pl.DataFrame]
+        self.run_output_roots = []  # type: tp.List[pathlib.Path]
+        self.paths = []  # type: tp.List[pathlib.Path]
+        self.footprint = 0
+        self._dfs = None  # type: tp.Optional[tp.List[pl.LazyFrame]]
+
+    @property
+    def dfs(self) -> list[pl.LazyFrame]:
+        """Get lazy scans of the gathered files.
+
+        Files are only read when the scans are collected, unless the
+        ``--storage`` plugin can't scan lazily, in which case they are read
+        here.
+        """
+        if self._dfs is None:
+            self._dfs = [
+                storage.df_scan(
+                    path, self.medium, columns=self.gather.cols, run_output_root=run
+                )
+                for run, path in zip(self.run_output_roots, self.paths)
+            ]
+
+        return self._dfs
+
+    def __getstate__(self) -> dict:
+        # Scans are re-created in the process which reads them
+        return {**self.__dict__, "_dfs": None}
+
+
+class MemoryBudget:
+    """Admission control for processing gathered files within a memory budget.
+
+    The budget is ``--processing-mem-limit`` percent of the total memory on
+    the SIERRA host machine, capped at the memory available when it is
+    created, and is shared by all workers in a pool. Each gathered item is
+    admitted for processing once its :attr:`ProcessSpec.footprint` fits in
+    what is left of the budget. Items larger than the whole budget are admitted
+    alone once everything else has finished, and are streamed by polars in
+    bounded memory as best it can; no other items are admitted until they
+    finish, so they can't be starved by smaller items.
+
+    Waiting workers sleep until memory is released back to the budget, rather
+    than polling, and the budget only depends on what SIERRA has admitted, so
+    other processes on the machine can't stall it.
+
+    .. versionadded:: 1.5.9
+    """
+
+    def __init__(
+        self, manager: multiprocessing.managers.SyncManager, mem_limit: int
+    ) -> None:
+        mem = psutil.virtual_memory()
+        self.capacity = int(min(mem.total * mem_limit / 100, mem.available))
+        self._cv = manager.Condition()
+        self._in_use = manager.Value("q", 0)
+        self._solo = manager.Value("b", False)
+
+    @contextlib.contextmanager
+    def admit(self, footprint: int) -> tp.Iterator[None]:
+        """Wait until an item fits in the budget, and hold its memory."""
+        reserved = self._acquire(footprint)
+        try:
+            yield
+        finally:
+            self._release(reserved)
+
+    def _acquire(self, footprint: int) -> int:
+        with self._cv:
+            if footprint >= self.capacity:
+                # Stop admitting anything else, and wait for everything
+                # already admitted to finish.
+                while self._solo.value:
+                    self._cv.wait()
+                self._solo.value = True
+
+                while self._in_use.value > 0:
+                    self._cv.wait()
+
+                footprint = self.capacity
+            else:
+                while (
+                    self._solo.value or self._in_use.value + footprint > self.capacity
+                ):
+                    self._cv.wait()
+
+            self._in_use.value += footprint
+            return footprint
+
+    def _release(self, reserved: int) -> None:
+        with self._cv:
+            self._in_use.value -= reserved
+            if reserved >= self.capacity:
+                self._solo.value = False
+
+            self._cv.notify_all()
+
+
+def footprint(path: pathlib.Path, n_cols: int, n_selected: int) -> int:
+    """Estimate the memory needed to process a gathered file.
+
+    This is the size of the file on disk, scaled by how much bigger the format
+    is in memory than on disk, and by the fraction of its columns which are
+    read.
+
+    .. versionadded:: 1.5.9
+    """
+    inflation = config.MEM_INFLATION.get(path.suffix, config.MEM_INFLATION["default"])
+    return int(path.stat().st_size * inflation * n_selected / max(1, n_cols))
 
 
 class BaseGatherer:
@@ -79,6 +204,11 @@ class BaseGatherer:
     "Gathering" in this context means creating a dictionary mapping which files
     came from where, so that later processing can be both across and within
     experiments in the batch.
+
+    Only the paths to gathered files and their estimated memory footprint are
+    sent for processing, so nothing is actually read until the files are
+    processed (see :class:`MemoryBudget`), and only the columns in
+    :attr:`GatherSpec.cols` are read then.
     """
 
     def __init__(
@@ -123,19 +253,28 @@ class BaseGatherer:
             "run output dirs"
         )
 
-        to_gather = []
+        # Each item is gathered from all runs at once, so each item only needs
+        # to be gathered once, even though it is (usually) present in every
+        # run. Items are calculated for all runs in case some runs are missing
+        # outputs.
+        to_gather = {}  # type: dict[tuple, GatherSpec]
         for run in runs:
             from_run = self.calc_gather_items(run, exp_output_root.name)
             self.logger.trace(
                 "Calculated %s items from %s for gathering", len(from_run), run.name
             )
-            to_gather.extend(from_run)
+            for spec in from_run:
+                to_gather.setdefault((spec.item_stem_path, spec.collate_col), spec)
         self.logger.trace("Gathering all items...")
 
-        for spec in to_gather:
-            self._wait_for_memory()
-            to_process = self._gather_item_from_runs(exp_output_root, spec, runs)
-            n_gathered_from = len(to_process.dfs)
+        for spec in to_gather.values():
+            with profiling.span(
+                "gather",
+                exp=exp_output_root.name,
+                item=spec.item_stem_path.as_posix(),
+            ):
+                to_process = self._gather_item_from_runs(exp_output_root, spec, runs)
+            n_gathered_from = len(to_process.paths)
             if n_gathered_from != len(runs):
                 self.logger.warning(
                     (
@@ -163,18 +302,33 @@ class BaseGatherer:
         spec: GatherSpec,
         runs: list[pathlib.Path],
     ) -> ProcessSpec:
-        to_process = ProcessSpec(gather=spec)
+        medium = self.gather_opts["storage"]
+        to_process = ProcessSpec(gather=spec, medium=medium)
+
+        # Schemas are only read here if they can be scanned cheaply; otherwise
+        # the whole file would be read, and all columns are assumed to be
+        # needed.
+        lazy = storage.supports_scan(medium)
 
         for _, run in enumerate(runs):
             path = run / self.run_metrics_leaf / spec.item_stem_path
-            if path.exists() and path.stat().st_size > 0:
-                df = storage.df_read(
-                    path,
-                    self.gather_opts["storage"],
-                    run_output_root=run,
+            if not path.exists() or path.stat().st_size == 0:
+                continue
+
+            n_cols = n_selected = 1
+            if lazy:
+                file_schema = storage.schema(
+                    storage.df_scan(path, medium, run_output_root=run)
                 )
+                selected = {
+                    col: dtype
+                    for col, dtype in file_schema.items()
+                    if spec.cols is None or col in spec.cols
+                }
+                n_cols, n_selected = len(file_schema), len(selected)
+
                 if nonumeric := [
-                    col for col in df.columns if not df[col].dtype.is_numeric()
+                    col for col, dtype in selected.items() if not dtype.is_numeric()
                 ]:
                     self.logger.warning(
                         "Non-numeric columns only support mean aggregation via mode(): %s from %s",
@@ -182,29 +336,16 @@ class BaseGatherer:
                         path.relative_to(exp_output_root),
                     )
 
-                # Indices here must match so that the appropriate data from each
-                # run are matched with the name of the run in collated
-                # performance data.
-                to_process.exp_run_names.append(run.name)
-                to_process.dfs.append(df)
+            # Indices here must match so that the appropriate data from each
+            # run are matched with the name of the run in collated
+            # performance data.
+            to_process.exp_run_names.append(run.name)
+            to_process.run_output_roots.append(run)
+            to_process.paths.append(path)
+            to_process.footprint += footprint(path, n_cols, n_selected)
 
         return to_process
 
-    def _wait_for_memory(self) -> None:
-        while True:
-            mem = psutil.virtual_memory()
-            avail = mem.available / mem.total
-            free_percent = avail * 100
-            free_limit = 100 - self.gather_opts["processing_mem_limit"]
-
-            if free_percent >= free_limit:
-                return
-
-            self.logger.info(
-                "Waiting for memory: avail=%s%%,min=%s%%", free_percent, free_limit
-            )
-            time.sleep(1)
-
     def _verify_exp_outputs(self, exp_output_root: pathlib.Path) -> None:
         """
         Verify the integrity of all runs in an experiment.
@@ -319,4 +460,4 @@ class BaseGatherer:
                 ), f"Not all columns from {path1} and {path2} have the same length"
 
 
-__all__ = ["BaseGatherer", "GatherSpec"]
+__all__ = ["BaseGatherer", "GatherSpec", "MemoryBudget", "ProcessSpec", "footprint"]
@@ -13,8 +13,9 @@ import logging
 
 # Project packages
 import sierra.core.variables.batch_criteria as bc
-from sierra.core import types, batchroot
+from sierra.core import types, batchroot, profiling
 import sierra.core.plugin as pm
+from sierra.core.pipeline import metrics
 
 
 class PipelineStage3:
@@ -60,9 +61,10 @@ class PipelineStage3:
             )
 
             start = time.time()
-            module.proc_batch_exp(
-                self.main_config, self.cmdopts, self.pathset, criteria
-            )
+            with profiling.span(s, cat="plugin"), metrics.measure(3, s):
+                module.proc_batch_exp(
+                    self.main_config, self.cmdopts, self.pathset, criteria
+                )
             elapsed = int(time.time() - start)
             sec = datetime.timedelta(seconds=elapsed)
             self.logger.info("Processing with %s complete in %s", s, str(sec))
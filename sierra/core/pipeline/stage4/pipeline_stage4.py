@@ -16,7 +16,8 @@ import pathlib
 import sierra.core.variables.batch_criteria as bc
 
 import sierra.core.plugin as pm
-from sierra.core import types, batchroot
+from sierra.core import types, batchroot, profiling
+from sierra.core.pipeline import metrics
 
 
 class PipelineStage4:
@@ -82,9 +83,10 @@ class PipelineStage4:
             )
 
             start = time.time()
-            module.proc_batch_exp(
-                self.main_config, self.cmdopts, self.pathset, criteria
-            )
+            with profiling.span(s, cat="plugin"), metrics.measure(4, s):
+                module.proc_batch_exp(
+                    self.main_config, self.cmdopts, self.pathset, criteria
+                )
             elapsed = int(time.time() - start)
             sec = datetime.timedelta(seconds=elapsed)
             self.logger.info("Generation with %s complete in %s", s, str(sec))
@@ -13,8 +13,9 @@ import argparse
 # 3rd party packages
 
 # Project packages
-from sierra.core import types
+from sierra.core import types, profiling
 import sierra.core.plugin as pm
+from sierra.core.pipeline import metrics
 
 
 class PipelineStage5:
@@ -53,7 +54,8 @@ class PipelineStage5:
             )
 
             start = time.time()
-            module.proc_exps(self.main_config, self.cmdopts, cli_args)
+            with profiling.span(s, cat="plugin"), metrics.measure(5, s):
+                module.proc_exps(self.main_config, self.cmdopts, cli_args)
             elapsed = int(time.time() - start)
             sec = datetime.timedelta(seconds=elapsed)
             self.logger.info("Processing with %s complete in %s", s, str(sec))
@@ -13,6 +13,7 @@ import importlib.util
 import importlib
 import typing as tp
 import sys
+import os
 import logging
 import pathlib
 import inspect
@@ -23,11 +24,20 @@ import inspect
 import json
 
 # Project packages
-from sierra.core import types
+from sierra.core import types, config
+
+# Bump when the layout of the plugin index changes.
+_INDEX_VERSION = 1
 
 
 class BasePluginManager:
-    """Base class for common functionality."""
+    """Base class for common functionality.
+
+    Plugins are loaded (i.e., their python modules are executed) on demand:
+    the first time a plugin is requested via :meth:`get_plugin` or
+    :meth:`get_plugin_module`, it is loaded if it is available but hasn't been
+    loaded yet, so only plugins which are actually used are ever imported.
+    """
 
     def __init__(self) -> None:
         self.logger = logging.getLogger(__name__)
@@ -50,35 +60,23 @@ class BasePluginManager:
             )
             raise RuntimeError(f"Cannot locate plugin '{name}'")
 
-        init = importlib.util.module_from_spec(plugins[name]["init_spec"])
-        plugins[name]["init_spec"].loader.exec_module(init)
+        plugin_type = plugins[name]["type"]
 
-        if not hasattr(init, "sierra_plugin_type"):
+        if plugin_type is None:
             self.logger.warning(
                 "Cannot load plugin %s: __init__.py does not define sierra_plugin_type()",
                 name,
             )
             return
 
-        plugin_type = init.sierra_plugin_type()
-
         # The name of the module is only needed for pipeline plugins, not
         # project plugins.
-        if plugins[name]["module_spec"] is None and plugin_type == "pipeline":
-            if not hasattr(init, "sierra_plugin_module"):
-                self.logger.warning(
-                    "Cannot load plugin %s: __init__.py does not define sierra_plugin_module()",
-                    name,
-                )
-                return
-
-            modname = init.sierra_plugin_module()
-            fpath = (
-                plugins[name]["parent_dir"] / name.replace(".", "/") / f"{modname}.py"
-            )
-            plugins[name]["module_spec"] = importlib.util.spec_from_file_location(
-                modname, fpath
+        if plugins[name]["module_path"] is None and plugin_type == "pipeline":
+            self.logger.warning(
+                "Cannot load plugin %s: __init__.py does not define sierra_plugin_module()",
+                name,
             )
+            return
 
         if plugin_type == "pipeline":
             self._load_pipeline_plugin(name)
@@ -86,7 +84,7 @@ class BasePluginManager:
         elif plugin_type == "project":
             self._load_project_plugin(name)
         elif plugin_type == "model":
-            if not hasattr(init, "sierra_models"):
+            if not plugins[name]["models"]:
                 self.logger.warning(
                     "Cannot load plugin %s: __init__.py does not define sierra_models()",
                     name,
@@ -100,6 +98,7 @@ class BasePluginManager:
             )
 
     def get_plugin(self, name: str) -> dict:
+        self._load_on_demand(name)
         try:
             return self.loaded[name]
         except KeyError:
@@ -111,6 +110,7 @@ class BasePluginManager:
             raise
 
     def get_plugin_module(self, name: str) -> types.ModuleType:
+        self._load_on_demand(name)
         try:
             return self.loaded[name]["module"]
         except KeyError:
@@ -122,24 +122,44 @@ class BasePluginManager:
             raise
 
     def has_plugin(self, name: str) -> bool:
-        return name in self.loaded
+        """Check if a plugin is loaded, or can be loaded on demand."""
+        return name in self.loaded or name in self.available_plugins()
 
-    def _load_pipeline_plugin(self, name: str) -> None:
-        if name in self.loaded:
-            self.logger.warning("Pipeline plugin %s already loaded", name)
-            return
+    def has_cmdline(self, name: str) -> bool:
+        """Check if a plugin might define a cmdline.
 
-        plugins = self.available_plugins()
+        This is False only if the plugin is known to *not* have a
+        ``cmdline.py``, so that it doesn't need to be imported to find out.
+        """
+        plugin = self.available_plugins().get(name)
+        return plugin is None or plugin["cmdline"]
 
+    def _load_on_demand(self, name: str) -> None:
+        if name not in self.loaded and name in self.available_plugins():
+            self.logger.debug("Loading plugin %s on demand", name)
+            self.load_plugin(name)
+
+    def _sys_path_update(self, name: str) -> None:
         # The parent directory of the plugin must be on sys.path so it can be
         # imported, so we put in on there if it isn't.
-        new = str(plugins[name]["parent_dir"])
+        new = str(self.available_plugins()[name]["parent_dir"])
         if new not in sys.path:
             sys.path = [new, *sys.path[0:]]
             self.logger.debug("Updated sys.path with %s", [new])
 
-        module = importlib.util.module_from_spec(plugins[name]["module_spec"])
-        plugins[name]["module_spec"].loader.exec_module(module)
+    def _load_pipeline_plugin(self, name: str) -> None:
+        if name in self.loaded:
+            self.logger.warning("Pipeline plugin %s already loaded", name)
+            return
+
+        plugins = self.available_plugins()
+        self._sys_path_update(name)
+
+        spec = importlib.util.spec_from_file_location(
+            plugins[name]["module_name"], plugins[name]["module_path"]
+        )
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
 
         # When importing with importlib, the module is not automatically added
         # to sys.modules. This means that trying to pickle anything in it will
@@ -152,7 +172,7 @@ class BasePluginManager:
             sys.modules[sys_modname] = module
 
         self.loaded[name] = {
-            "spec": plugins[name]["module_spec"],
+            "spec": spec,
             "parent_dir": plugins[name]["parent_dir"],
             "module": module,
             "type": "pipeline",
@@ -170,16 +190,10 @@ class BasePluginManager:
             return
 
         plugins = self.available_plugins()
-
-        # The parent directory of the plugin must be on sys.path so it can be
-        # imported, so we put in on there if it isn't.
-        new = str(plugins[name]["parent_dir"])
-        if new not in sys.path:
-            sys.path = [new, *sys.path[0:]]
-            self.logger.debug("Updated sys.path with %s", [new])
+        self._sys_path_update(name)
 
         self.loaded[name] = {
-            "spec": plugins[name]["module_spec"],
+            "spec": None,
             "parent_dir": plugins[name]["parent_dir"],
             "type": "project",
         }
@@ -197,16 +211,10 @@ class BasePluginManager:
             return
 
         plugins = self.available_plugins()
-
-        # The parent directory of the plugin must be on sys.path so it can be
-        # imported, so we put in on there if it isn't.
-        new = str(plugins[name]["parent_dir"])
-        if new not in sys.path:
-            sys.path = [new, *sys.path[0:]]
-            self.logger.debug("Updated sys.path with %s", [new])
+        self._sys_path_update(name)
 
         self.loaded[name] = {
-            "spec": plugins[name]["module_spec"],
+            "spec": None,
             "parent_dir": plugins[name]["parent_dir"],
             "type": "model",
         }
@@ -220,7 +228,15 @@ class BasePluginManager:
 
 
 class DirectoryPluginManager(BasePluginManager):
-    """Container for managing directory-based plugins."""
+    """Container for managing directory-based plugins.
+
+    Finding plugins requires walking every directory on the search path and
+    executing the ``__init__.py`` of every plugin found, so what is found is
+    cached in an index on disk (see ``config.PLUGIN_INDEX``). The index for a
+    directory on the search path is used as long as the modification times of
+    all directories under it and of each plugin's ``__init__.py`` are
+    unchanged, which catches plugins being added, removed, or renamed.
+    """
 
     def __init__(self) -> None:
         super().__init__()
@@ -230,6 +246,8 @@ class DirectoryPluginManager(BasePluginManager):
         self.logger.debug(
             "Initializing with plugin search path %s", [str(p) for p in search_path]
         )
+        index = _index_load() if config.PLUGIN_INDEX["cache"] else {}
+        stale = False
 
         for path in search_path:
             if not path.exists():
@@ -238,57 +256,145 @@ class DirectoryPluginManager(BasePluginManager):
                 )
                 continue
 
-            self.logger.debug("Searching for plugins in '%s'", path)
-
-            def recursive_search(root: pathlib.Path) -> None:
-                for f in root.iterdir():
-                    if not f.is_dir():
-                        continue
-                    recursive_search(f)
-
-                    plugin = f / "plugin.py"
-                    init = f / "__init__.py"
-                    cookie = f / ".sierraplugin"
-
-                    # 2025-11-24 [JRH]: The cookie is ALWAYS required. We used
-                    # to just recognize a directory containing
-                    # plugin.py+__init__.py as a SIERRA plugin, but that is far
-                    # too generic, and caused conflicts with other python
-                    # packages installed in the same environment.
-                    if not (cookie.exists() and (plugin.exists() or init.exists())):
-                        continue
-
-                    name = f"{f.parent.name}.{f.name}"
-
-                    try:
-                        if plugin.exists():
-                            module_spec = importlib.util.spec_from_file_location(
-                                f.name, plugin
-                            )
-                        else:
-                            module_spec = None
-
-                        init_spec = importlib.util.spec_from_file_location(
-                            "__init__", init
-                        )
-                    except FileNotFoundError:
-                        self.logger.warning(
-                            "Malformed plugin in %s: not loading", f.relative_to(root)
-                        )
-
-                    self.logger.debug("Found plugin in '%s' -> %s", f, name)
-
-                    self.plugins[name] = {
-                        "parent_dir": root.parent,
-                        "module_spec": module_spec,
-                        "init_spec": init_spec,
-                    }
-
-            recursive_search(path)
+            key = str(path.resolve())
+            if key in index and _index_valid(index[key]):
+                self.logger.debug("Using plugin index for '%s'", path)
+            else:
+                self.logger.debug("Searching for plugins in '%s'", path)
+                index[key] = self._search(path)
+                stale = True
+
+            for name, plugin in index[key]["plugins"].items():
+                self.plugins[name] = {
+                    **plugin,
+                    "parent_dir": pathlib.Path(plugin["parent_dir"]),
+                    "module_path": (
+                        pathlib.Path(plugin["module_path"])
+                        if plugin["module_path"]
+                        else None
+                    ),
+                }
+
+        if stale and config.PLUGIN_INDEX["cache"]:
+            _index_store(index)
 
     def available_plugins(self):
         return self.plugins
 
+    def _search(self, path: pathlib.Path) -> dict[str, tp.Any]:
+        mtimes = {}
+        plugins = {}
+
+        def recursive_search(root: pathlib.Path) -> None:
+            mtimes[str(root)] = root.stat().st_mtime_ns
+
+            for f in root.iterdir():
+                if not f.is_dir() or f.name == "__pycache__":
+                    continue
+                recursive_search(f)
+
+                plugin = f / "plugin.py"
+                init = f / "__init__.py"
+                cookie = f / ".sierraplugin"
+
+                # 2025-11-24 [JRH]: The cookie is ALWAYS required. We used
+                # to just recognize a directory containing
+                # plugin.py+__init__.py as a SIERRA plugin, but that is far
+                # too generic, and caused conflicts with other python
+                # packages installed in the same environment.
+                if not (cookie.exists() and (plugin.exists() or init.exists())):
+                    continue
+
+                if not init.exists():
+                    self.logger.warning(
+                        "Malformed plugin in %s: not loading", f.relative_to(root)
+                    )
+                    continue
+
+                name = f"{f.parent.name}.{f.name}"
+                self.logger.debug("Found plugin in '%s' -> %s", f, name)
+                plugins[name] = _plugin_describe(f)
+
+        recursive_search(path)
+        return {"mtimes": mtimes, "plugins": plugins}
+
+
+def _plugin_describe(plugin_dir: pathlib.Path) -> dict[str, tp.Any]:
+    """Describe a plugin for the index by executing its ``__init__.py``."""
+    init_path = plugin_dir / "__init__.py"
+    spec = importlib.util.spec_from_file_location("__init__", init_path)
+    init = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(init)
+
+    module_name = None
+    module_path = None
+    if (plugin_dir / "plugin.py").exists():
+        module_name = plugin_dir.name
+        module_path = str(plugin_dir / "plugin.py")
+    elif hasattr(init, "sierra_plugin_module"):
+        module_name = init.sierra_plugin_module()
+        module_path = str(plugin_dir / f"{module_name}.py")
+
+    return {
+        "parent_dir": str(plugin_dir.parent.parent),
+        "init_path": str(init_path),
+        "init_mtime": init_path.stat().st_mtime_ns,
+        "type": (
+            init.sierra_plugin_type() if hasattr(init, "sierra_plugin_type") else None
+        ),
+        "module_name": module_name,
+        "module_path": module_path,
+        "models": hasattr(init, "sierra_models"),
+        "cmdline": (plugin_dir / "cmdline.py").exists()
+        or (plugin_dir / "cmdline").is_dir(),
+    }
+
+
+def _index_path() -> pathlib.Path:
+    return config.CACHE_ROOT / config.PLUGIN_INDEX["cache_leaf"]
+
+
+def _index_load() -> dict[str, tp.Any]:
+    path = _index_path()
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            index = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+    if index.get("version") != _INDEX_VERSION:
+        return {}
+
+    return index["paths"]
+
+
+def _index_store(paths: dict[str, tp.Any]) -> None:
+    path = _index_path()
+
+    # Write + rename so that concurrent SIERRA invocations never see a partial
+    # index.
+    tmp = path.with_name(f"{path.name}.{os.getpid()}")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump({"version": _INDEX_VERSION, "paths": paths}, f)
+        tmp.replace(path)
+    except OSError as e:
+        logging.debug("Could not write plugin index %s: %s", path, e)
+
+
+def _index_valid(entry: dict[str, tp.Any]) -> bool:
+    try:
+        return all(
+            pathlib.Path(d).stat().st_mtime_ns == mtime
+            for d, mtime in entry["mtimes"].items()
+        ) and all(
+            pathlib.Path(p["init_path"]).stat().st_mtime_ns == p["init_mtime"]
+            for p in entry["plugins"].values()
+        )
+    except OSError:
+        return False
+
 
 def module_exists(name: str) -> bool:
     """
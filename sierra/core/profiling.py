@@ -0,0 +1,327 @@
+# Copyright 2026 John Harwell, All rights reserved.
+#
+#  SPDX-License-Identifier: MIT
+"""
+Profiling/tracing of SIERRA itself, as selected with ``--profile``.
+
+Each pipeline stage is profiled in the main process (see :func:`stage`), and
+each call of a pool worker function (see :func:`worker`) is profiled in the
+process it runs in. When a stage finishes, the profiles from the main process
+and all workers are merged into a single report for the stage in
+``<root>/stageN/``:
+
+- ``cprofile`` - ``merged.prof`` (loadable with :mod:`pstats`, snakeviz, etc.)
+  and ``report.txt`` (the top functions by cumulative time).
+
+- ``pyinstrument`` - ``report.html`` and ``report.txt``. Requires
+  :program:`pyinstrument` to be installed.
+
+- ``trace`` - ``trace.json``: a Chrome/Perfetto trace of the spans (see
+  :func:`span`) in all processes. Open it with https://ui.perfetto.dev or
+  ``chrome://tracing``.
+
+Profiling state is kept in the environment as well as in this module, so that
+worker processes see it regardless of the multiprocessing start method. When
+``--profile`` isn't passed, :func:`span` and :func:`worker` are no-ops.
+"""
+
+# Core packages
+import typing as tp
+import os
+import io
+import json
+import time
+import shutil
+import pathlib
+import logging
+import pstats
+import cProfile
+import functools
+import contextlib
+import threading
+import multiprocessing as mp
+
+# 3rd party packages
+
+# Project packages
+
+_ENV_MODE = "SIERRA_PROFILE"
+_ENV_DIR = "SIERRA_PROFILE_DIR"
+
+_state: dict[str, tp.Any] = {
+    "mode": os.environ.get(_ENV_MODE),
+    "dir": os.environ.get(_ENV_DIR),
+    "root": None,
+    # The profiler active in this process, if any
+    "profiler": None,
+    # (pid, profiler) for worker function calls in this process
+    "worker": None,
+    # (pid, file) for trace events from this process
+    "trace": None,
+}
+
+_F = tp.TypeVar("_F", bound=tp.Callable[..., tp.Any])
+
+_logger = logging.getLogger(__name__)
+
+
+def initialize(mode: tp.Optional[str], root: tp.Optional[pathlib.Path]) -> None:
+    """Select what kind of profiling to do, and where to put the results.
+
+    Args:
+        mode: One of ``cprofile``, ``pyinstrument``, ``trace``, or None to
+              disable profiling.
+
+        root: The directory to put per-stage results in.
+    """
+    if mode == "pyinstrument":
+        try:
+            import pyinstrument  # noqa: PLC0415
+        except ImportError as e:
+            raise RuntimeError(
+                "--profile=pyinstrument requires pyinstrument to be installed"
+            ) from e
+
+    _state["mode"] = mode
+    _state["root"] = root
+
+    if mode is None:
+        os.environ.pop(_ENV_MODE, None)
+    else:
+        os.environ[_ENV_MODE] = mode
+
+
+def enabled() -> bool:
+    return _state["mode"] is not None
+
+
+@contextlib.contextmanager
+def stage(name: str) -> tp.Iterator[None]:
+    """Profile a pipeline stage and everything it runs in worker processes.
+
+    The results from any previous profiling of the stage are removed.
+    """
+    if not enabled():
+        yield
+        return
+
+    stage_dir = _state["root"] / name
+    shutil.rmtree(stage_dir, ignore_errors=True)
+    stage_dir.mkdir(parents=True)
+
+    _state["dir"] = str(stage_dir)
+    os.environ[_ENV_DIR] = str(stage_dir)
+
+    profiler = _new()
+    _start(profiler)
+    try:
+        with span(name, cat="stage"):
+            yield
+    finally:
+        _stop(profiler)
+        _dump(profiler, "main")
+        _trace_close()
+        report = _merge(stage_dir)
+        _state["dir"] = None
+        os.environ.pop(_ENV_DIR, None)
+
+        _logger.info("Profile for %s written to %s", name, report)
+
+
+def span(name: str, cat: str = "sierra", **args: tp.Any) -> tp.ContextManager:
+    """Record a span in the trace, if ``--profile=trace``.
+
+    Args:
+        name: The name of the span (e.g., ``read``, ``render``).
+
+        cat: The category of the span, for filtering in the trace viewer.
+
+        args: Additional info to attach to the span (e.g., the file being
+              read). Values should be JSON serializable.
+    """
+    if _state["mode"] != "trace" or _state["dir"] is None:
+        return contextlib.nullcontext()
+
+    return _span(name, cat, args)
+
+
+def worker(func: _F) -> _F:
+    """Profile each call to a function which runs in a worker process.
+
+    Calls in the main process (e.g., when processing serially) are already
+    covered by the profile for the stage, and are not profiled separately.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not enabled() or _state["dir"] is None:
+            return func(*args, **kwargs)
+
+        with span(func.__qualname__, cat="worker", module=func.__module__):
+            if mp.parent_process() is None:
+                return func(*args, **kwargs)
+
+            profiler = _worker_profiler()
+            _start(profiler)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                # Results accumulate across calls, so the file for this
+                # process is just overwritten each time.
+                _stop(profiler)
+                _dump(profiler, f"worker-{os.getpid()}")
+
+    return tp.cast(_F, wrapper)
+
+
+@contextlib.contextmanager
+def _span(name: str, cat: str, args: dict[str, tp.Any]) -> tp.Iterator[None]:
+    start = time.monotonic_ns()
+    try:
+        yield
+    finally:
+        end = time.monotonic_ns()
+        event = {
+            "name": name,
+            "cat": cat,
+            "ph": "X",
+            "ts": start / 1000,
+            "dur": (end - start) / 1000,
+            "pid": os.getpid(),
+            "tid": threading.get_native_id(),
+            "args": args,
+        }
+        _trace_file().write(json.dumps(event, default=str) + "\n")
+
+
+def _trace_file() -> tp.TextIO:
+    pid = os.getpid()
+    if _state["trace"] is not None and _state["trace"][0] == pid:
+        return _state["trace"][1]
+
+    # Each process writes its own file, so no locking is needed. Files are
+    # line buffered, so that events are on disk even if the process dies
+    # without cleaning up (e.g., pool workers).
+    path = pathlib.Path(_state["dir"]) / f"trace-{pid}.jsonl"
+    f = path.open("a", buffering=1, encoding="utf-8")
+    _state["trace"] = (pid, f)
+
+    label = "sierra" if mp.parent_process() is None else f"worker-{pid}"
+    meta = {"name": "process_name", "ph": "M", "pid": pid, "args": {"name": label}}
+    f.write(json.dumps(meta) + "\n")
+
+    return f
+
+
+def _trace_close() -> None:
+    if _state["trace"] is not None:
+        _state["trace"][1].close()
+        _state["trace"] = None
+
+
+def _worker_profiler() -> tp.Any:
+    pid = os.getpid()
+    if _state["worker"] is not None and _state["worker"][0] == pid:
+        return _state["worker"][1]
+
+    # With fork(), the profiler for the stage is inherited from the main
+    # process, but its results are never collected.
+    if _state["profiler"] is not None:
+        _stop(_state["profiler"])
+
+    profiler = _new()
+    _state["worker"] = (pid, profiler)
+    return profiler
+
+
+def _new() -> tp.Any:
+    if _state["mode"] == "cprofile":
+        return cProfile.Profile()
+
+    if _state["mode"] == "pyinstrument":
+        import pyinstrument  # noqa: PLC0415
+
+        return pyinstrument.Profiler()
+
+    return None
+
+
+def _start(profiler: tp.Any) -> None:
+    if profiler is None:
+        return
+
+    if _state["mode"] == "cprofile":
+        profiler.enable()
+    else:
+        profiler.start()
+
+    _state["profiler"] = profiler
+
+
+def _stop(profiler: tp.Any) -> None:
+    if profiler is None:
+        return
+
+    if _state["mode"] == "cprofile":
+        profiler.disable()
+    else:
+        profiler.stop()
+
+    _state["profiler"] = None
+
+
+def _dump(profiler: tp.Any, stem: str) -> None:
+    if profiler is None:
+        return
+
+    path = pathlib.Path(_state["dir"]) / stem
+
+    if _state["mode"] == "cprofile":
+        profiler.dump_stats(path.with_suffix(".prof"))
+    else:
+        profiler.last_session.save(path.with_suffix(".pyisession"))
+
+
+def _merge(stage_dir: pathlib.Path) -> pathlib.Path:
+    """Merge the results from all processes into a single report."""
+    if _state["mode"] == "cprofile":
+        stats = pstats.Stats(*sorted(str(p) for p in stage_dir.glob("*.prof")))
+        stats.dump_stats(stage_dir / "merged.prof")
+
+        stream = io.StringIO()
+        stats.stream = stream  # type: ignore[attr-defined]
+        stats.sort_stats("cumulative").print_stats(100)
+        report = stage_dir / "report.txt"
+        report.write_text(stream.getvalue(), encoding="utf-8")
+        return report
+
+    if _state["mode"] == "pyinstrument":
+        from pyinstrument import renderers  # noqa: PLC0415
+        from pyinstrument.session import Session  # noqa: PLC0415
+
+        sessions = [Session.load(p) for p in sorted(stage_dir.glob("*.pyisession"))]
+        merged = functools.reduce(Session.combine, sessions)
+
+        text = renderers.ConsoleRenderer(unicode=True, color=False).render(merged)
+        (stage_dir / "report.txt").write_text(text, encoding="utf-8")
+
+        report = stage_dir / "report.html"
+        report.write_text(renderers.HTMLRenderer().render(merged), encoding="utf-8")
+        return report
+
+    events = []
+    for path in sorted(stage_dir.glob("trace-*.jsonl")):
+        with path.open("r", encoding="utf-8") as f:
+            # The last line might be partial if a worker was killed
+            for line in f:
+                with contextlib.suppress(json.JSONDecodeError):
+                    events.append(json.loads(line))
+
+    report = stage_dir / "trace.json"
+    with report.open("w", encoding="utf-8") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+    return report
+
+
+__all__ = ["enabled", "initialize", "span", "stage", "worker"]
@@ -6,22 +6,44 @@
 Tests for compatibility and testing for the required packages in its
 environment.
 
+Only the packages needed by the SIERRA core and the selected plugins are checked
+for. Packages which install a program SIERRA runs are checked for by looking up
+the program on ``PATH``; the rest are checked for with a single query to the OS
+package manager, the results of which are cached per host (see
+``config.PKG_CHECKS``).
 """
 # Core packages
+import typing as tp
 import sys
+import os
+import json
+import time
+import shutil
+import socket
 import logging
+import pathlib
 import subprocess
 
 # 3rd party packages
 
 # Project packages
-from sierra.core import types
+from sierra.core import types, config
 
+_Spec = types.PackageSpec
+
+_GRAPHS = ["prod.graphs", "compare.graphs"]
+_ROBOT = ["engine.ros1robot", "execenv.robot"]
 
 OSX_PACKAGES = types.OSPackagesSpec(
     "darwin",
     "OSX",
-    pkgs={"parallel": True, "mactex": False, "xquartz": False, "pssh": False},
+    pkgs={
+        "parallel": _Spec(True, executable="parallel"),
+        "mactex": _Spec(False, _GRAPHS),
+        "xquartz": _Spec(False, ["engine.argos"]),
+        "pssh": _Spec(False, _ROBOT, "pssh"),
+        "ffmpeg": _Spec(False, ["prod.render"], "ffmpeg"),
+    },
 )
 """
 The required/optional Homebrew packages.
@@ -31,53 +53,65 @@ DEBIAN_PACKAGES = types.OSPackagesSpec(
     "linux",
     "debian",
     pkgs={
-        "parallel": True,
-        "cm-super": False,
-        "texlive-fonts-recommended": False,
-        "texlive-latex-extra": False,
-        "dvipng": False,
-        "psmisc": True,
-        "pssh": False,
-        "ffmpeg": False,
-        "xvfb": False,
-        "iputils-ping": False,
+        "parallel": _Spec(True, executable="parallel"),
+        "cm-super": _Spec(False, _GRAPHS),
+        "texlive-fonts-recommended": _Spec(False, _GRAPHS),
+        "texlive-latex-extra": _Spec(False, _GRAPHS),
+        "dvipng": _Spec(False, _GRAPHS, "dvipng"),
+        "psmisc": _Spec(True, executable="killall"),
+        "pssh": _Spec(False, _ROBOT, "parallel-ssh"),
+        "ffmpeg": _Spec(False, ["prod.render"], "ffmpeg"),
+        "xvfb": _Spec(False, ["engine.argos"], "Xvfb"),
+        "iputils-ping": _Spec(False, _ROBOT, "ping"),
     },
 )
 RPM_PACKAGES = types.OSPackagesSpec(
     "linux",
     "fedora",
     pkgs={
-        "parallel": True,
-        "cm-super": False,
-        "texlive-scheme-full": False,
-        "dvipng": False,
-        "psmisc": True,
-        "pssh": False,
-        "ffmpeg": False,
-        "xorg-x11-server-Xvfb": False,
-        "iputils-ping": False,
+        "parallel": _Spec(True, executable="parallel"),
+        "cm-super": _Spec(False, _GRAPHS),
+        "texlive-scheme-full": _Spec(False, _GRAPHS),
+        "dvipng": _Spec(False, _GRAPHS, "dvipng"),
+        "psmisc": _Spec(True, executable="killall"),
+        "pssh": _Spec(False, _ROBOT, "pssh"),
+        "ffmpeg": _Spec(False, ["prod.render"], "ffmpeg"),
+        "xorg-x11-server-Xvfb": _Spec(False, ["engine.argos"], "Xvfb"),
+        "iputils-ping": _Spec(False, _ROBOT, "ping"),
     },
 )
 """
 The required/optional .deb packages for linux-based distributions.
 """
 
+_CACHE_VERSION = 1
+
+_Query = tp.Callable[[list[str]], set[str]]
+
+
+def startup_checks(pkg_checks: bool, plugins: tp.Optional[list[str]] = None) -> None:
+    """Check the SIERRA runtime environment.
 
-def startup_checks(pkg_checks: bool) -> None:
+    Args:
+        pkg_checks: Check that the packages SIERRA needs are installed?
+
+        plugins: The selected plugins. If None, the packages needed by all
+                 plugins are checked for.
+    """
     logging.debug("Performing startup checks [venv=%s]", sys.prefix != sys.base_prefix)
 
     # Check packages
     if sys.platform == "linux":
         if pkg_checks:
-            _linux_pkg_checks()
+            _linux_pkg_checks(plugins)
     elif sys.platform == "darwin":
         if pkg_checks:
-            _osx_pkg_checks()
+            _osx_pkg_checks(plugins)
     else:
         raise RuntimeError("SIERRA only works on Linux and OSX!")
 
 
-def _linux_pkg_checks() -> None:
+def _linux_pkg_checks(plugins: tp.Optional[list[str]]) -> None:
     """Check that all the packages required by SIERRA are installed on Linux."""
     # This will fail on OSX if at global scope
     import distro  # noqa: PLC0415
@@ -87,10 +121,10 @@ def _linux_pkg_checks() -> None:
     if any(
         candidate in os_info["id"] for candidate in ["debian", "ubuntu", "linuxmint"]
     ):
-        _do_linux_pkg_checks(dist, "deb", DEBIAN_PACKAGES, ["dpkg", "-s"])
+        _do_pkg_checks(dist, "deb", DEBIAN_PACKAGES, plugins, _dpkg_query)
 
     elif any(candidate in os_info["id"] for candidate in ["fedora"]):
-        _do_linux_pkg_checks(dist, "rpm", RPM_PACKAGES, ["rpm", "-q"])
+        _do_pkg_checks(dist, "rpm", RPM_PACKAGES, plugins, _rpm_query)
     else:
         logging.warning(
             "Unknown Linux distro '%s' detected: skipping package check", dist
@@ -101,73 +135,174 @@ def _linux_pkg_checks() -> None:
         )
 
 
-def _do_linux_pkg_checks(
-    dist: str, ext: str, packages: types.OSPackagesSpec, basecmd: list[str]
+def _osx_pkg_checks(plugins: tp.Optional[list[str]]) -> None:
+    """Check that all the packages required by SIERRA are installed on OSX."""
+    _do_pkg_checks("OSX", "brew", OSX_PACKAGES, plugins, _brew_query)
+
+
+def _do_pkg_checks(
+    dist: str,
+    ext: str,
+    packages: types.OSPackagesSpec,
+    plugins: tp.Optional[list[str]],
+    query: _Query,
 ) -> None:
-    for pkg, required in packages.pkgs.items():
+    needed = {
+        pkg: spec for pkg, spec in packages.pkgs.items() if _is_needed(spec, plugins)
+    }
+    logging.debug("Checking for %s packages %s", ext, list(needed))
 
-        res = subprocess.run(
-            [*basecmd, pkg], capture_output=True, text=True, check=False
-        )
+    found = {
+        pkg
+        for pkg, spec in needed.items()
+        if spec.executable and shutil.which(spec.executable)
+    }
+    queried = [pkg for pkg, spec in needed.items() if not spec.executable]
+    found |= _query_cached(ext, queried, query, fresh=False)
+
+    missing = [pkg for pkg in needed if pkg not in found]
 
-        logging.trace(
-            "Checking for .%s package %s...",
+    # Don't fail because of a stale cache entry: the user may just have
+    # installed the package.
+    if any(needed[pkg].required and pkg in queried for pkg in missing):
+        found |= _query_cached(ext, queried, query, fresh=True)
+        missing = [pkg for pkg in needed if pkg not in found]
+
+    for pkg in missing:
+        if needed[pkg].required:
+            raise RuntimeError(
+                f"Required {ext} package {pkg} missing on {dist}. Install all "
+                "required packages before running SIERRA! "
+                '(Did you read the "Getting Started" docs?)'
+            )
+
+        logging.debug(
+            "Recommended %s package %s missing on %s. Some SIERRA functionality "
+            "will not be available.",
             ext,
             pkg,
+            dist,
         )
 
-        if res.returncode != 0:
-            if required:
-                raise RuntimeError(
-                    f"Required .{ext} packages {pkg} missing on "
-                    f"Linux distribution {dist}. Install all "
-                    "required packages before running SIERRA! "
-                    '(Did you read the "Getting Started" docs?)'
-                )
-
-            logging.debug(
-                "Recommended .%s packages %s missing on Linux distro %s. Some SIERRA functionality will not be available. ",
-                ext,
-                pkg,
-                dist,
-            )
 
+def _is_needed(spec: types.PackageSpec, plugins: tp.Optional[list[str]]) -> bool:
+    if plugins is None or not spec.plugins:
+        return True
 
-def _osx_pkg_checks() -> None:
-    """Check that all the packages required by SIERRA are installed on OSX."""
-    missing = []
-
-    for pkg, required in OSX_PACKAGES.pkgs.items():
-        logging.trace("Checking for homebrew package '%s'", pkg)
-        p1 = subprocess.Popen(
-            f"brew list | grep {pkg}",
-            shell=True,
-            stderr=subprocess.DEVNULL,
-            stdout=subprocess.DEVNULL,
-        )
-        p2 = subprocess.Popen(
-            f"brew list --cask | grep {pkg}",
-            shell=True,
-            stderr=subprocess.DEVNULL,
-            stdout=subprocess.DEVNULL,
-        )
-        p1.wait()
-        p2.wait()
-
-        if p1.returncode != 0 and p2.returncode != 0:
-            missing.append(pkg)
-            if required:
-                raise RuntimeError(
-                    f"Required brew package {missing} missing on "
-                    "OSX. Install all required packages before "
-                    'running SIERRA! (Did you read the "Getting '
-                    'Started" docs?)'
-                )
-
-            logging.debug(
-                (
-                    "Recommended brew package %s missing on OSX. "
-                    "Some SIERRA functionality will not be available."
-                ),
-                pkg,
+    return any(
+        p == prefix or p.startswith(f"{prefix}.")
+        for p in plugins
+        for prefix in spec.plugins
+    )
+
+
+def _query_cached(ext: str, pkgs: list[str], query: _Query, fresh: bool) -> set[str]:
+    """Get which of the packages are installed, using cached results if possible.
+
+    Results are cached per host (rather than per user), because SIERRA is often
+    installed in a home directory shared across all the nodes of an HPC cluster,
+    which do not necessarily have the same packages.
+    """
+    if not pkgs:
+        return set()
+
+    path = config.CACHE_ROOT / config.PKG_CHECKS["cache_leaf"]
+    key = f"{socket.gethostname()}:{ext}"
+    now = time.time()
+
+    cache = _cache_load(path) if config.PKG_CHECKS["cache"] else {}
+    entry = cache.setdefault(key, {})
+
+    known = {}
+    if not fresh:
+        known = {
+            pkg: installed
+            for pkg, (installed, stamp) in entry.items()
+            if now - stamp < config.PKG_CHECKS["cache_ttl"]
+        }
+
+    if unknown := [pkg for pkg in pkgs if pkg not in known]:
+        installed = query(unknown)
+        known.update({pkg: pkg in installed for pkg in unknown})
+        entry.update({pkg: (pkg in installed, now) for pkg in unknown})
+
+        if config.PKG_CHECKS["cache"]:
+            _cache_store(path, cache)
+
+    return {pkg for pkg in pkgs if known[pkg]}
+
+
+def _cache_load(path: pathlib.Path) -> dict[str, tp.Any]:
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+    if cache.get("version") != _CACHE_VERSION:
+        return {}
+
+    return cache["hosts"]
+
+
+def _cache_store(path: pathlib.Path, hosts: dict[str, tp.Any]) -> None:
+    # Write + rename so that concurrent SIERRA invocations never see a partial
+    # cache.
+    tmp = path.with_name(f"{path.name}.{os.getpid()}")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump({"version": _CACHE_VERSION, "hosts": hosts}, f)
+        tmp.replace(path)
+    except OSError as e:
+        logging.debug("Could not write package check cache %s: %s", path, e)
+
+
+def _run(cmd: list[str]) -> str:
+    try:
+        res = subprocess.run(cmd, capture_output=True, text=True, check=False)
+    except FileNotFoundError:
+        return ""
+
+    return res.stdout
+
+
+def _dpkg_query(pkgs: list[str]) -> set[str]:
+    # Non-zero exit status if any of the packages is unknown, but all of the
+    # known ones are still reported.
+    out = _run(["dpkg-query", "-W", "-f=${Package} ${db:Status-Status}\\n", *pkgs])
+    installed = set()
+    for line in out.splitlines():
+        name, _, status = line.partition(" ")
+        if status == "installed":
+            installed.add(name)
+
+    return installed & set(pkgs)
+
+
+def _rpm_query(pkgs: list[str]) -> set[str]:
+    # Missing packages are reported as "package X is not installed".
+    out = _run(["rpm", "-q", "--qf", "%{NAME}\\n", *pkgs])
+    return set(out.splitlines()) & set(pkgs)
+
+
+def _brew_query(pkgs: list[str]) -> set[str]:
+    # Formulae and casks have to be listed separately; do both at once.
+    try:
+        procs = [
+            subprocess.Popen(
+                ["brew", "list", "-1", kind],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
             )
+            for kind in ["--formula", "--cask"]
+        ]
+    except FileNotFoundError:
+        return set()
+
+    names = [name for p in procs for name in p.communicate()[0].splitlines()]
+
+    # Substring match, so that e.g. mactex is found if mactex-no-gui is
+    # installed.
+    return {pkg for pkg in pkgs if any(pkg in name for name in names)}
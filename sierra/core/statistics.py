@@ -0,0 +1,209 @@
+# Copyright 2026 John Harwell, All rights reserved.
+#
+#  SPDX-License-Identifier: MIT
+"""
+Reading/writing the statistics computed for an output file during stage 3.
+
+Statistics are either written one file per statistic (``foo.mean``,
+``foo.stddev``, ...), or bundled into a single ``foo.stats`` file with the
+columns suffixed by the extension of the statistic they contain (``col.mean``,
+``col.stddev``, ...), which is much kinder to parallel filesystems. ``.mean``
+files are always written on their own as well, because lots of things other
+than graphs read them.
+
+Readers should use :func:`read`, which handles both layouts.
+
+Categorical outputs used for confusion matrices are handled separately: the
+``<truth, predicted>`` pairs from every run are counted exactly with
+:func:`confusion_counts` and written to ``foo.counts``, rather than averaged.
+"""
+
+# Core packages
+import typing as tp
+import pathlib
+
+# 3rd party packages
+import numpy as np
+import polars as pl
+
+# Project packages
+from sierra.core import types, utils, storage, config
+
+
+def bundle(dfs: dict[str, pl.DataFrame]) -> pl.DataFrame:
+    """Bundle dataframes for different statistics into a single dataframe.
+
+    Args:
+        dfs: Mapping of statistic extension (e.g., ``.stddev``) to the
+             dataframe containing that statistic. All dataframes must have the
+             same # of rows.
+    """
+    return pl.concat(
+        [df.rename({c: c + ext for c in df.columns}) for ext, df in dfs.items()],
+        how="horizontal",
+    )
+
+
+def unbundle(df: pl.DataFrame, exts: types.StrDict) -> dict[str, pl.DataFrame]:
+    """Split a bundled dataframe back into per-statistic dataframes.
+
+    Args:
+        df: The bundled dataframe.
+
+        exts: Mapping of statistic name to extension, as in
+              :py:data:`~sierra.core.config.STATS`. Statistics not present in
+              the bundle are omitted from the result.
+    """
+    dfs = {}
+    for name, ext in exts.items():
+        cols = [c for c in df.columns if c.endswith(ext)]
+        if cols:
+            dfs[name] = df.select(cols).rename({c: c[: -len(ext)] for c in cols})
+
+    return dfs
+
+
+def write(
+    dfs: dict[str, pl.DataFrame],
+    stem_path: pathlib.Path,
+    medium: str,
+    bundled: bool,
+) -> None:
+    """Write computed statistics for an output file.
+
+    Args:
+        dfs: Mapping of statistic extension (e.g., ``.stddev``) to the
+             dataframe containing that statistic.
+
+        stem_path: Path to write to, sans extension.
+
+        medium: The storage plugin to use.
+
+        bundled: Write a single bundle (plus ``.mean``) instead of one file per
+                 statistic.
+    """
+    mean_ext = config.STATS["mean"].exts["mean"]
+
+    if not dfs:
+        return
+
+    if not bundled:
+        for ext, df in dfs.items():
+            storage.df_write(df, _with_ext(stem_path, ext), medium)
+        return
+
+    if mean_ext in dfs:
+        storage.df_write(dfs[mean_ext], _with_ext(stem_path, mean_ext), medium)
+
+    storage.df_write(bundle(dfs), _with_ext(stem_path, config.STATS_BUNDLE_EXT), medium)
+
+
+def read(
+    stats_root: pathlib.Path,
+    input_stem: str,
+    exts: types.StrDict,
+    medium: str,
+    columns: tp.Optional[list[str]] = None,
+) -> dict[str, pl.DataFrame]:
+    """Read the requested statistics for an output file.
+
+    If a bundle exists, all statistics it contains are read in a single call;
+    any others are read from their own files.
+
+    Args:
+        stats_root: Directory containing the statistics.
+
+        input_stem: Path to the output file relative to ``stats_root``, sans
+                    extension.
+
+        exts: Mapping of statistic name to extension for the statistics to
+              read. Statistics which don't exist are omitted from the result.
+
+        medium: The storage plugin to use.
+
+        columns: Only read these columns of each statistic; see
+                 :func:`~sierra.core.storage.df_read`. ``None`` reads all of
+                 them.
+    """
+    dfs = {}
+    bundle_path = stats_root / (input_stem + config.STATS_BUNDLE_EXT)
+    if utils.path_exists(bundle_path):
+        bundled = None
+        if columns is not None:
+            bundled = [c + ext for c in columns for ext in exts.values()]
+
+        dfs = unbundle(storage.df_read(bundle_path, medium, columns=bundled), exts)
+
+    for name, ext in exts.items():
+        if name in dfs:
+            continue
+
+        ipath = stats_root / (input_stem + ext)
+        if utils.path_exists(ipath):
+            dfs[name] = storage.df_read(ipath, medium, columns=columns)
+
+    return dfs
+
+
+def confusion_counts(
+    dfs: list[pl.DataFrame],
+    truth_col: str,
+    predicted_col: str,
+    count_col: tp.Optional[str] = None,
+) -> pl.DataFrame:
+    """Count the ``<truth, predicted>`` pairs in a set of dataframes.
+
+    Categories are taken from the union of both columns across all dataframes,
+    and labels are encoded as their index in the sorted categories, so counting
+    is a single :func:`numpy.bincount` regardless of how many dataframes there
+    are. Rows where either label is missing are ignored.
+
+    Args:
+        dfs: Dataframes containing ``truth_col`` and ``predicted_col``; e.g.,
+             the outputs from all runs in an experiment.
+
+        truth_col: The column containing ground truth labels.
+
+        predicted_col: The column containing predicted labels.
+
+        count_col: If not None, each row is weighted by the value in this
+                   column, so previously computed counts can be summed (e.g.,
+                   across experiments).
+
+    Returns:
+        Dataframe with ``truth_col``, ``predicted_col`` and ``count`` columns,
+        with a row for every pair of categories, sorted by truth then
+        predicted.
+    """
+    cols = [truth_col, predicted_col] + ([count_col] if count_col else [])
+    pairs = pl.concat([df.select(cols) for df in dfs], how="vertical_relaxed")
+    pairs = pairs.drop_nulls([truth_col, predicted_col])
+
+    if pairs[truth_col].dtype != pairs[predicted_col].dtype:
+        pairs = pairs.with_columns(pl.col(truth_col, predicted_col).cast(pl.String))
+
+    categories = pl.concat([pairs[truth_col], pairs[predicted_col]]).unique().sort()
+    k = len(categories)
+    truth = categories.search_sorted(pairs[truth_col]).to_numpy().astype(np.int64)
+    predicted = categories.search_sorted(pairs[predicted_col]).to_numpy()
+    weights = pairs[count_col].to_numpy() if count_col else None
+
+    counts = np.bincount(
+        truth * k + predicted, weights=weights, minlength=k * k
+    ).astype(np.int64)
+
+    rows = np.arange(k * k)
+    return pl.DataFrame(
+        {
+            truth_col: categories.gather(rows // k),
+            predicted_col: categories.gather(rows % k),
+            "count": counts,
+        }
+    )
+
+
+def _with_ext(stem_path: pathlib.Path, ext: str) -> pathlib.Path:
+    return stem_path.with_name(stem_path.name + ext)
+
+
+__all__ = ["bundle", "confusion_counts", "read", "unbundle", "write"]
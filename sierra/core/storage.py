@@ -8,22 +8,126 @@ See :ref:`tutorials/plugin/storage` for more details.
 """
 
 # Core packages
+import typing as tp
 import pathlib
 
 # 3rd party packages
 import polars as pl
 
+# networkx is only needed by the storage plugins which handle graphs, and is
+# slow to import.
+if tp.TYPE_CHECKING:
+    import networkx as nx
+
 # Project packages
 import sierra.core.plugin as pm
 from sierra.core.trampoline import cmdline_parser
+from sierra.core import fs, profiling
+from sierra.core.pipeline import metrics
+
 
+def supports_scan(medium: str) -> bool:
+    """
+    Determine if a storage plugin can lazily scan dataframes.
 
-def df_read(path: pathlib.Path, medium: str, **kwargs) -> pl.DataFrame:
+    Such plugins define ``df_scan()``, so that column/row selections can be
+    pushed down into the read itself.
+    """
+    return hasattr(pm.pipeline.get_plugin_module(medium), "df_scan")
+
+
+def df_read(
+    path: pathlib.Path,
+    medium: str,
+    columns: tp.Optional[tp.Iterable[str]] = None,
+    predicate: tp.Optional[pl.Expr] = None,
+    **kwargs,
+) -> pl.DataFrame:
     """
     Dispatch "read from storage" request to active ``--storage`` plugin.
+
+    Args:
+        path: The file to read.
+
+        medium: The storage plugin to use.
+
+        columns: Only read these columns; any which are not in the file are
+                 ignored. Columns are returned in file order.
+
+        predicate: Only read the rows for which this is true.
+
+    If ``columns`` or ``predicate`` are passed and the plugin
+    :func:`supports_scan`, they are pushed down into the scan, so that
+    columnar formats never read unneeded columns/row groups from disk.
+    Otherwise, the whole file is read and then filtered.
+
+    .. versionchanged:: 1.5.9
+
+       Added ``columns`` and ``predicate``.
+    """
+    storage = pm.pipeline.get_plugin_module(medium)
+    metrics.io("r", path)
+    with profiling.span("read", path=path.name):
+        if columns is None and predicate is None:
+            return storage.df_read(path, **kwargs)
+
+        if hasattr(storage, "df_scan"):
+            lf = storage.df_scan(path, **kwargs)
+        else:
+            lf = storage.df_read(path, **kwargs).lazy()
+
+        return collect(_select(lf, columns, predicate))
+
+
+def df_scan(
+    path: pathlib.Path,
+    medium: str,
+    columns: tp.Optional[tp.Iterable[str]] = None,
+    predicate: tp.Optional[pl.Expr] = None,
+    **kwargs,
+) -> pl.LazyFrame:
+    """
+    Dispatch "lazily scan from storage" request to active ``--storage`` plugin.
+
+    ``columns`` and ``predicate`` are as for :func:`df_read`. If the plugin
+    doesn't :func:`supports_scan`, the file is read eagerly and wrapped, so this
+    works for all plugins which support ``pl.DataFrame``.
+
+    .. versionadded:: 1.5.9
     """
     storage = pm.pipeline.get_plugin_module(medium)
-    return storage.df_read(path, **kwargs)
+    metrics.io("r", path)
+    if hasattr(storage, "df_scan"):
+        lf = storage.df_scan(path, **kwargs)
+    else:
+        with profiling.span("read", path=path.name):
+            lf = storage.df_read(path, **kwargs).lazy()
+
+    return _select(lf, columns, predicate)
+
+
+@fs.retry_transient
+def collect(lf: pl.LazyFrame, **kwargs) -> pl.DataFrame:
+    """
+    Execute a lazy query over data from :func:`df_scan`.
+
+    Scanning only builds the query plan; the data are actually read from disk
+    here, so this is retried on transient filesystem errors like the plugins'
+    reads are. ``kwargs`` are passed to ``pl.LazyFrame.collect()``.
+
+    .. versionadded:: 1.5.9
+    """
+    return lf.collect(**kwargs)
+
+
+@fs.retry_transient
+def schema(lf: pl.LazyFrame) -> pl.Schema:
+    """
+    Get the schema of data from :func:`df_scan`, retrying as :func:`collect`.
+
+    .. versionadded:: 1.5.9
+    """
+    return lf.collect_schema()
 
 
 def df_write(df: pl.DataFrame, path: pathlib.Path, medium: str, **kwargs) -> None:
@@ -31,7 +135,81 @@ def df_write(df: pl.DataFrame, path: pathlib.Path, medium: str, **kwargs) -> Non
     Dispatch "write to storage" request to active ``--storage`` plugin.
     """
     storage = pm.pipeline.get_plugin_module(medium)
-    return storage.df_write(df, path, **kwargs)
+    try:
+        with profiling.span("write", path=path.name):
+            return storage.df_write(df, path, **kwargs)
+    finally:
+        fs.invalidate(path)
+        metrics.io("w", path)
+
+
+def graph_read(path: pathlib.Path, medium: str, **kwargs) -> "nx.Graph":
+    """
+    Dispatch "read graph from storage" request to a storage plugin.
+    """
+    storage = pm.pipeline.get_plugin_module(medium)
+    metrics.io("r", path)
+    return storage.graph_read(path, **kwargs)
+
+
+def graph_medium(path: pathlib.Path) -> str:
+    """
+    Find the storage plugin which can read the graph in ``path``.
+
+    Graphs are read by extension rather than with the active ``--storage``
+    plugin, which is generally for tabular data.
+
+    .. versionadded:: 1.5.9
+    """
+    for name in pm.pipeline.available_plugins():
+        if not name.startswith("storage."):
+            continue
+
+        storage = pm.pipeline.get_plugin_module(name)
+        if hasattr(storage, "graph_read") and storage.supports_input(path.suffix):
+            return name
+
+    raise ValueError(f"No storage plugin can read graphs from '{path.suffix}' files")
+
+
+def graph_write(
+    graph: "nx.Graph", path: pathlib.Path, medium: str, **kwargs
+) -> None:
+    """
+    Dispatch "write graph to storage" request to a storage plugin.
+    """
+    storage = pm.pipeline.get_plugin_module(medium)
+    try:
+        return storage.graph_write(graph, path, **kwargs)
+    finally:
+        fs.invalidate(path)
+        metrics.io("w", path)
+
+
+def _select(
+    lf: pl.LazyFrame,
+    columns: tp.Optional[tp.Iterable[str]],
+    predicate: tp.Optional[pl.Expr],
+) -> pl.LazyFrame:
+    # Filter first, so the predicate can use columns which aren't selected
+    if predicate is not None:
+        lf = lf.filter(predicate)
+
+    if columns is not None:
+        wanted = set(columns)
+        lf = lf.select([c for c in schema(lf).names() if c in wanted])
+
+    return lf
 
 
-__all__ = ["df_read", "df_write"]
+__all__ = [
+    "collect",
+    "df_read",
+    "df_scan",
+    "df_write",
+    "graph_medium",
+    "graph_read",
+    "graph_write",
+    "schema",
+    "supports_scan",
+]
@@ -0,0 +1,114 @@
+# Copyright 2026 John Harwell, All rights reserved.
+#
+#  SPDX-License-Identifier: MIT
+"""
+Coordination of the # of threads used by process pools in stages 3-4.
+
+Libraries which pool workers use (polars, BLAS/OpenMP, ...) start thread pools
+sized to all CPUs on the host by default, so N workers on an N-core node would
+run N x N threads and thrash. Instead, the CPUs available to SIERRA are treated
+as a budget which is divided among the workers in a pool (see :func:`budget`),
+and each worker is limited to its share via its environment (see
+:func:`limit`).
+
+Limits only affect libraries which create their thread pools after a worker
+starts. This is always true of polars, which can't be used in the main process
+before workers are forked. Libraries which were already loaded in the main
+process when workers are forked (e.g., the BLAS numpy uses) keep their
+existing thread pools.
+"""
+
+# Core packages
+import typing as tp
+import os
+import contextlib
+import logging
+
+# 3rd party packages
+import psutil
+
+# Project packages
+from sierra.core import types
+
+_logger = logging.getLogger(__name__)
+
+# Environment variables which control the size of library thread pools.
+_ENV_VARS = [
+    "POLARS_MAX_THREADS",
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+]
+
+
+def n_cpus() -> int:
+    """Get the # of CPUs SIERRA can use.
+
+    This respects CPU affinity masks, e.g. from HPC schedulers or cgroups,
+    where available.
+    """
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return psutil.cpu_count()
+
+
+def budget(cmdopts: types.Cmdopts) -> tuple[int, int]:
+    """Calculate the # of workers in a pool, and the # of threads for each.
+
+    If ``--processing-threads`` isn't passed, there are
+    ``--processing-parallelism`` workers, and the available CPUs are divided
+    evenly among them. Otherwise, ``--processing-parallelism`` CPUs are divided
+    into workers with ``--processing-threads`` threads each.
+
+    Returns:
+        Tuple of (# workers, # threads per worker).
+    """
+    parallelism = cmdopts["processing_parallelism"]
+    n_threads = cmdopts.get("processing_threads")
+
+    if n_threads is None:
+        n_workers = parallelism
+        n_threads = max(1, n_cpus() // parallelism)
+    else:
+        n_workers = max(1, parallelism // n_threads)
+
+    _logger.debug("CPU budget: %s workers x %s threads", n_workers, n_threads)
+    return n_workers, n_threads
+
+
+@contextlib.contextmanager
+def limit(n_threads: int) -> tp.Iterator[None]:
+    """Limit the # of threads used by processes started in this context.
+
+    Processes inherit the environment regardless of the multiprocessing start
+    method, so this must be active for the whole lifetime of a pool which
+    replaces its workers (e.g., ``maxtasksperchild``). Variables which are
+    already set in the environment are respected.
+    """
+    to_set = [v for v in _ENV_VARS if v not in os.environ]
+    os.environ.update(dict.fromkeys(to_set, str(n_threads)))
+
+    try:
+        yield
+    finally:
+        for var in to_set:
+            os.environ.pop(var, None)
+
+
+def ffmpeg_opts(opts: str, n_threads: int) -> str:
+    """Limit the # of threads :program:`ffmpeg` uses for encoding.
+
+    :program:`ffmpeg` doesn't read any of the environment variables set by
+    :func:`limit`, so its ``-threads`` option is used instead, unless the user
+    already passed it.
+    """
+    if "-threads" in opts.split():
+        return opts
+
+    return f"{opts} -threads {n_threads}".strip()
+
+
+__all__ = ["budget", "ffmpeg_opts", "limit", "n_cpus"]
@@ -22,6 +22,9 @@ def cmdline_parser(
 
     If the selected plugin does not define a cmdline, None is returned.
     """
+    if not pm.pipeline.has_cmdline(plugin):
+        return None
+
     path = "{}.cmdline".format(plugin)
     if pm.module_exists(path):
         module = pm.module_load_tiered(path)
@@ -6,7 +6,7 @@
 import typing as tp
 import sys
 from types import ModuleType
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import pathlib
 
 # 2024-12-03 [JRH]: Once SIERRA moves to 3.10+ this (and many other instances)
@@ -98,13 +98,34 @@ class ParsedNodefileSpec:
     port: int
 
 
+@dataclass
+class PackageSpec:
+    """Info about a single OS package SIERRA can use.
+
+    Attributes:
+        required: Is the package required (vs. recommended)?
+
+        plugins: The plugins which need the package, as dotted prefixes (e.g.,
+                 ``execenv.robot`` covers all robot execution environments).
+                 Empty if the SIERRA core needs it.
+
+        executable: A program the package installs. If set, the package is
+                    checked for by looking the program up on ``PATH`` instead
+                    of querying the package manager.
+    """
+
+    required: bool
+    plugins: list[str] = field(default_factory=list)
+    executable: tp.Optional[str] = None
+
+
 @dataclass
 class OSPackagesSpec:
     """Info about what packages are required/optional on a given OS."""
 
     kernel: str
     name: str
-    pkgs: dict[str, bool]
+    pkgs: dict[str, PackageSpec]
 
 
 @dataclass
@@ -120,6 +141,7 @@ __all__ = [
     "Cmdopts",
     "IntDict",
     "OSPackagesSpec",
+    "PackageSpec",
     "ParsedNodefileSpec",
     "PathList",
     "ShellCmdSpec",
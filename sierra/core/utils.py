@@ -6,7 +6,6 @@
 
 # Core packages
 import typing as tp
-import time
 import logging
 import pickle
 import functools
@@ -15,12 +14,11 @@ import pathlib
 # 3rd party packages
 import numpy as np
 import polars as pl
-from retry import retry
 
 # Project packages
 from sierra.core.vector import Vector3D
 from sierra.core.experiment import definition
-from sierra.core import types, config
+from sierra.core import types, config, fs
 from sierra.core import plugin as pm
 
 
@@ -131,29 +129,21 @@ def dir_create_checked(path: tp.Union[pathlib.Path, str], exist_ok: bool) -> Non
     except FileExistsError:
         logging.fatal("%s already exists! Not overwriting", str(path))
         raise
+    finally:
+        fs.invalidate(path)
 
 
-def path_exists(path: tp.Union[pathlib.Path, str]) -> bool:
+def path_exists(path: tp.Union[pathlib.Path, str], cached: bool = True) -> bool:
     """
-    Check if a path exists, trying multiple times.
+    Check if a path exists.
 
-    This is necessary for working on HPC systems where if a given
+    Checks are answered from cached directory listings and retried on transient
+    errors, which is necessary for working on HPC systems where if a given
     directory/filesystem is under heavy pressure the first check or two might
-    time out as the FS goes and executes the query over the network.
+    time out as the FS goes and executes the query over the network. See
+    :func:`sierra.core.fs.exists` for when to pass ``cached=False``.
     """
-    res = []
-
-    if not isinstance(path, pathlib.Path):
-        path = pathlib.Path(path)
-
-    for _ in range(0, 10):
-        if path.exists():
-            res.append(True)
-        else:
-            res.append(False)
-            time.sleep(0.001)
-
-    return max(set(res), key=res.count)
+    return fs.exists(path, cached)
 
 
 def get_primary_axis(criteria, primary_axis_bc: list, cmdopts: types.Cmdopts) -> int:
@@ -369,7 +359,7 @@ def df_fill(df: pl.DataFrame, policy: str) -> pl.DataFrame:
     raise RuntimeError(f"Bad fill policy {policy}")
 
 
-@retry(OSError, tries=10, delay=0.100, backoff=1.1)
+@fs.retry_transient
 def pickle_dump(obj: object, f) -> None:
     pickle.dump(obj, f)
 
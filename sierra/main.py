@@ -98,7 +98,16 @@ class SIERRA:
         bootstrap_args = self._handle_rc(bootstrap_args.rcfile, bootstrap_args)
 
         # Check SIERRA runtime environment
-        startup.startup_checks(not bootstrap_args.skip_pkg_checks)
+        startup.startup_checks(
+            not bootstrap_args.skip_pkg_checks,
+            [
+                bootstrap_args.engine,
+                bootstrap_args.execenv,
+                *bootstrap_args.proc,
+                *bootstrap_args.prod,
+                *bootstrap_args.compare,
+            ],
+        )
         self.logger.info("Using python=%s.", sys.version.replace("\n", ""))
 
         return bootstrap_args, other_args
@@ -177,11 +186,28 @@ class SIERRA:
         manager = pm.pipeline
         manager.initialize(bootstrap_args.project, plugin_search_path)
 
-        # 2025-06-14 [JRH]: All found plugins are loaded/executed as python
-        # modules, even if they are not currently selected. I don't know if this
-        # is a good idea or not.
-        for p in manager.available_plugins():
-            manager.load_plugin(p)
+        # Only the selected plugins are loaded up front, so that the python
+        # modules for unused plugins (and everything they import) are never
+        # executed; anything else which is needed later (e.g., storage.csv for
+        # stage 3 outputs) is loaded on demand. Model plugins aren't selected on
+        # the cmdline, so all of them are loaded. Selected plugins which don't
+        # exist are caught by _verify_plugins().
+        available = manager.available_plugins()
+        selected = [
+            bootstrap_args.project,
+            bootstrap_args.engine,
+            bootstrap_args.execenv,
+            bootstrap_args.expdef,
+            bootstrap_args.storage,
+            *bootstrap_args.proc,
+            *bootstrap_args.prod,
+            *bootstrap_args.compare,
+        ]
+        selected.extend(p for p in available if available[p]["type"] == "model")
+
+        for p in dict.fromkeys(selected):
+            if p in available:
+                manager.load_plugin(p)
 
         return manager
 
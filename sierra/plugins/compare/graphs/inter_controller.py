@@ -211,6 +211,7 @@ class UnivarInterControllerComparator(BaseInterControllerComparator):
             ipath_leaf=spec["src_stem"],
             opath_stem=self.stage5_roots.csv_root,
             criteria=criteria,
+            bundled=self.cmdopts.get("dist_stats_bundle", False),
         )
         opath_leaf = namecalc.for_cc(batch_leaf, spec["dest_stem"], None)
         preparer.for_cc(
@@ -431,6 +432,7 @@ class BivarInterControllerComparator(BaseInterControllerComparator):
                 ipath_leaf=spec["src_stem"],
                 opath_stem=self.stage5_roots.csv_root,
                 criteria=criteria,
+                bundled=self.cmdopts.get("dist_stats_bundle", False),
             )
 
             opath_leaf = namecalc.for_cc(batch_leaf, spec["dest_stem"], [spec["index"]])
@@ -446,6 +448,7 @@ class BivarInterControllerComparator(BaseInterControllerComparator):
                 ipath_leaf=spec["src_stem"],
                 opath_stem=self.stage5_roots.csv_root,
                 criteria=criteria,
+                bundled=self.cmdopts.get("dist_stats_bundle", False),
             )
 
             exp_dirs = criteria.gen_exp_names()
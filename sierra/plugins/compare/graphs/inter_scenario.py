@@ -260,6 +260,7 @@ class UnivarInterScenarioComparator(comparator.BaseComparator):
             ipath_leaf=spec["src_stem"],
             opath_stem=self.stage5_roots.csv_root,
             criteria=criteria,
+            bundled=self.cmdopts.get("dist_stats_bundle", False),
         )
         opath_leaf = namecalc.for_sc(root.leaf, self.things, spec["dest_stem"], None)
 
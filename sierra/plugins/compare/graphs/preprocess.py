@@ -17,13 +17,20 @@ import typing as tp
 import polars as pl
 
 # Project packages
-from sierra.core import utils, config, storage
+from sierra.core import config, statistics
 from sierra.core.variables import batch_criteria as bc
 
 
 class IntraExpPreparer:
     """
     Collate generated stats from previous stages into files(s) for comparison.
+
+    Statistics are read with :func:`sierra.core.statistics.read`, so they can
+    be bundled or not, and are written bundled if ``bundled`` is set.
+
+    .. versionchanged:: 1.5.9
+
+       Added ``bundled``.
     """
 
     def __init__(
@@ -32,11 +39,13 @@ class IntraExpPreparer:
         ipath_leaf: str,
         opath_stem: pathlib.Path,
         criteria: bc.XVarBatchCriteria,
+        bundled: bool = False,
     ):
         self.ipath_stem = ipath_stem
         self.ipath_leaf = ipath_leaf
         self.opath_stem = opath_stem
         self.criteria = criteria
+        self.bundled = bundled
 
     def for_cc(
         self,
@@ -58,21 +67,7 @@ class IntraExpPreparer:
         - df[controller] columns as timeslices *across* columns (i.e., across
           experiments in the batch) in the source dataframe.
         """
-        exts = config.STATS["mean"].exts
-        exts.update(config.STATS["conf95"].exts)
-        exts.update(config.STATS["bw"].exts)
-
-        for k in exts:
-            stat_ipath = pathlib.Path(self.ipath_stem, self.ipath_leaf + exts[k])
-            stat_opath = pathlib.Path(self.opath_stem, opath_leaf + exts[k])
-            df = self._cc_for_stat(stat_ipath, stat_opath, index, inc_exps, controller)
-
-            if df is not None:
-                storage.df_write(
-                    df,
-                    self.opath_stem / (opath_leaf + exts[k]),
-                    "storage.csv",
-                )
+        self._accum(controller, opath_leaf, index)
 
     def for_sc(
         self,
@@ -94,70 +89,35 @@ class IntraExpPreparer:
         - df[scenario] columns as timeslices *across* columns (i.e., across
           experiments in the batch) in the source dataframe.
         """
-        exts = config.STATS["mean"].exts
-        exts.update(config.STATS["conf95"].exts)
-        exts.update(config.STATS["bw"].exts)
-
-        for k in exts:
-            stat_ipath = pathlib.Path(self.ipath_stem, self.ipath_leaf + exts[k])
-            stat_opath = pathlib.Path(self.opath_stem, opath_leaf + exts[k])
-            df = self._sc_for_stat(stat_ipath, stat_opath, index, inc_exps, scenario)
-
-            if df is not None:
-                storage.df_write(
-                    df,
-                    self.opath_stem / (opath_leaf + exts[k]),
-                    "storage.csv",
-                )
-
-    def _cc_for_stat(
-        self,
-        ipath: pathlib.Path,
-        opath: pathlib.Path,
-        index: int,
-        inc_exps: tp.Optional[str],
-        controller: str,
-    ) -> tp.Optional[pl.DataFrame]:
-
-        if utils.path_exists(opath):
-            cum_df = storage.df_read(opath, "storage.csv")
-        else:
-            cum_df = pl.DataFrame({"Experiment ID": self.criteria.gen_exp_names()})
-
-        if utils.path_exists(ipath):
-            df = storage.df_read(ipath, "storage.csv")
-
-            # Get the row at the specified index
-            row_data = df.row(index if index >= 0 else len(df) + index)
-
-            # Add as a new column to cum_df
-            return cum_df.with_columns(pl.Series(controller, row_data))
-
-        return None
-
-    def _sc_for_stat(
-        self,
-        ipath: pathlib.Path,
-        opath: pathlib.Path,
-        index: int,
-        inc_exps: tp.Optional[str],
-        scenario: str,
-    ) -> tp.Optional[pl.DataFrame]:
-        if utils.path_exists(opath):
-            cum_df = storage.df_read(opath, "storage.csv")
-        else:
-            cum_df = pl.DataFrame({"Experiment ID": self.criteria.gen_exp_names()})
-
-        if utils.path_exists(ipath):
-            df = storage.df_read(ipath, "storage.csv")
+        self._accum(scenario, opath_leaf, index)
+
+    def _accum(self, colname: str, opath_leaf: str, index: int) -> None:
+        """Add a row of each statistic as a new column in the output files."""
+        exts = {
+            **config.STATS["mean"].exts,
+            **config.STATS["conf95"].exts,
+            **config.STATS["bw"].exts,
+        }
+
+        stats = statistics.read(self.ipath_stem, self.ipath_leaf, exts, "storage.csv")
+        cum_stats = statistics.read(self.opath_stem, opath_leaf, exts, "storage.csv")
+
+        dfs = {}
+        for k, df in stats.items():
+            if k in cum_stats:
+                cum_df = cum_stats[k]
+            else:
+                cum_df = pl.DataFrame({"Experiment ID": self.criteria.gen_exp_names()})
 
             # Get the row at the specified index
             row_data = df.row(index if index >= 0 else len(df) + index)
 
             # Add as a new column to cum_df
-            return cum_df.with_columns(pl.Series(scenario, row_data))
+            dfs[exts[k]] = cum_df.with_columns(pl.Series(colname, row_data))
 
-        return None
+        statistics.write(
+            dfs, self.opath_stem / opath_leaf, "storage.csv", self.bundled
+        )
 
 
 __all__ = ["IntraExpPreparer"]
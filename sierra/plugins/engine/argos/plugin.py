@@ -24,6 +24,7 @@ import packaging.version
 from sierra.core import config, types, utils, batchroot, execenv
 from sierra.core.experiment import bindings, definition
 import sierra.core.variables.batch_criteria as bc
+from sierra.plugins.execenv.hpc.slurm import plugin as slurm
 
 _logger = logging.getLogger("engine.argos")
 
@@ -215,6 +216,14 @@ def _configure_hpc_pbs(args: argparse.Namespace) -> argparse.Namespace:
     #
     # However, PBS does not have an environment variable for # jobs/node, so
     # we have to rely on the user to set this appropriately.
+    #
+    # The # engines is written into the experiment inputs in stage 1, so it
+    # would be stale if --exec-jobs-per-node was changed by calibration in
+    # stage 2.
+    assert not getattr(
+        args, "exec_autotune", False
+    ), "--exec-autotune not supported for ARGoS with --execenv=hpc.pbs"
+
     args.physics_n_engines = int(
         float(os.environ["PBS_NUM_PPN"]) / args.exec_jobs_per_node
     )
@@ -238,13 +247,10 @@ def _configure_hpc_slurm(args: argparse.Namespace) -> argparse.Namespace:
     # We rely on the user to request their job intelligently so that
     # SLURM_TASKS_PER_NODE is appropriate.
     if args.exec_jobs_per_node is None:
-        res = re.search(r"^[^\(]+", os.environ["SLURM_TASKS_PER_NODE"])
-        assert (
-            res is not None
-        ), "Unexpected format in SLURM_TASKS_PER_NODE: '{}'".format(
-            os.environ["SLURM_TASKS_PER_NODE"]
-        )
-        args.exec_jobs_per_node = int(res.group(0))
+        # Allocations can be heterogeneous (e.g., '4,2'); use the smallest
+        # per-node count so no node is oversubscribed.
+        tasks = slurm.tasks_per_node_parse(os.environ["SLURM_TASKS_PER_NODE"])
+        args.exec_jobs_per_node = min(tasks)
 
     args.physics_n_engines = int(os.environ["SLURM_CPUS_PER_TASK"])
 
@@ -22,6 +22,7 @@ import implements
 from sierra.core import config, ros1, types, batchroot, execenv
 from sierra.core.experiment import bindings, definition
 import sierra.core.variables.batch_criteria as bc
+from sierra.plugins.execenv.hpc.slurm import plugin as slurm
 
 _logger = logging.getLogger("ros1gazebo.plugin")
 
@@ -258,13 +259,10 @@ def _configure_hpc_slurm(args: argparse.Namespace) -> argparse.Namespace:
     # We rely on the user to request their job intelligently so that
     # SLURM_TASKS_PER_NODE is appropriate.
     if args.exec_jobs_per_node is None:
-        res = re.search(r"^[^\(]+", os.environ["SLURM_TASKS_PER_NODE"])
-        assert (
-            res is not None
-        ), "Unexpected format in SLURM_TASKS_PER_NODE: '{}'".format(
-            os.environ["SLURM_TASKS_PER_NODE"]
-        )
-        args.exec_jobs_per_node = int(res.group(0))
+        # Allocations can be heterogeneous (e.g., '4,2'); use the smallest
+        # per-node count so no node is oversubscribed.
+        tasks = slurm.tasks_per_node_parse(os.environ["SLURM_TASKS_PER_NODE"])
+        args.exec_jobs_per_node = min(tasks)
 
     _logger.debug(
         "Allocated %s physics threads/run, %s parallel runs/node",
@@ -250,6 +250,9 @@ class ExpConfigurer:
 
         nodes = execenv.parse_nodefile(self.cmdopts["nodefile"])
 
+        if not self.cmdopts["skip_online_check"]:
+            execenv.check_connectivity_all(self.cmdopts, nodes, self.cmdopts["robot"])
+
         # Use {parallel ssh, rsync} to push each experiment to all robots in
         # parallel--takes O(M*N) operation and makes it O(N) more or less.
         pssh_base = "parallel-ssh"
@@ -261,15 +264,6 @@ class ExpConfigurer:
             remote_hostname = node.hostname
             current_username = pwd.getpwuid(os.getuid())[0]
 
-            if not self.cmdopts["skip_online_check"]:
-                execenv.check_connectivity(
-                    self.cmdopts,
-                    remote_login,
-                    remote_hostname,
-                    remote_port,
-                    self.cmdopts["robot"],
-                )
-
             pssh_base += f" -H {remote_login}@{remote_hostname}:{remote_port}"
             prsync_base += f" -H {remote_login}@{remote_hostname}:{remote_port}"
 
@@ -17,14 +17,43 @@ from sierra.core import types
 from sierra.plugins import PluginCmdline
 
 
+class AdHocCmdline(hpc.cmdline.HPCCmdline):
+    def init_stage2(self) -> None:
+        """Add ad-hoc HPC cmdline options.
+
+        In addition to the common HPC options, these include:
+
+        - ``--exec-balance``
+
+        """
+        super().init_stage2()
+
+        self.stage2.add_argument(
+            "--exec-balance",
+            help="""
+                 Run concurrent runs on each node in proportion to its
+                 declared cores in ``--nodefile`` (``N/host``), rather than
+                 ``--exec-jobs-per-node`` on every node.  Nodes which were
+                 slower than the median node for previous experiments in the
+                 batch (per the GNU parallel joblogs) are given fewer
+                 concurrent runs, so that runs queue for faster nodes instead.
+                 """
+            + self.stage_usage_doc([2]),
+            action="store_true",
+            default=False,
+        )
+
+
 def build(
     parents: list[argparse.ArgumentParser], stages: list[int]
 ) -> PluginCmdline:
     """
     Get a cmdline parser supporting the ``hpc.adhoc`` execution environment.
     """
-    return hpc.cmdline.HPCCmdline(parents, stages)
+    return AdHocCmdline(parents, stages)
 
 
 def to_cmdopts(args: argparse.Namespace) -> types.Cmdopts:
-    return hpc.cmdline.to_cmdopts(args)
+    opts = hpc.cmdline.to_cmdopts(args)
+    opts["exec_balance"] = args.exec_balance
+    return opts
@@ -13,14 +13,17 @@ import typing as tp
 import argparse
 import shutil
 import pathlib
+import logging
 
 # 3rd party packages
 import implements
 
 # Project packages
-from sierra.core import types, utils
+from sierra.core import types, utils, execenv
 from sierra.core.experiment import bindings
 
+_logger = logging.getLogger(__name__)
+
 
 def cmdline_postparse_configure(args: argparse.Namespace) -> argparse.Namespace:
     """
@@ -94,12 +97,22 @@ class ExpShellCmdsGenerator:
         if exec_opts["exec_resume"]:
             resume = "--resume-failed"
 
-        # Make sure there are no duplicate nodes
-        unique_nodes = types.ShellCmdSpec(
-            cmd="sort -u {} > {}".format(exec_opts["nodefile"], nodelist),
-            shell=True,
-            wait=True,
-        )
+        ret = []
+        n_jobs = exec_opts["n_jobs"]
+        if self.cmdopts.get("exec_balance", False):
+            # Per-node job slots are set in the nodelist, so each node runs as
+            # many jobs as it has slots.
+            self._write_weighted_nodelist(exec_opts, nodelist)
+            n_jobs = "100%"
+        else:
+            # Make sure there are no duplicate nodes
+            unique_nodes = types.ShellCmdSpec(
+                cmd="sort -u {} > {}".format(exec_opts["nodefile"], nodelist),
+                shell=True,
+                wait=True,
+            )
+            ret.append(unique_nodes)
+
         # GNU parallel cmd
         parallel = (
             "parallel {2} "
@@ -107,22 +120,42 @@ class ExpShellCmdsGenerator:
             "--results {4} "
             "--joblog {3} "
             "--sshloginfile {0} "
+            "--ssh '{6}' "
             '--workdir {4} < "{5}"'
         )
 
         log = pathlib.Path(exec_opts["exp_scratch_root"], "parallel.log")
         parallel = parallel.format(
             nodelist,
-            exec_opts["n_jobs"],
+            n_jobs,
             resume,
             log,
             exec_opts["exp_scratch_root"],
             exec_opts["cmdfile_stem_path"] + exec_opts["cmdfile_ext"],
+            execenv.ssh_cmd(),
         )
 
         parallel_spec = types.ShellCmdSpec(cmd=parallel, shell=True, wait=True)
+        ret.append(parallel_spec)
+
+        return ret
+
+    def _write_weighted_nodelist(
+        self, exec_opts: types.StrDict, nodelist: pathlib.Path
+    ) -> None:
+        nodes = execenv.parse_nodefile(exec_opts["nodefile"])
+
+        # Joblogs from all experiments in the batch run so far
+        batch_scratch_root = pathlib.Path(exec_opts["exp_scratch_root"]).parent
+        runtimes = execenv.joblog_runtimes(batch_scratch_root.glob("*/parallel.log"))
+
+        logins = execenv.nodefile_weighted(
+            nodes, self.cmdopts.get("physics_n_threads") or 1, runtimes
+        )
+        _logger.debug("Weighted nodelist: %s", logins)
 
-        return [unique_nodes, parallel_spec]
+        with utils.utf8open(nodelist, "w") as f:
+            f.write("\n".join(logins) + "\n")
 
 
 __all__ = [
@@ -18,7 +18,7 @@ import logging
 import implements
 
 # Project packages
-from sierra.core import types, utils
+from sierra.core import types, utils, execenv
 from sierra.core.experiment import bindings
 
 _logger = logging.getLogger(__name__)
@@ -117,6 +117,7 @@ class BatchShellCmdsGenerator:
             "--results {4} "
             "--joblog {3} "
             "--sshloginfile {0} "
+            "--ssh '{6}' "
             '--workdir {4} < "{5}"'
         )
 
@@ -129,6 +130,7 @@ class BatchShellCmdsGenerator:
             log,
             exec_opts["batch_scratch_root"],
             exec_opts["cmdfile_stem_path"] + exec_opts["cmdfile_ext"],
+            execenv.ssh_cmd(),
         )
         parallel_spec = types.ShellCmdSpec(cmd=parallel, shell=True, wait=True)
 
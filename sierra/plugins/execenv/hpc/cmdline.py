@@ -30,6 +30,8 @@ class HPCCmdline(PluginCmdline):
 
         - ``--exec-jobs-per-node``
 
+        - ``--exec-autotune``
+
         - ``--exec-no-devnull``
 
         - ``--exec-resume``
@@ -52,6 +54,32 @@ class HPCCmdline(PluginCmdline):
             default=None,
         )
 
+        self.stage2.add_argument(
+            "--exec-autotune",
+            help="""
+                 Calibrate ``--exec-jobs-per-node`` before running the batch:
+                 a few runs from the first experiment are executed at several
+                 concurrency levels around the computed default, and the level
+                 with the highest throughput (runs/hour) is used for the rest
+                 of the batch.  Overrides ``--exec-jobs-per-node``.  The
+                 selected level is cached per host/engine/scenario/execenv in
+                 ``$XDG_CACHE_HOME/sierra``, so subsequent batches start tuned;
+                 delete the cache to re-calibrate.  Only supported for
+                 ``--execenv`` s where runs execute on the node SIERRA is
+                 running on (e.g., ``hpc.local``, ``hpc.slurm``).
+
+                 Calibration happens after stage 1 has generated the
+                 experiment inputs, so anything an :term:`Engine` derives from
+                 ``--exec-jobs-per-node`` in stage 1 (e.g., the # of threads
+                 per run) is *not* recomputed for the selected level.  Engines
+                 refuse ``--exec-autotune`` in such configurations (e.g.,
+                 ARGoS with ``--execenv=hpc.pbs``).
+                 """
+            + self.stage_usage_doc([2]),
+            action="store_true",
+            default=False,
+        )
+
         self.stage2.add_argument(
             "--exec-devnull",
             help="""
@@ -116,6 +144,7 @@ def to_cmdopts(args: argparse.Namespace) -> types.Cmdopts:
         # Multistage
         "exec_devnull": args.exec_devnull,
         "exec_jobs_per_node": args.exec_jobs_per_node,
+        "exec_autotune": args.exec_autotune,
         "exec_resume": args.exec_resume,
         "exec_strict": args.exec_strict,
     }
@@ -16,12 +16,52 @@ from sierra.core import types
 from sierra.plugins import PluginCmdline
 
 
+class SLURMCmdline(hpc.cmdline.HPCCmdline):
+    def init_stage2(self) -> None:
+        """Add SLURM cmdline options.
+
+        In addition to the common HPC options, these include:
+
+        - ``--exec-slurm-launcher``
+
+        """
+        super().init_stage2()
+
+        self.stage2.add_argument(
+            "--exec-slurm-launcher",
+            choices=["parallel", "srun", "array"],
+            help="""
+                 How to launch :term:`Experimental Runs <Experimental Run>`
+                 within a SLURM allocation:
+
+                 - ``parallel`` - GNU parallel ssh-es into each allocated node
+                   via ``--sshloginfile``. Requires a homogeneous
+                   :envvar:`SLURM_TASKS_PER_NODE`.
+
+                 - ``srun`` - Each run is launched as a ``srun --exclusive
+                   -n1`` job step inside the allocation, throttled by GNU
+                   parallel running locally. Runs are placed by SLURM, so
+                   heterogeneous task layouts are supported, and runs are
+                   subject to SLURM accounting and cgroups.
+
+                 - ``array`` - Each experiment is submitted as a SLURM job
+                   array with one task per run, and SIERRA waits for the
+                   array to finish. SIERRA must be run from a login node, not
+                   inside an allocation. ``--exec-resume`` is not supported.
+                 """
+            + self.stage_usage_doc([2]),
+            default="parallel",
+        )
+
+
 def build(parents: list[argparse.ArgumentParser], stages: list[int]) -> PluginCmdline:
     """
     Get a cmdline parser supporting the ``hpc.slurm`` execution environment.
     """
-    return hpc.cmdline.HPCCmdline(parents, stages)
+    return SLURMCmdline(parents, stages)
 
 
 def to_cmdopts(args: argparse.Namespace) -> types.Cmdopts:
-    return hpc.cmdline.to_cmdopts(args)
+    opts = hpc.cmdline.to_cmdopts(args)
+    opts["exec_slurm_launcher"] = args.exec_slurm_launcher
+    return opts
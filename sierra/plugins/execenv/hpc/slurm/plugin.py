@@ -10,6 +10,8 @@ import argparse
 import shutil
 import pathlib
 import os
+import re
+import typing as tp
 
 # 3rd party packages
 import implements
@@ -34,14 +36,14 @@ def cmdline_postparse_configure(args: argparse.Namespace) -> argparse.Namespace:
 
     - :envvar:`SLURM_JOB_ID`
 
+    With ``--exec-slurm-launcher=array``, SIERRA submits its own jobs, so it
+    must *not* be run inside an allocation, and only the first two are used.
     """
+    launcher = getattr(args, "exec_slurm_launcher", "parallel")
 
-    keys = [
-        "SLURM_CPUS_PER_TASK",
-        "SLURM_TASKS_PER_NODE",
-        "SLURM_JOB_NODELIST",
-        "SLURM_JOB_ID",
-    ]
+    keys = ["SLURM_CPUS_PER_TASK", "SLURM_TASKS_PER_NODE"]
+    if launcher != "array":
+        keys.extend(["SLURM_JOB_NODELIST", "SLURM_JOB_ID"])
 
     for k in keys:
         assert k in os.environ, f"Non-SLURM environment detected: '{k}' not found"
@@ -49,19 +51,66 @@ def cmdline_postparse_configure(args: argparse.Namespace) -> argparse.Namespace:
     assert not args.engine_vc, "Engine visual capture not supported on SLURM"
 
     # SLURM_TASKS_PER_NODE can be set to things like '1(x32),3', indicating
-    # that not all nodes will run the same # of tasks. SIERRA expects all
-    # nodes to have the same # tasks allocated to each (i.e., a homogeneous
-    # allocation), so we check for this.
-    assert (
-        "," not in os.environ["SLURM_TASKS_PER_NODE"]
-    ), "SLURM_TASKS_PER_NODE not homogeneous"
+    # that not all nodes will run the same # of tasks. When GNU parallel ssh-es
+    # into nodes it runs the same # jobs on each, so we need a homogeneous
+    # allocation; with srun/job arrays SLURM places runs itself.
+    if launcher == "parallel":
+        assert (
+            "," not in os.environ["SLURM_TASKS_PER_NODE"]
+        ), "SLURM_TASKS_PER_NODE not homogeneous; try --exec-slurm-launcher=srun"
+
+    if launcher == "array":
+        assert (
+            not args.exec_resume
+        ), "--exec-resume not supported with --exec-slurm-launcher=array"
+
+        # Array tasks would queue for resources of their own while the
+        # allocation SIERRA is running in sits idle, and might never start if it
+        # uses up the user's limits.
+        assert "SLURM_JOB_ID" not in os.environ, (
+            "--exec-slurm-launcher=array submits its own jobs: run SIERRA from a "
+            "login node, not inside an allocation"
+        )
 
     return args
 
 
+def tasks_per_node_parse(spec: str) -> list[int]:
+    """
+    Parse :envvar:`SLURM_TASKS_PER_NODE` into the # tasks for each node.
+
+    E.g., ``2(x3),1`` -> ``[2, 2, 2, 1]``.
+    """
+    tasks = []
+    for group in spec.split(","):
+        res = re.fullmatch(r"(\d+)(?:\(x(\d+)\))?", group.strip())
+        assert res is not None, f"Unexpected format in SLURM_TASKS_PER_NODE: '{spec}'"
+        tasks.extend([int(res.group(1))] * int(res.group(2) or 1))
+
+    return tasks
+
+
+def _total_tasks(n_jobs: tp.Optional[int]) -> int:
+    """
+    Get the # of runs which can execute concurrently across the allocation.
+
+    If ``--exec-jobs-per-node`` was given, it is applied to each node;
+    otherwise the per-node task counts from SLURM are used as-is.
+    """
+    tasks = tasks_per_node_parse(os.environ["SLURM_TASKS_PER_NODE"])
+    if n_jobs is not None and "," not in os.environ["SLURM_TASKS_PER_NODE"]:
+        return int(n_jobs) * len(tasks)
+
+    return sum(tasks)
+
+
 @implements.implements(bindings.IExpShellCmdsGenerator)
 class ExpShellCmdsGenerator:
-    """Generate the cmd to correctly invoke GNU Parallel on SLURM HPC."""
+    """Generate the cmds to launch runs on SLURM HPC.
+
+    Depending on ``--exec-slurm-launcher``, runs are launched by GNU parallel
+    via ssh, as ``srun`` job steps, or as a SLURM job array.
+    """
 
     def __init__(self, cmdopts: types.Cmdopts, exp_num: int) -> None:
         self.cmdopts = cmdopts
@@ -90,6 +139,17 @@ class ExpShellCmdsGenerator:
         return []
 
     def exec_exp_cmds(self, exec_opts: types.StrDict) -> list[types.ShellCmdSpec]:
+        launcher = self.cmdopts.get("exec_slurm_launcher", "parallel")
+
+        if launcher == "srun":
+            return self._srun_cmds(exec_opts)
+
+        if launcher == "array":
+            return self._array_cmds(exec_opts)
+
+        return self._parallel_cmds(exec_opts)
+
+    def _parallel_cmds(self, exec_opts: types.StrDict) -> list[types.ShellCmdSpec]:
         jobid = os.environ["SLURM_JOB_ID"]
         nodelist = pathlib.Path(exec_opts["exp_input_root"], f"{jobid}-nodelist.txt")
 
@@ -128,5 +188,67 @@ class ExpShellCmdsGenerator:
 
         return [unique_nodes, parallel_spec]
 
+    def _srun_cmds(self, exec_opts: types.StrDict) -> list[types.ShellCmdSpec]:
+        resume = ""
+        if exec_opts["exec_resume"]:
+            resume = "--resume-failed"
+
+        # GNU parallel runs locally and only throttles; each line in the
+        # commands file becomes its own job step, which SLURM places on a node
+        # with a free task slot.
+        srun = (
+            "srun --exclusive --nodes=1 --ntasks=1 "
+            f"--cpus-per-task={os.environ['SLURM_CPUS_PER_TASK']} "
+            f"{shutil.which('bash') or 'bash'} -c"
+        )
+        parallel = (
+            "parallel {2} "
+            "--jobs {1} "
+            "--results {4} "
+            "--joblog {3} "
+            '--no-notice {0} {{}} < "{5}"'
+        )
+
+        log = pathlib.Path(exec_opts["exp_scratch_root"], "parallel.log")
+        parallel = parallel.format(
+            srun,
+            _total_tasks(exec_opts["n_jobs"]),
+            resume,
+            log,
+            exec_opts["exp_scratch_root"],
+            exec_opts["cmdfile_stem_path"] + exec_opts["cmdfile_ext"],
+        )
+
+        return [types.ShellCmdSpec(cmd=parallel, shell=True, wait=True)]
+
+    def _array_cmds(self, exec_opts: types.StrDict) -> list[types.ShellCmdSpec]:
+        cmdfile = pathlib.Path(
+            exec_opts["cmdfile_stem_path"] + exec_opts["cmdfile_ext"]
+        )
+        with cmdfile.open("r", encoding="utf-8") as f:
+            n_runs = sum(1 for line in f if line.strip())
+
+        # Each array task runs the line in the commands file corresponding to
+        # its index. --wait makes sbatch block until all tasks have finished, so
+        # experiments still execute one after another.
+        task = f'sed -n "$((SLURM_ARRAY_TASK_ID+1))p" "{cmdfile}" | bash'
+        log = pathlib.Path(exec_opts["exp_scratch_root"], "slurm-%A_%a.out")
+        sbatch = (
+            "sbatch --wait --parsable "
+            f"--array=0-{n_runs - 1}%{_total_tasks(exec_opts['n_jobs'])} "
+            "--ntasks=1 "
+            f"--cpus-per-task={os.environ['SLURM_CPUS_PER_TASK']} "
+            f"--job-name=sierra-{pathlib.Path(exec_opts['exp_input_root']).name} "
+            f"--chdir={exec_opts['exp_scratch_root']} "
+            f"--output={log} "
+            f"--wrap='{task}'"
+        )
+
+        return [types.ShellCmdSpec(cmd=sbatch, shell=True, wait=True)]
+
 
-__all__ = ["ExpShellCmdsGenerator", "cmdline_postparse_configure"]
+__all__ = [
+    "ExpShellCmdsGenerator",
+    "cmdline_postparse_configure",
+    "tasks_per_node_parse",
+]
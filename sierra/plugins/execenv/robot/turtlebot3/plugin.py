@@ -118,6 +118,7 @@ class ExpShellCmdsGenerator:
             "--results {4} "
             "--joblog {3} "
             "--sshloginfile {0} "
+            "--ssh '{6}' "
             '--workdir {4} < "{5}"'
         )
 
@@ -136,6 +137,7 @@ class ExpShellCmdsGenerator:
             robot_log,
             exec_opts["exp_scratch_root"],
             robots_ipath,
+            execenv.ssh_cmd(),
         )
 
         # If no master is spawned, then we need to wait for this GNU
@@ -195,10 +197,9 @@ def execenv_check(cmdopts: types.Cmdopts) -> None:
                 cmdopts["nodefile"],
                 node.hostname,
             )
-        if not cmdopts["skip_online_check"]:
-            execenv.check_connectivity(
-                cmdopts, node.login, node.hostname, node.port, "turtlebot3"
-            )
+
+    if not cmdopts["skip_online_check"]:
+        execenv.check_connectivity_all(cmdopts, nodes, "turtlebot3")
 
 
 __all__ = ["ExpShellCmdsGenerator", "cmdline_postparse_configure", "execenv_check"]
@@ -26,7 +26,7 @@ import yaml
 # Project packages
 import sierra.core.variables.batch_criteria as bc
 import sierra.core.plugin as pm
-from sierra.core import types, storage, utils, config, batchroot
+from sierra.core import types, storage, utils, config, batchroot, profiling, threads
 from sierra.core.pipeline.stage3 import gather
 
 _logger = logging.getLogger(__name__)
@@ -47,7 +47,7 @@ def proc_batch_exp(
     """
     pool_opts = {}
 
-    pool_opts["parallelism"] = cmdopts["processing_parallelism"]
+    pool_opts["parallelism"], n_threads = threads.budget(cmdopts)
 
     worker_opts = {
         "project": cmdopts["project"],
@@ -63,7 +63,7 @@ def proc_batch_exp(
         cmdopts["exp_range"], pathset.output_root, criteria.gen_exp_names()
     )
 
-    with mp.Pool(processes=pool_opts["parallelism"]) as pool:
+    with threads.limit(n_threads), mp.Pool(processes=pool_opts["parallelism"]) as pool:
         _execute_for_batch(
             main_config, pathset, exp_to_proc, worker_opts, pool_opts, pool
         )
@@ -80,6 +80,7 @@ def _execute_for_batch(
     m = mp.Manager()
     gatherq = m.Queue()
     processq = m.Queue()
+    budget = gather.MemoryBudget(m, worker_opts["processing_mem_limit"])
 
     for exp in exp_to_proc:
         gatherq.put(exp)
@@ -106,7 +107,7 @@ def _execute_for_batch(
     processed = [
         pool.apply_async(
             _process_worker,
-            (processq, main_config, pathset.stat_interexp_root, worker_opts),
+            (processq, budget, main_config, pathset.stat_interexp_root, worker_opts),
         )
         for _ in range(0, pool_opts["parallelism"])
     ]
@@ -122,6 +123,7 @@ def _execute_for_batch(
     _logger.debug("Processing finished")
 
 
+@profiling.worker
 def _gather_worker(
     gatherq: mp.Queue,
     processq: mp.Queue,
@@ -140,8 +142,10 @@ def _gather_worker(
             break
 
 
+@profiling.worker
 def _process_worker(
     processq: mp.Queue,
+    budget: gather.MemoryBudget,
     main_config: types.YAMLDict,
     batch_stat_interexp_root: pathlib.Path,
     process_opts: types.SimpleDict,
@@ -150,7 +154,10 @@ def _process_worker(
         # Wait for 3 seconds after the queue is empty before bailing
         try:
             spec = processq.get(True, 3)
-            _proc_single_exp(main_config, batch_stat_interexp_root, process_opts, spec)
+            with budget.admit(spec.footprint):
+                _proc_single_exp(
+                    main_config, batch_stat_interexp_root, process_opts, spec
+                )
             processq.task_done()
         except queue.Empty:
             break
@@ -226,6 +233,7 @@ class ExpDataGatherer(gather.BaseGatherer):
                             exp_name=exp_name,
                             item_stem_path=item.relative_to(proj_output_root),
                             collate_col=col,
+                            cols=[col],
                         )
                         for col in conf["cols"]
                     ]
@@ -250,21 +258,25 @@ def _proc_single_exp(
     collated = {}
     key = (spec.gather.item_stem_path, spec.gather.collate_col)
 
-    # Build dictionary of columns instead of starting with empty DataFrame
-    columns_dict = {}
+    # Build a single lazy query selecting the column from each run, so that it
+    # is the only thing read from the gathered files.
+    columns = []
 
-    for i, df in enumerate(spec.dfs):
+    for i, lf in enumerate(spec.dfs):
+        schema = storage.schema(lf)
         assert (
-            spec.gather.collate_col in df.columns
-        ), f"{spec.gather.collate_col} not in {df.columns}"
-
-        collate_df = df[spec.gather.collate_col]
+            spec.gather.collate_col in schema
+        ), f"{spec.gather.collate_col} not in {schema.names()}"
 
-        # Add column to dictionary
-        columns_dict[spec.exp_run_names[i]] = collate_df
+        columns.append(
+            lf.select(pl.col(spec.gather.collate_col).alias(spec.exp_run_names[i]))
+        )
 
-    # Create DataFrame from the dictionary of columns
-    collated[key] = pl.DataFrame(columns_dict)
+    # Runs which are shorter than others are padded with nulls, which
+    # --df-homogenize can then fill.
+    collated[key] = storage.collect(
+        pl.concat(columns, how="horizontal"), engine="streaming"
+    )
 
     for k, v in collated.items():
         file_path, col = k
@@ -17,7 +17,7 @@ import tarfile
 
 # Project packages
 import sierra.core.variables.batch_criteria as bc
-from sierra.core import types, utils, batchroot
+from sierra.core import types, utils, batchroot, profiling
 
 _logger = logging.getLogger(__name__)
 
@@ -89,6 +89,7 @@ def _build_tasklist_for_exp(
     ]
 
 
+@profiling.worker
 def _worker(
     exp_output_root: pathlib.Path, relpath: pathlib.Path, remove_after: bool
 ) -> None:
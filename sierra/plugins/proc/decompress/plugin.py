@@ -16,7 +16,7 @@ import tarfile
 
 # Project packages
 import sierra.core.variables.batch_criteria as bc
-from sierra.core import types, utils, batchroot
+from sierra.core import types, utils, batchroot, profiling
 
 _logger = logging.getLogger(__name__)
 
@@ -74,6 +74,7 @@ def _build_tasklist_for_exp(
     ]
 
 
+@profiling.worker
 def _worker(exp_output_root: pathlib.Path, relpath: pathlib.Path) -> None:
     """Decompress a single tarball from a single experiment.
 
@@ -40,12 +40,52 @@ def build(parents: list[argparse.ArgumentParser], stages: list[int]) -> PluginCm
         + cmdline.stage_usage_doc([3]),
         default=False,
     )
+    cmdline.stage3.add_argument(
+        "--imagize-sequence",
+        action="store_true",
+        help="""
+             If the ``proc.imagize`` plugin is run, treat all files in each
+             heatmap ``src_stem`` directory as a single sequence of frames:
+             color limits are computed once across all frames, and the frames
+             are rendered in order by a single worker which reuses the same
+             figure.  Similarly, all network snapshots from each
+             :term:`Experimental Run` are laid out in order by a single worker,
+             each starting from the layout of the previous snapshot, so that
+             node positions are stable across frames.  Sequences are
+             distributed across the ``--processing-parallelism`` workers.
+
+             Use this when there are many frames per experiment, and/or when
+             the images will be rendered into videos, so that colors are
+             consistent from frame to frame.
+
+             .. versionadded:: 1.5.9
+             """
+        + cmdline.stage_usage_doc([3]),
+        default=False,
+    )
+    cmdline.stage3.add_argument(
+        "--imagize-keep-frames",
+        action="store_true",
+        help="""
+             If ``prod.render`` is also active with ``--project-rendering``,
+             heatmap sequences are piped directly into :program:`ffmpeg` to
+             create videos during stage 3 (implying ``--imagize-sequence``), and
+             the individual frames are not written to disk.  Pass this option
+             to write the frames as well.
+
+             .. versionadded:: 1.5.9
+             """
+        + cmdline.stage_usage_doc([3]),
+        default=False,
+    )
     return cmdline
 
 
 def to_cmdopts(args: argparse.Namespace) -> types.Cmdopts:
     return {
         "imagize_no_stats": args.imagize_no_stats,
+        "imagize_sequence": args.imagize_sequence,
+        "imagize_keep_frames": args.imagize_keep_frames,
     }
 
 
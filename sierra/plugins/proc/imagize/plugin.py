@@ -11,16 +11,19 @@ See :ref:`plugins/proc/imagize` for usage documentation.
 # Core packages
 import multiprocessing as mp
 import typing as tp
+import re
 import logging
 import pathlib
+import shutil
 
 # 3rd party packages
 import yaml
 
 # Project packages
 import sierra.core.variables.batch_criteria as bc
-from sierra.core import types, utils, batchroot, graphs, config
+from sierra.core import types, utils, batchroot, graphs, config, profiling, threads
 from sierra.core.pipeline.stage3 import gather
+from sierra.core.graphs import backends
 from sierra.plugins.proc.statistics import plugin as statistics
 import sierra.core.plugin as pm
 
@@ -61,7 +64,9 @@ def proc_batch_exp(
         cmdopts["exp_range"], pathset.output_root, criteria.gen_exp_names()
     )
 
-    parallelism = cmdopts["processing_parallelism"]
+    parallelism, n_threads = threads.budget(cmdopts)
+    render = _render_opts(cmdopts, n_threads)
+    sequence = cmdopts.get("imagize_sequence", False) or render is not None
 
     tasks = []
     for exp in exp_to_imagize:
@@ -69,6 +74,9 @@ def proc_batch_exp(
         exp_imagize_root = pathset.imagize_root / exp.name
         exp_output_root = pathset.output_root / exp.name
 
+        if render is not None:
+            render["exp_video_root"] = pathset.video_root / exp.name
+
         tasks.extend(
             _build_tasklist_for_exp(
                 exp_stat_root,
@@ -76,17 +84,26 @@ def proc_batch_exp(
                 exp_output_root,
                 imagize_config,
                 cmdopts["storage"],
+                sequence,
+                render,
             )
         )
 
-    # 2025-06-06 [JRH]: This works around what is apparently a nasty memory leak
-    # in hv caused by the hv.save() function for which the usual methods of
-    # clearing memory/figures do not work.  The maxtasksperchild argument +
-    # chunksize kills all the child threads periodically, which fixes the leak
-    # problem, for now.
+    # Static graphs are drawn directly with matplotlib onto a figure which is
+    # reused for every image a worker generates (see graphs.mplrender), so
+    # workers don't need to be recycled to keep memory bounded.
+    #
+    # Sequences are long-running tasks, so they are handed out one at a time to
+    # keep all workers busy.
+    #
+    # The backends must be initialized before the workers are forked (see
+    # backends.hv_ssl_init()), rather than on first use in each worker.
+    backends.initialize()
+
     _logger.debug("Starting %s workers, method=%s", parallelism, mp.get_start_method())
-    with mp.Pool(processes=parallelism, maxtasksperchild=1) as pool:
-        processed = pool.starmap_async(_worker, tasks, chunksize=10)
+    chunksize = 1 if sequence else 10
+    with threads.limit(n_threads), mp.Pool(processes=parallelism) as pool:
+        processed = pool.starmap_async(_worker, tasks, chunksize=chunksize)
 
         _logger.debug("Waiting for workers to finish")
         processed.get()
@@ -94,18 +111,43 @@ def proc_batch_exp(
     _logger.debug("All workers finished")
 
 
+def _render_opts(cmdopts: types.Cmdopts, n_threads: int) -> tp.Optional[dict]:
+    """Get options for rendering heatmap sequences directly into videos.
+
+    Videos are rendered directly if ``prod.render`` is active with
+    ``--project-rendering`` in the same invocation, so that the frames don't
+    have to be written to disk and read back in stage 4.
+    """
+    if not cmdopts.get("project_rendering", False):
+        return None
+
+    if shutil.which("ffmpeg") is None:
+        _logger.warning("ffmpeg not found--cannot render heatmap videos directly")
+        return None
+
+    return {
+        "ffmpeg_opts": threads.ffmpeg_opts(cmdopts["render_cmd_opts"], n_threads),
+        "write_frames": cmdopts.get("imagize_keep_frames", False),
+    }
+
+
 def _build_tasklist_for_exp(
     exp_stat_root: pathlib.Path,
     exp_imagize_root: pathlib.Path,
     exp_output_root: pathlib.Path,
     imagize_config: types.YAMLDict,
     storage: str,
+    sequence: bool,
+    render: tp.Optional[dict],
 ) -> list[tuple[types.YAMLDict, dict]]:
     """Add all files from experiment to multiprocessing queue for processing.
 
     Enqueueing for processing is done at the file-level rather than
     per-experiment, so that for systems with more CPUs than experiments you
-    still get maximum throughput.
+    still get maximum throughput. If ``sequence`` is True, heatmaps are instead
+    enqueued at the level of each ``src_stem`` directory, and all files in it
+    are rendered as a single sequence. If ``render`` is not None, sequences
+    are also rendered directly into videos.
     """
     res = []
 
@@ -119,7 +161,13 @@ def _build_tasklist_for_exp(
         if dict(graph)["type"] == "heatmap":
             res.extend(
                 _build_task_for_heatmap(
-                    graph, imagize_config, storage, exp_stat_root, exp_imagize_root
+                    graph,
+                    imagize_config,
+                    storage,
+                    exp_stat_root,
+                    exp_imagize_root,
+                    sequence,
+                    render,
                 )
             )
 
@@ -131,6 +179,7 @@ def _build_tasklist_for_exp(
                     storage,
                     exp_output_root,
                     exp_imagize_root,
+                    sequence,
                 )
             )
         else:
@@ -145,6 +194,8 @@ def _build_task_for_heatmap(
     storage: str,
     exp_stat_root: pathlib.Path,
     exp_imagize_root: pathlib.Path,
+    sequence: bool,
+    render: tp.Optional[dict],
 ) -> list[tuple[types.YAMLDict, dict]]:
     candidate = exp_stat_root / dict(graph)["src_stem"]
     res = []  # type: list[tuple[types.YAMLDict, dict]]
@@ -157,34 +208,64 @@ def _build_task_for_heatmap(
         return res
 
     imagize_output_root = exp_imagize_root / candidate.relative_to(exp_stat_root)
-    utils.dir_create_checked(imagize_output_root, exist_ok=True)
+    if render is None or render["write_frames"]:
+        utils.dir_create_checked(imagize_output_root, exist_ok=True)
 
-    for fpath in candidate.iterdir():
+    fpaths = list(candidate.iterdir())
+    for fpath in fpaths:
         assert (
             fpath.is_file()
         ), f"Imagize directory {candidate} must only contain files!"
 
-        res.append(
-            (
-                imagize_config,
-                {
-                    "input_path": fpath,
-                    "graph_stem": candidate.relative_to(exp_stat_root),
-                    "imagize_output_root": imagize_output_root,
-                    "batch_root": exp_stat_root.parent.parent,
-                    "storage": storage,
-                },
+    if sequence:
+        opts = {
+            "input_paths": sorted(fpaths, key=_frame_key),
+            "graph_stem": candidate.relative_to(exp_stat_root),
+            "imagize_output_root": imagize_output_root,
+            "batch_root": exp_stat_root.parent.parent,
+            "storage": storage,
+        }
+        if render is not None:
+            # Same path prod.render would use for the imagized frames
+            leaf = candidate.relative_to(exp_stat_root)
+            opts["video_fpath"] = (
+                render["exp_video_root"] / leaf / (leaf.name + config.RENDERING["format"])
             )
+            opts["ffmpeg_opts"] = render["ffmpeg_opts"]
+            opts["write_frames"] = render["write_frames"]
+
+        res.append((imagize_config, opts))
+        return res
+
+    res.extend(
+        (
+            imagize_config,
+            {
+                "input_path": fpath,
+                "graph_stem": candidate.relative_to(exp_stat_root),
+                "imagize_output_root": imagize_output_root,
+                "batch_root": exp_stat_root.parent.parent,
+                "storage": storage,
+            },
         )
+        for fpath in fpaths
+    )
     return res
 
 
+def _frame_key(fpath: pathlib.Path) -> tuple[int, str]:
+    """Order frame files by the numeric ID at the end of their stem."""
+    res = re.search(r"(\d+)$", fpath.stem)
+    return (int(res.group(1)) if res else -1, fpath.name)
+
+
 def _build_task_for_network(
     graph: types.YAMLDict,
     imagize_config: types.YAMLDict,
     storage: str,
     exp_output_root: pathlib.Path,
     exp_imagize_root: pathlib.Path,
+    sequence: bool,
 ) -> list[tuple[types.YAMLDict, dict]]:
 
     res = []
@@ -198,16 +279,21 @@ def _build_task_for_network(
             continue
         imagize_output_root = exp_imagize_root / candidate.relative_to(exp_output_root)
         utils.dir_create_checked(imagize_output_root, exist_ok=True)
-        for fpath in candidate.iterdir():
+
+        fpaths = list(candidate.iterdir())
+        for fpath in fpaths:
             assert (
                 fpath.is_file()
             ), f"Imagize directory {candidate} must only contain files!"
 
+        # Snapshots from a single run are laid out in order by a single worker,
+        # so that each layout can start from the previous one.
+        if sequence:
             res.append(
                 (
                     imagize_config,
                     {
-                        "input_path": fpath,
+                        "input_paths": sorted(fpaths, key=_frame_key),
                         "graph_stem": dict(graph)["src_stem"],
                         "imagize_output_root": imagize_output_root,
                         "batch_root": exp_output_root.parent.parent,
@@ -215,9 +301,25 @@ def _build_task_for_network(
                     },
                 )
             )
+            continue
+
+        res.extend(
+            (
+                imagize_config,
+                {
+                    "input_path": fpath,
+                    "graph_stem": dict(graph)["src_stem"],
+                    "imagize_output_root": imagize_output_root,
+                    "batch_root": exp_output_root.parent.parent,
+                    "storage": storage,
+                },
+            )
+            for fpath in fpaths
+        )
     return res
 
 
+@profiling.worker
 def _worker(imagize_config: types.YAMLDict, imagize_opts: dict) -> None:
 
     _proc_single_exp(imagize_config, imagize_opts)
@@ -242,53 +344,73 @@ def _proc_single_exp(imagize_config: types.YAMLDict, imagize_opts: dict) -> None
         if dict(graph)["src_stem"] == str(imagize_opts["graph_stem"]):
             match = graph
 
-    if match is not None:
-        graph_pathset = graphs.PathSet(
-            input_root=imagize_opts["input_path"].parent,
-            output_root=imagize_opts["imagize_output_root"],
-            model_root=None,
-            batchroot=imagize_opts["batch_root"],
+    if match is None:
+        _logger.warning(
+            "No match for graph with src_stem='%s' found in configuration",
+            imagize_opts["graph_stem"],
         )
+        return
 
-        # All input paths are of the form <dir>/<dir>_<NUMBER>.{extension}
-        if dict(graph)["type"] == "heatmap":
-            graphs.heatmap(
-                pathset=graph_pathset,
-                input_stem=imagize_opts["input_path"].stem,
-                output_stem=imagize_opts["input_path"].stem,
-                title=dict(match)["title"],
-                medium=imagize_opts["storage"],
-                xlabel="X",
-                ylabel="Y",
-                colnames=(
-                    match.get("x", "x"),
-                    match.get("y", "y"),
-                    match.get("z", "z"),
-                ),
-                backend="matplotlib",
-            )
-        elif dict(graph)["type"] == "network":
+    # All input paths are of the form <dir>/<dir>_<NUMBER>.{extension}
+    input_paths = imagize_opts.get("input_paths", [imagize_opts.get("input_path")])
+    graph_pathset = graphs.PathSet(
+        input_root=input_paths[0].parent,
+        output_root=imagize_opts["imagize_output_root"],
+        model_root=None,
+        batchroot=imagize_opts["batch_root"],
+    )
+    colnames = (match.get("x", "x"), match.get("y", "y"), match.get("z", "z"))
+
+    if dict(match)["type"] == "heatmap" and "input_paths" in imagize_opts:
+        graphs.heatmap_sequence(
+            pathset=graph_pathset,
+            input_stems=[p.stem for p in input_paths],
+            title=dict(match)["title"],
+            medium=imagize_opts["storage"],
+            xlabel="X",
+            ylabel="Y",
+            colnames=colnames,
+            video_fpath=imagize_opts.get("video_fpath"),
+            ffmpeg_opts=imagize_opts.get("ffmpeg_opts", ""),
+            write_frames=imagize_opts.get("write_frames", True),
+        )
+
+    elif dict(match)["type"] == "heatmap":
+        graphs.heatmap(
+            pathset=graph_pathset,
+            input_stem=input_paths[0].stem,
+            output_stem=input_paths[0].stem,
+            title=dict(match)["title"],
+            medium=imagize_opts["storage"],
+            xlabel="X",
+            ylabel="Y",
+            colnames=colnames,
+            backend="matplotlib",
+        )
+
+    elif dict(match)["type"] == "network":
+        # Only used for sequences; a single snapshot has nothing to reuse.
+        layout_cache = (
+            graphs.NetworkLayoutCache() if "input_paths" in imagize_opts else None
+        )
+        for fpath in input_paths:
             graphs.network(
                 pathset=graph_pathset,
-                layout=graph.get("layout", "spring"),
-                input_stem=imagize_opts["input_path"].stem,
-                output_stem=imagize_opts["input_path"].stem,
+                layout=match.get("layout", "spring"),
+                input_stem=fpath.stem,
+                output_stem=fpath.stem,
                 title=dict(match)["title"],
                 medium=imagize_opts["storage"],
-                node_color_attr=graph.get("node_color_attr", None),
-                node_size_attr=graph.get("node_size_attr", None),
-                edge_color_attr=graph.get("edge_color_attr", None),
-                edge_weight_attr=graph.get("edge_weight_attr", None),
-                edge_label_attr=graph.get("edge_label_attr", None),
+                node_color_attr=match.get("node_color_attr", None),
+                node_size_attr=match.get("node_size_attr", None),
+                edge_color_attr=match.get("edge_color_attr", None),
+                edge_weight_attr=match.get("edge_weight_attr", None),
+                edge_label_attr=match.get("edge_label_attr", None),
                 backend="matplotlib",
+                layout_cache=layout_cache,
+                ext=fpath.suffix,
             )
 
-    else:
-        _logger.warning(
-            "No match for graph with src_stem='%s' found in configuration",
-            imagize_opts["graph_stem"],
-        )
-
 
 class ImagizeInputGatherer(gather.BaseGatherer):
     """Gather :term:`Raw Output Data` files from all runs for imagizing.
@@ -16,7 +16,7 @@ import os
 
 # Project packages
 import sierra.core.variables.batch_criteria as bc
-from sierra.core import types, utils, batchroot, config
+from sierra.core import types, utils, batchroot, config, profiling, threads
 from sierra.core import plugin as pm
 
 _logger = logging.getLogger(__name__)
@@ -40,7 +40,7 @@ def proc_batch_exp(
         cmdopts["exp_range"], pathset.output_root, criteria.gen_exp_names()
     )
 
-    parallelism = cmdopts["processing_parallelism"]
+    parallelism, n_threads = threads.budget(cmdopts)
 
     tasks = []
     run_metrics_leaf = main_config["sierra"]["run"]["run_metrics_leaf"]
@@ -60,12 +60,13 @@ def proc_batch_exp(
         )
 
     _logger.debug("Starting %s workers, method=%s", parallelism, mp.get_start_method())
-    with mp.Pool(processes=parallelism) as pool:
+    with threads.limit(n_threads), mp.Pool(processes=parallelism) as pool:
         pool.starmap(_worker, tasks)
 
     _logger.debug("All workers finished")
 
 
+@profiling.worker
 def _worker(
     run_output_root: pathlib.Path,
     exp_stat_root: pathlib.Path,
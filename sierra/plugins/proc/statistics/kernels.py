@@ -1,71 +1,90 @@
 # Copyright 2021 John Harwell, All rights reserved.
 #
 #  SPDX-License-Identifier: MIT
-"""Kernels for the different types of statistics generated from experiments."""
+"""Kernels for the different types of statistics generated from experiments.
+
+Statistics are calculated across runs for each row of an output file. All
+selected kernels are computed with :func:`compute` as a single lazy query over
+the files from all runs: each kernel contributes the aggregations it needs,
+and then derives its statistics from the aggregated result. The query is
+collected with polars' streaming engine, so polars can parallelize it and
+doesn't have to hold the data from all runs in memory at once.
+"""
 
 # Core packages
 import typing as tp
-import math
 
 # 3rd party packages
 import polars as pl
 import numpy as np
 
 # Project packages
-from sierra.core import config
+from sierra.core import config, storage
 
+# Names of the columns in aggregated results for the row index/# runs; can't
+# clash with the names of aggregations.
+_ROW_IDX = "__row_idx"
+_N_RUNS = "__n_runs"
 
-def conf95(
-    groupby,
-    ungrouped: pl.DataFrame,
-) -> dict[str, pl.DataFrame]:
-    """Generate stddev statistics plotting for 95% confidence intervals.
 
-    Does not support non-numeric data.  Applicable to:
+def compute(lfs: list[pl.LazyFrame], kernels: list[str]) -> dict[str, pl.DataFrame]:
+    """Compute statistics across runs for an output file.
 
-        - :func:`~sierra.core.graphs.stacked_line`
+    Args:
+        lfs: The output file from each run. All must have the same columns.
 
-        - :func:`~sierra.core.graphs.summary_line`
+        kernels: The kernels to compute statistics with, in order; any
+                 statistics computed by more than one kernel are taken from
+                 the last one.
+
+    Returns:
+        Mapping of statistic extension (e.g., ``.stddev``) to dataframe.
+
+    .. versionadded:: 1.5.9
     """
-    # Get the grouping column names
-    group_cols = groupby.by if hasattr(groupby, "by") else []
-
-    # Build aggregation expressions for non-grouping columns only
-    agg_exprs = []
-    for col in ungrouped.columns:
-        if col not in group_cols:
-            agg_exprs.extend(
-                [
-                    pl.col(col).mean().alias(f"{col}_mean"),
-                    pl.col(col).std().alias(f"{col}_std"),
-                ]
-            )
+    schema = storage.schema(lfs[0])
+
+    # Kernels share aggregations which have the same name (e.g., the mean)
+    aggs = {}
+    for kernel in kernels:
+        for expr in _KERNELS[kernel][0](schema):
+            aggs[expr.meta.output_name()] = expr
+
+    query = (
+        pl.concat([lf.with_row_index(_ROW_IDX) for lf in lfs], how="vertical")
+        .group_by(_ROW_IDX)
+        .agg(pl.len().alias(_N_RUNS), *aggs.values())
+        .sort(_ROW_IDX)
+    )
+    aggregated = storage.collect(query, engine="streaming")
 
-    # Aggregate by group
-    df_like = groupby.agg(agg_exprs)
-    if isinstance(df_like, pl.LazyFrame):
-        df_like = df_like.collect()
+    dfs = {}
+    for kernel in kernels:
+        dfs.update(_KERNELS[kernel][1](aggregated, schema))
 
-    # Sort by grouping column to maintain order
-    if group_cols:
-        df_like = df_like.sort(group_cols[0])
-        # Then drop the grouping column
-        df_like = df_like.drop(group_cols)
+    return dfs
 
-    # Split into separate dataframes for mean and stddev
-    mean_cols = [col for col in df_like.columns if col.endswith("_mean")]
-    std_cols = [col for col in df_like.columns if col.endswith("_std")]
 
-    df_mean = df_like.select(mean_cols).rename(lambda col: col.replace("_mean", ""))
-    df_std = df_like.select(std_cols).rename(lambda col: col.replace("_std", ""))
+def conf95(aggregated: pl.DataFrame, schema: pl.Schema) -> dict[str, pl.DataFrame]:
+    """Generate stddev statistics plotting for 95% confidence intervals.
+
+    Does not support non-numeric data.  Applicable to:
 
+        - :func:`~sierra.core.graphs.stacked_line`
+
+        - :func:`~sierra.core.graphs.summary_line`
+    """
     return {
-        config.STATS["mean"].exts["mean"]: _fillna(_df_round(df_mean)),
-        config.STATS["conf95"].exts["stddev"]: _fillna(_df_round(df_std)),
+        config.STATS["mean"].exts["mean"]: _fillna(
+            _df_round(_stat(aggregated, schema, "mean"))
+        ),
+        config.STATS["conf95"].exts["stddev"]: _fillna(
+            _df_round(_stat(aggregated, schema, "std"))
+        ),
     }
 
 
-def mean(groupby, ungrouped: pl.DataFrame) -> dict[str, pl.DataFrame]:
+def mean(aggregated: pl.DataFrame, schema: pl.Schema) -> dict[str, pl.DataFrame]:
     """
     Generate mean statistics only.
 
@@ -83,99 +102,37 @@ def mean(groupby, ungrouped: pl.DataFrame) -> dict[str, pl.DataFrame]:
 
        Now supports non-numeric columns via ``mode()``.
     """
-    # Get the grouping column names
-    group_cols = groupby.by if hasattr(groupby, "by") else []
-
-    # Build expressions based on actual column dtypes
-    agg_exprs = []
-    for col in ungrouped.columns:
-        if col not in group_cols:  # Skip grouping columns
-            if ungrouped[col].dtype.is_numeric():
-                agg_exprs.append(pl.col(col).mean().alias(col))
-            else:
-                agg_exprs.append(pl.col(col).mode().first().alias(col))
-
-    # Aggregate by group - this computes stats for each group
-    df_like = groupby.agg(agg_exprs)
-    if isinstance(df_like, pl.LazyFrame):
-        df_like = df_like.collect()
-
-    # Sort by row_idx to maintain original order, because group_by() does not
-    # preserve order
-    df_like = df_like.sort(group_cols[0])
-    # Then drop the row_idx column
-    df_like = df_like.drop(group_cols)
-
-    return {config.STATS["mean"].exts["mean"]: _fillna(df_like)}
+    df = aggregated.select(
+        pl.col(_agg_name(col, "mean" if dtype.is_numeric() else "mode")).alias(col)
+        for col, dtype in schema.items()
+    )
+    return {config.STATS["mean"].exts["mean"]: _fillna(df)}
 
 
-def bw(groupby, ungrouped: pl.DataFrame) -> dict[str, pl.DataFrame]:
+def bw(aggregated: pl.DataFrame, schema: pl.Schema) -> dict[str, pl.DataFrame]:
     """
     Generate statistics for plotting box and whisker plots around data points.
 
     Does not support non-numeric data.  Applicable to:
 
         - :func:`~sierra.core.graphs.summary_line`
-    """
-    # Get the grouping column names
-    group_cols = groupby.by if hasattr(groupby, "by") else []
-
-    count_result = groupby.count()
-    if hasattr(count_result, "collect"):
-        n_runs = count_result.collect().height
-    else:
-        n_runs = count_result.height
-
-    # Build aggregation expressions for non-grouping columns only
-    agg_exprs = []
-    for col in ungrouped.columns:
-        if col not in group_cols:
-            agg_exprs.extend(
-                [
-                    pl.col(col).mean().alias(f"{col}_mean"),
-                    pl.col(col).median().alias(f"{col}_median"),
-                    pl.col(col).quantile(0.25).alias(f"{col}_q1"),
-                    pl.col(col).quantile(0.75).alias(f"{col}_q3"),
-                ]
-            )
 
-    # For grouped data, aggregate
-    stats = groupby.agg(agg_exprs)
-    if isinstance(stats, pl.LazyFrame):
-        stats = stats.collect()
-
-    # Sort by grouping column to maintain order - group_by() does not do this by
-    # default.
-    stats = stats.sort(group_cols[0])
-    # Then drop the grouping column
-    stats = stats.drop(group_cols)
-
-    # Extract individual statistics
-    mean_cols = [col for col in stats.columns if col.endswith("_mean")]
-    median_cols = [col for col in stats.columns if col.endswith("_median")]
-    q1_cols = [col for col in stats.columns if col.endswith("_q1")]
-    q3_cols = [col for col in stats.columns if col.endswith("_q3")]
-
-    csv_mean = _fillna(
-        _df_round(stats.select(mean_cols).rename(lambda col: col.replace("_mean", "")))
-    )
-    csv_median = _fillna(
-        _df_round(
-            stats.select(median_cols).rename(lambda col: col.replace("_median", ""))
-        )
-    )
-    csv_q1 = _fillna(
-        _df_round(stats.select(q1_cols).rename(lambda col: col.replace("_q1", "")))
-    )
-    csv_q3 = _fillna(
-        _df_round(stats.select(q3_cols).rename(lambda col: col.replace("_q3", "")))
-    )
+    .. versionchanged:: 1.5.9
+
+       The notches around the median use the # of runs for each row, rather
+       than the # of rows.
+    """
+    csv_mean = _fillna(_df_round(_stat(aggregated, schema, "mean")))
+    csv_median = _fillna(_df_round(_stat(aggregated, schema, "median")))
+    csv_q1 = _fillna(_df_round(_stat(aggregated, schema, "q1")))
+    csv_q3 = _fillna(_df_round(_stat(aggregated, schema, "q3")))
 
     # Calculate IQR and whiskers
     # Convert to numpy for element-wise operations
     q1_vals = csv_q1.to_numpy()
     q3_vals = csv_q3.to_numpy()
     median_vals = csv_median.to_numpy()
+    n_runs = aggregated[_N_RUNS].to_numpy().reshape(-1, 1)
     iqr = np.abs(q3_vals - q1_vals)  # Inter-quartile range
     whislo_vals = q1_vals - 1.50 * iqr
     whishi_vals = q3_vals + 1.50 * iqr
@@ -184,8 +141,8 @@ def bw(groupby, ungrouped: pl.DataFrame) -> dict[str, pl.DataFrame]:
     #
     # (Robert McGill, John W. Tukey and Wayne A. Larsen. Variations of Box
     # Plots, The American Statistician, Vol. 32, No. 1 (Feb., 1978), pp. 12-16
-    cilo_vals = median_vals - 1.57 * iqr / math.sqrt(n_runs)
-    cihi_vals = median_vals + 1.57 * iqr / math.sqrt(n_runs)
+    cilo_vals = median_vals - 1.57 * iqr / np.sqrt(n_runs)
+    cihi_vals = median_vals + 1.57 * iqr / np.sqrt(n_runs)
 
     # Convert back to DataFrames with same column names
     csv_whislo = pl.DataFrame(whislo_vals, schema=csv_q1.columns)
@@ -205,6 +162,67 @@ def bw(groupby, ungrouped: pl.DataFrame) -> dict[str, pl.DataFrame]:
     }
 
 
+def _conf95_aggs(schema: pl.Schema) -> list[pl.Expr]:
+    return [
+        expr
+        for col, dtype in schema.items()
+        for expr in [
+            _agg(col, dtype, "mean", pl.col(col).mean()),
+            _agg(col, dtype, "std", pl.col(col).std()),
+        ]
+    ]
+
+
+def _mean_aggs(schema: pl.Schema) -> list[pl.Expr]:
+    return [
+        (
+            pl.col(col).mean().alias(_agg_name(col, "mean"))
+            if dtype.is_numeric()
+            else pl.col(col).mode().sort().first().alias(_agg_name(col, "mode"))
+        )
+        for col, dtype in schema.items()
+    ]
+
+
+def _bw_aggs(schema: pl.Schema) -> list[pl.Expr]:
+    return [
+        expr
+        for col, dtype in schema.items()
+        for expr in [
+            _agg(col, dtype, "mean", pl.col(col).mean()),
+            _agg(col, dtype, "median", pl.col(col).median()),
+            _agg(col, dtype, "q1", pl.col(col).quantile(0.25)),
+            _agg(col, dtype, "q3", pl.col(col).quantile(0.75)),
+        ]
+    ]
+
+
+_KERNELS = {
+    "mean": (_mean_aggs, mean),
+    "conf95": (_conf95_aggs, conf95),
+    "bw": (_bw_aggs, bw),
+}
+
+
+def _agg(col: str, dtype: pl.DataType, stat: str, expr: pl.Expr) -> pl.Expr:
+    """Get a numeric aggregation of a column, or null if it isn't numeric."""
+    if not (dtype.is_numeric() or dtype == pl.Boolean):
+        expr = pl.lit(None, dtype=dtype)
+
+    return expr.alias(_agg_name(col, stat))
+
+
+def _agg_name(col: str, stat: str) -> str:
+    # The ASCII unit separator can't appear in column names from any sane
+    # output file.
+    return f"{col}\x1f{stat}"
+
+
+def _stat(aggregated: pl.DataFrame, schema: pl.Schema, stat: str) -> pl.DataFrame:
+    """Get the aggregated values of a statistic for all columns."""
+    return aggregated.select(pl.col(_agg_name(col, stat)).alias(col) for col in schema)
+
+
 def _df_round(df: pl.DataFrame) -> pl.DataFrame:
     """Round all float columns to 8 decimal places."""
     return df.with_columns(
@@ -234,4 +252,4 @@ def _fillna(
     raise TypeError(f"Unknown type={type(df_like)}, value={df_like}")
 
 
-__all__ = ["bw", "conf95", "mean"]
+__all__ = ["bw", "compute", "conf95", "mean"]
@@ -8,6 +8,7 @@ Classes for generating statistics within and across experiments in a batch.
 
 # Core packages
 import multiprocessing as mp
+import typing as tp
 import queue
 import logging
 import pathlib
@@ -19,8 +20,10 @@ import yaml
 
 # Project packages
 import sierra.core.variables.batch_criteria as bc
-from sierra.core import types, utils, storage, batchroot, config
+from sierra.core import types, utils, batchroot, config, statistics, storage, profiling
+from sierra.core import threads
 from sierra.core.pipeline.stage3 import gather
+from sierra.core.graphs import schema
 import sierra.core.plugin as pm
 from sierra.plugins.proc.statistics import kernels
 
@@ -113,6 +116,7 @@ class DataGatherer(gather.BaseGatherer):
                         exp_name=exp_name,
                         item_stem_path=item.relative_to(proj_output_root),
                         collate_col=None,
+                        cols=self._calc_cols(item.relative_to(proj_output_root)),
                     )
                 )
                 continue
@@ -130,6 +134,7 @@ class DataGatherer(gather.BaseGatherer):
                         exp_name=exp_name,
                         item_stem_path=item.relative_to(proj_output_root),
                         collate_col=None,
+                        cols=self._calc_cols(item.relative_to(proj_output_root)),
                     )
                 )
                 continue
@@ -147,12 +152,37 @@ class DataGatherer(gather.BaseGatherer):
                         exp_name=exp_name,
                         item_stem_path=item.relative_to(proj_output_root),
                         collate_col=None,
+                        cols=self._calc_cols(item.relative_to(proj_output_root)),
                     )
                 )
                 continue
 
         return to_gather
 
+    def _calc_cols(self, item_stem_path: pathlib.Path) -> tp.Optional[list[str]]:
+        """Calculate the columns to gather from an output file.
+
+        With ``--dist-stats-prune``, this is the union of the columns used by
+        all graphs generated from the file, and all columns otherwise.
+        """
+        if not self.gather_opts["dist_stats_prune"]:
+            return None
+
+        cols = []
+        for kind in ["intra-exp", "inter-exp"]:
+            for category in self.config.get(kind, {}).values():
+                for graph in category:
+                    if graph["src_stem"] not in str(item_stem_path):
+                        continue
+
+                    graph_cols = schema.columns(graph)
+                    if graph_cols is None:
+                        return None
+
+                    cols.extend(graph_cols)
+
+        return list(dict.fromkeys(cols))
+
 
 def proc_batch_exp(
     main_config: types.YAMLDict,
@@ -181,14 +211,17 @@ def proc_batch_exp(
         "template_input_leaf": template_input_leaf,
         "df_verify": cmdopts["df_verify"],
         "dist_stats": cmdopts["dist_stats"],
+        "dist_stats_bundle": cmdopts["dist_stats_bundle"],
+        "dist_stats_prune": cmdopts["dist_stats_prune"],
         "processing_mem_limit": cmdopts["processing_mem_limit"],
         "storage": cmdopts["storage"],
         "project_config_root": cmdopts["project_config_root"],
         "df_homogenize": cmdopts["df_homogenize"],
+        "confusion_targets": _confusion_targets(cmdopts["project_config_root"]),
     }
 
     pool_opts = {}
-    parallelism = cmdopts["processing_parallelism"]
+    parallelism, n_threads = threads.budget(cmdopts)
 
     # Aways need to have at least one of each! If SIERRA is invoked on a machine
     # with 2 or less logical cores, the calculation with psutil.cpu_count() will
@@ -196,7 +229,7 @@ def proc_batch_exp(
     pool_opts["n_gatherers"] = max(1, int(parallelism * 0.25))
     pool_opts["n_processors"] = max(1, int(parallelism * 0.75))
 
-    with mp.Pool(
+    with threads.limit(n_threads), mp.Pool(
         processes=pool_opts["n_gatherers"] + pool_opts["n_processors"]
     ) as pool:
         _execute_for_batch(
@@ -227,6 +260,7 @@ def _execute_for_batch(
     m = mp.Manager()
     gatherq = m.Queue()
     processq = m.Queue()
+    budget = gather.MemoryBudget(m, stat_opts["processing_mem_limit"])
 
     for exp in exp_to_proc:
         gatherq.put(exp)
@@ -252,7 +286,9 @@ def _execute_for_batch(
     )
 
     processed = [
-        pool.apply_async(_process_worker, (processq, main_config, pathset, stat_opts))
+        pool.apply_async(
+            _process_worker, (processq, budget, main_config, pathset, stat_opts)
+        )
         for i in range(0, pool_opts["n_processors"])
     ]
 
@@ -278,6 +314,34 @@ def _execute_for_batch(
     ), f"Finished processing but process queue has {processq.qsize()} items?"
 
 
+def _confusion_targets(
+    project_config_root: str,
+) -> dict[str, tuple[str, str]]:
+    """Get the output files which confusion matrices are generated from.
+
+    Returns a dictionary mapping ``src_stem`` to the ``(truth_col,
+    predicted_col)`` for each intra- and inter-experiment confusion matrix in
+    ``graphs.yaml``.
+    """
+    config_path = pathlib.Path(project_config_root) / config.PROJECT_YAML.graphs
+    if not utils.path_exists(config_path):
+        return {}
+
+    graphs_config = yaml.load(utils.utf8open(config_path), yaml.FullLoader)
+
+    return {
+        g["src_stem"]: (
+            g.get("truth_col", "truth"),
+            g.get("predicted_col", "predicted"),
+        )
+        for kind in ["intra-exp", "inter-exp"]
+        for category in (graphs_config or {}).get(kind, {}).values()
+        for g in category
+        if g.get("type") == "confusion_matrix"
+    }
+
+
+@profiling.worker
 def _gather_worker(
     gatherer_type,
     gatherq: mp.Queue,
@@ -312,8 +376,10 @@ def _gather_worker(
     _logger.trace(f"Gather worker {os.getpid()} exit")
 
 
+@profiling.worker
 def _process_worker(
     processq: mp.Queue,
+    budget: gather.MemoryBudget,
     main_config: types.YAMLDict,
     pathset: batchroot.PathSet,
     stat_opts: dict[str, str],
@@ -330,7 +396,8 @@ def _process_worker(
         try:
             spec = processq.get(True, timeout)
 
-            _proc_single_exp(main_config, stat_opts, pathset, spec)
+            with budget.admit(spec.footprint):
+                _proc_single_exp(main_config, stat_opts, pathset, spec)
             processq.task_done()
             got_item = True
 
@@ -362,36 +429,51 @@ def _proc_single_exp(
     You also can't just create loggers with unique names, as this seems to be
     something like the GIL, but for the logging module.  Sometimes python sucks.
     """
-    # Add row index to each DataFrame BEFORE concatenating
-    indexed_dfs = [df.with_row_index("row_idx") for df in spec.dfs]
-
-    # Now concatenate - this will have multiple rows with the same row_idx
-    csv_concat = pl.concat(indexed_dfs, how="vertical")
-
-    # Group by row_idx - now each group has N runs worth of data
-    by_row_index = csv_concat.group_by("row_idx")
     exp_stat_root = pathset.stat_root / spec.gather.exp_name
-
     utils.dir_create_checked(exp_stat_root, exist_ok=True)
 
-    dfs = {}
+    to_compute = []
     if stat_opts["dist_stats"] in ["none", "all"]:
-        dfs.update(kernels.mean(by_row_index, csv_concat))
+        to_compute.append("mean")
 
     if stat_opts["dist_stats"] in ["conf95", "all"]:
-        dfs.update(kernels.conf95(by_row_index, csv_concat))
+        to_compute.append("conf95")
 
     if stat_opts["dist_stats"] in ["bw", "all"]:
-        dfs.update(kernels.bw(by_row_index, csv_concat))
-
-    for ext, df in dfs.items():
-        opath = exp_stat_root / spec.gather.item_stem_path
-        utils.dir_create_checked(opath.parent, exist_ok=True)
-        opath = opath.with_suffix(ext)
+        to_compute.append("bw")
+
+    # The gathered outputs are lazy scans, so they are actually read here.
+    with profiling.span(
+        "kernel",
+        exp=spec.gather.exp_name,
+        item=spec.gather.item_stem_path.as_posix(),
+    ):
+        dfs = kernels.compute(spec.dfs, to_compute)
+
+    opath = exp_stat_root / spec.gather.item_stem_path
+    utils.dir_create_checked(opath.parent, exist_ok=True)
+
+    statistics.write(
+        {
+            ext: utils.df_fill(df, stat_opts["df_homogenize"])
+            for ext, df in dfs.items()
+        },
+        opath.with_suffix(""),
+        "storage.csv",
+        stat_opts["dist_stats_bundle"],
+    )
 
+    # Categorical data doesn't average, so exact counts from all runs are
+    # computed for anything which goes into a confusion matrix.
+    stem = spec.gather.item_stem_path.with_suffix("").as_posix()
+    if stem in stat_opts["confusion_targets"]:
+        truth_col, predicted_col = stat_opts["confusion_targets"][stem]
+        runs = [
+            storage.collect(lf.select(truth_col, predicted_col)) for lf in spec.dfs
+        ]
         storage.df_write(
-            utils.df_fill(df, stat_opts["df_homogenize"]),
-            opath,
+            statistics.confusion_counts(runs, truth_col, predicted_col),
+            opath.with_suffix(config.CONFUSION_COUNTS_EXT),
             "storage.csv",
         )
 
@@ -168,6 +168,23 @@ def _build_stage4(cmdline: PluginCmdline) -> PluginCmdline:
              """,
         default="matplotlib",
     )
+    cmdline.stage4.add_argument(
+        "--graphs-max-points",
+        type=int,
+        help="""
+             Specify the maximum # of points to plot for each line on
+             :py:func:`Stacked Line <sierra.core.graphs.stacked_line.generate>`
+             graphs.  Longer time series are decimated with a shape-preserving
+             method (LTTB by default) before plotting, which greatly reduces
+             rendering time and the size of ``bokeh`` outputs.  The same rows are
+             taken from error bands and model overlays, so they stay aligned.
+             Can be overridden on a per-graph basis with ``max_points``.  If
+             omitted, all points are plotted.
+
+             .. versionadded:: 1.5.9
+             """,
+        default=None,
+    )
     cmdline.stage4.add_argument(
         "--exp-n-datapoints-factor",
         type=float,
@@ -241,13 +258,17 @@ def _build_stage4(cmdline: PluginCmdline) -> PluginCmdline:
     cmdline.stage4.add_argument(
         "--project-no-CM",
         help="""
-             Specify that the intra-experiment confusion matrices defined in
-             project YAML configuration should not be generated.  Useful if you
-             are working on something which results in the generation of other
-             types of graphs, and the generation of confusion matrices only
-             slows down your development cycle.
+             Specify that the intra- and inter-experiment confusion matrices
+             defined in project YAML configuration should not be generated.
+             Useful if you are working on something which results in the
+             generation of other types of graphs, and the generation of
+             confusion matrices only slows down your development cycle.
 
              .. versionadded:: 1.5.6
+
+             .. versionchanged:: 1.5.9
+
+                Also applies to inter-experiment confusion matrices.
              """,
         action="store_true",
     )
@@ -266,6 +287,7 @@ def to_cmdopts(args: argparse.Namespace) -> types.Cmdopts:
         "plot_transpose_graphs": args.plot_transpose_graphs,
         # stage 4
         "graphs_backend": args.graphs_backend,
+        "graphs_max_points": args.graphs_max_points,
         "exp_n_datapoints_factor": args.exp_n_datapoints_factor,
         "exp_graphs": args.exp_graphs,
         "project_no_LN": args.project_no_LN,
@@ -13,7 +13,8 @@ import re
 import polars as pl
 
 # Project packages
-from sierra.core import utils, config, types, storage, batchroot
+from sierra.core import utils, config, types, batchroot, statistics, storage
+from sierra.core.graphs import schema
 import sierra.core.variables.batch_criteria as bc
 from sierra.plugins.prod.graphs import targets
 from sierra.core import plugin as pm
@@ -42,6 +43,9 @@ class GraphCollationInfo:
           from the exp dirnames for the batch.  Z values are a single time slice
           of time series data for the specified column in each experiment in the
           batch.
+
+    Confusion matrices don't use this class: their ``.counts`` are summed
+    across experiments instead (see :meth:`GraphCollator._collate_confusion`).
     """
 
     def __init__(
@@ -100,6 +104,10 @@ class GraphCollator:
             criteria.gen_exp_names(),
         )
 
+        if target["type"] == "confusion_matrix":
+            self._collate_confusion(target, exp_dirs)
+            return
+
         # Always do the mean, even if stats are disabled
         stat_config = config.STATS["mean"].exts
 
@@ -130,16 +138,18 @@ class GraphCollator:
         for diri in exp_dirs:
             self._collate_exp(target, diri.name, stats)
 
+        statistics.write(
+            {stat.df_ext: stat.df for stat in stats if stat.all_srcs_exist},
+            self.pathset.stat_interexp_root / target["dest_stem"],
+            "storage.csv",
+            self.cmdopts.get("dist_stats_bundle", False),
+        )
+
         for stat in stats:
             if stat.all_srcs_exist:
-                storage.df_write(
-                    stat.df,
-                    self.pathset.stat_interexp_root
-                    / (target["dest_stem"] + stat.df_ext),
-                    "storage.csv",
-                )
+                continue
 
-            elif not stat.all_srcs_exist and stat.some_srcs_exist:
+            if stat.some_srcs_exist:
                 self.logger.warning(
                     "Not all experiments in '%s' produced '%s%s'",
                     self.pathset.output_root,
@@ -154,20 +164,65 @@ class GraphCollator:
                     stat.df_ext,
                 )
 
+    def _collate_confusion(self, target: dict, exp_dirs: list[pathlib.Path]) -> None:
+        """Sum the ``<truth, predicted>`` counts from all experiments."""
+        ipaths = [
+            self.pathset.stat_root
+            / diri.name
+            / (target["src_stem"] + config.CONFUSION_COUNTS_EXT)
+            for diri in exp_dirs
+        ]
+        dfs = [
+            storage.df_read(ipath, "storage.csv")
+            for ipath in ipaths
+            if utils.path_exists(ipath)
+        ]
+
+        if len(dfs) < len(ipaths):
+            self.logger.warning(
+                "%s/%s experiments in <batchroot>/%s produced %s%s",
+                len(dfs),
+                len(ipaths),
+                self.pathset.output_root.relative_to(self.pathset.root),
+                target["src_stem"],
+                config.CONFUSION_COUNTS_EXT,
+            )
+
+        if not dfs:
+            return
+
+        storage.df_write(
+            statistics.confusion_counts(
+                dfs,
+                target.get("truth_col", "truth"),
+                target.get("predicted_col", "predicted"),
+                count_col="count",
+            ),
+            self.pathset.stat_interexp_root
+            / (target["dest_stem"] + config.CONFUSION_COUNTS_EXT),
+            "storage.csv",
+        )
+
     def _collate_exp(
         self, target: dict, exp_dir: str, stats: list[GraphCollationInfo]
     ) -> None:
         exp_stat_root = self.pathset.stat_root / exp_dir
+        dfs = statistics.read(
+            exp_stat_root,
+            target["src_stem"],
+            {stat.df_ext: stat.df_ext for stat in stats},
+            "storage.csv",
+            columns=schema.columns(target),
+        )
 
         for stat in stats:
-            csv_ipath = pathlib.Path(exp_stat_root, target["src_stem"] + stat.df_ext)
-            if not utils.path_exists(csv_ipath):
+            if stat.df_ext not in dfs:
                 stat.all_srcs_exist = False
                 continue
 
             stat.some_srcs_exist = True
 
-            data_df = storage.df_read(csv_ipath, "storage.csv")
+            data_df = dfs[stat.df_ext]
             # 2025-07-08 [JRH]: This is the ONE place in all the graph
             # generation code which is a procedural switch on graph type.
             if target["type"] == "summary_line":
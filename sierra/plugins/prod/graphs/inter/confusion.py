@@ -0,0 +1,69 @@
+#
+# Copyright 2026 John Harwell, All rights reserved.
+#
+# SPDX-License-Identifier: MIT
+#
+"""Generate confusion matrices *across* all :term:`Experiments <Experiment>`."""
+
+# Core packages
+import logging
+
+# 3rd party packages
+import json
+
+# Project packages
+from sierra.core import types, batchroot, graphs
+
+_logger = logging.getLogger(__name__)
+
+
+def generate(
+    cmdopts: types.Cmdopts,
+    pathset: batchroot.PathSet,
+    targets: list[types.YAMLDict],
+) -> None:
+    """
+    Generate confusion matrices from :term:`Collated Output Data` files.
+
+    The collated data are the ``<truth, predicted>`` counts summed across all
+    experiments in the batch.
+    """
+    large_text = cmdopts["plot_large_text"]
+
+    _logger.info(
+        "Confusion matrices from <batch_root>/%s",
+        pathset.stat_interexp_root.relative_to(pathset.root),
+    )
+
+    # For each category of confusion matrices we are generating
+    for category in targets:
+
+        # For each graph in each category
+        for graph in category:
+            # Only try to create confusion matrices (duh)
+            if graph["type"] != "confusion_matrix":
+                continue
+
+            _logger.trace("\n" + json.dumps(graph, indent=4))
+
+            graph_pathset = graphs.PathSet(
+                input_root=pathset.stat_interexp_root,
+                output_root=pathset.graph_interexp_root,
+                batchroot=pathset.root,
+                model_root=None,
+            )
+            graphs.confusion_matrix(
+                pathset=graph_pathset,
+                input_stem=graph["dest_stem"],
+                output_stem=graph["dest_stem"],
+                medium="storage.csv",
+                title=graph.get("title", ""),
+                backend=graph.get("backend", cmdopts["graphs_backend"]),
+                truth_col=graph.get("truth_col", "truth"),
+                predicted_col=graph.get("predicted_col", "predicted"),
+                xlabels_rotate=graph.get("xlabels_rotate", False),
+                large_text=large_text,
+            )
+
+
+__all__ = ["generate"]
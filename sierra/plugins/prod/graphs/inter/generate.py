@@ -17,7 +17,7 @@ from sierra.core import types, utils, batchroot, config
 from sierra.plugins.prod.graphs import targets
 from sierra.core import plugin as pm
 from sierra.core.variables import batch_criteria as bc
-from . import line, heatmap
+from . import line, heatmap, confusion
 
 _logger = logging.getLogger(__name__)
 
@@ -69,6 +69,14 @@ def proc_batch_exp(
         )
         heatmap.generate(cmdopts, pathset, graph_targets, info)
 
+    # Confusion matrices are summed across all experiments, so they don't depend
+    # on the batch criteria.
+    if not cmdopts["project_no_CM"]:
+        graph_targets = targets.inter_exp_calc(
+            graphs_config["inter-exp"], controller_config, cmdopts
+        )
+        confusion.generate(cmdopts, pathset, graph_targets)
+
 
 __all__ = [
     "proc_batch_exp",
@@ -128,6 +128,8 @@ def _gen_stacked_linegraph(
         logyscale=graph.get("logy", cmdopts["plot_log_yscale"]),
         large_text=cmdopts["plot_large_text"],
         legend=graph.get("legend", [f"exp{i}" for i in range(0, len(info.exp_names))]),
+        max_points=graph.get("max_points", cmdopts["graphs_max_points"]),
+        downsample_method=graph.get("downsample", "lttb"),
     )
 
 
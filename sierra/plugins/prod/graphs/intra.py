@@ -323,6 +323,8 @@ def _generate_linegraphs(
                     points=graph.get("points", False),
                     logyscale=graph.get("logy", cmdopts["plot_log_yscale"]),
                     large_text=cmdopts["plot_large_text"],
+                    max_points=graph.get("max_points", cmdopts["graphs_max_points"]),
+                    downsample_method=graph.get("downsample", "lttb"),
                 )
             except KeyError:
                 _logger.fatal(
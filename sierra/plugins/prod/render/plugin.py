@@ -30,8 +30,9 @@ import datetime
 
 # Project packages
 import sierra.core.variables.batch_criteria as bc
-from sierra.core import types, config, utils, batchroot
+from sierra.core import types, config, utils, batchroot, profiling, threads
 from sierra.core import plugin as pm
+from sierra.core.graphs import backends
 
 _logger = logging.getLogger(__name__)
 
@@ -160,6 +161,10 @@ def _from_project_imagized(
 
         <batch_root>/videos/<exp>/<subdir_path>
 
+    Videos which ``proc.imagize`` already rendered directly from its heatmap
+    sequences, and which are newer than any frames in ``<subdir_path>``, are
+    not re-rendered.
+
     For more details, see :ref:`plugins/prod/render`.
 
     .. NOTE:: This currently only works with PNG images.
@@ -192,6 +197,14 @@ def _from_project_imagized(
                     / exp.name
                     / candidate.relative_to(exp_imagize_root)
                 ) / (candidate.name + config.RENDERING["format"])
+
+                if _up_to_date(candidate, output_path):
+                    _logger.debug(
+                        "Not rendering <batchroot>/%s: already rendered",
+                        output_path.relative_to(pathset.root),
+                    )
+                    continue
+
                 inputs.append(
                     {
                         "input_dir": candidate,
@@ -204,6 +217,17 @@ def _from_project_imagized(
     _parallel(render_config, cmdopts, inputs)
 
 
+def _up_to_date(frames_dir: pathlib.Path, output_path: pathlib.Path) -> bool:
+    if not output_path.exists():
+        return False
+
+    mtime = output_path.stat().st_mtime
+    return all(
+        f.stat().st_mtime <= mtime
+        for f in frames_dir.glob(f"*.{config.GRAPHS['static_type']}")
+    )
+
+
 def _parallel(
     render_config: types.YAMLDict,
     cmdopts: types.Cmdopts,
@@ -212,19 +236,26 @@ def _parallel(
     """Perform the requested rendering in parallel."""
     q = mp.JoinableQueue()  # type: mp.JoinableQueue
 
+    # Render videos in parallel--waaayyyy faster
+    parallelism, n_threads = threads.budget(cmdopts)
+
     for spec in inputs:
+        spec["ffmpeg_opts"] = threads.ffmpeg_opts(spec["ffmpeg_opts"], n_threads)
         q.put(spec)
 
-    # Render videos in parallel--waaayyyy faster
-    parallelism = cmdopts["processing_parallelism"]
+    # Initialize the backends before forking, so any worker which ends up
+    # touching them inherits them rather than initializing them itself.
+    backends.initialize()
 
-    for _ in range(0, parallelism):
-        p = mp.Process(target=_worker, args=(q, render_config))
-        p.start()
+    with threads.limit(n_threads):
+        for _ in range(0, parallelism):
+            p = mp.Process(target=_worker, args=(q, render_config))
+            p.start()
 
-    q.join()
+        q.join()
 
 
+@profiling.worker
 def _worker(q: mp.Queue, render_config: types.YAMLDict) -> None:
     assert shutil.which("ffmpeg") is not None, "ffmpeg not found"
     while True:
@@ -234,9 +265,10 @@ def _worker(q: mp.Queue, render_config: types.YAMLDict) -> None:
 
             _logger.info("Rendering images in %s...", render_opts["exp_root"].name)
 
-            opts = render_opts["ffmpeg_opts"].split(" ")
+            opts = render_opts["ffmpeg_opts"].split()
 
-            ipaths = "'{}/*.{}'".format(
+            # ffmpeg does the globbing itself, so no shell is needed.
+            ipaths = "{}/*.{}".format(
                 render_opts["input_dir"], config.GRAPHS["static_type"]
             )
             cmd = ["ffmpeg", "-y", "-pattern_type", "glob", "-i", ipaths]
@@ -248,14 +280,12 @@ def _worker(q: mp.Queue, render_config: types.YAMLDict) -> None:
 
             utils.dir_create_checked(render_opts["output_path"].parent, exist_ok=True)
 
-            with subprocess.Popen(
-                to_run, shell=True, stderr=subprocess.PIPE, stdout=subprocess.PIPE
-            ) as proc:
-                proc.wait()
-
             # We use communicate(), not wait() to avoid issues with IO buffers
             # becoming full (e.g., you get deadlocks with wait() regularly).
-            stdout_raw, stderr_raw = proc.communicate()
+            with subprocess.Popen(
+                cmd, stderr=subprocess.PIPE, stdout=subprocess.PIPE
+            ) as proc:
+                stdout_raw, stderr_raw = proc.communicate()
 
             # Only show output if the process failed (i.e., did not return 0)
             if proc.returncode != 0:
@@ -10,10 +10,10 @@ import pathlib
 import typing as tp
 
 # 3rd party packages
-from retry import retry
 import polars as pl
 
 # Project packages
+from sierra.core import fs
 
 
 def supports_input(fmt: str) -> bool:
@@ -24,7 +24,7 @@ def supports_output(fmt: type) -> bool:
     return fmt is pl.DataFrame
 
 
-@retry(Exception, tries=10, delay=0.100, backoff=1.1)
+@fs.retry_transient
 def df_read(
     path: pathlib.Path, run_output_root: tp.Optional[pathlib.Path] = None, **kwargs
 ) -> pl.DataFrame:
@@ -34,7 +34,17 @@ def df_read(
     return pl.read_csv(path, separator=",", **kwargs)
 
 
-@retry(Exception, tries=10, delay=0.100, backoff=1.1)
+@fs.retry_transient
+def df_scan(
+    path: pathlib.Path, run_output_root: tp.Optional[pathlib.Path] = None, **kwargs
+) -> pl.LazyFrame:
+    """
+    Lazily scan a dataframe from a CSV file using polars.
+    """
+    return pl.scan_csv(path, separator=",", **kwargs)
+
+
+@fs.retry_transient
 def df_write(df: pl.DataFrame, path: pathlib.Path, **kwargs) -> None:
     """
     Write a dataframe to a CSV file using polars.
@@ -10,33 +10,33 @@ import pathlib
 import typing as tp
 
 # 3rd party packages
-from retry import retry
 import networkx as nx
 
 # Project packages
+from sierra.core import fs
 
 
 def supports_input(fmt: str) -> bool:
-    return fmt == ".grapml"
+    return fmt == ".graphml"
 
 
 def supports_output(fmt: type) -> bool:
     return fmt is nx.Graph
 
 
-@retry(Exception, tries=10, delay=0.100, backoff=1.1)
+@fs.retry_transient
 def graph_read(
     path: pathlib.Path, run_output_root: tp.Optional[pathlib.Path] = None, **kwargs
 ) -> nx.Graph:
     """
-    Read a dataframe from a .graphl file using networkx.
+    Read a graph from a .graphml file using networkx.
     """
     return nx.read_graphml(path)
 
 
-@retry(Exception, tries=10, delay=0.100, backoff=1.1)
+@fs.retry_transient
 def graph_write(graph: nx.Graph, path: pathlib.Path, **kwargs) -> None:
     """
-    Write a dataframe to a CSV file using pandas.
+    Write a graph to a .graphml file using networkx.
     """
     nx.write_graphml(graph, path)
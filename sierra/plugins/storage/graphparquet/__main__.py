@@ -0,0 +1,43 @@
+# Copyright 2026 John Harwell, All rights reserved.
+#
+#  SPDX-License-Identifier: MIT
+"""
+Convert existing GraphML files to parquet graph files.
+
+Usage::
+
+  python3 -m sierra.plugins.storage.graphparquet PATH [PATH ...]
+
+Each ``PATH`` is either a ``.graphml`` file or a directory to search
+recursively for them. Each converted file is written alongside the original.
+"""
+
+# Core packages
+import sys
+import pathlib
+
+# 3rd party packages
+
+# Project packages
+from sierra.plugins.storage.graphparquet import plugin
+
+
+def main(argv: list[str]) -> int:
+    if not argv:
+        print(__doc__)
+        return 1
+
+    n_converted = 0
+    for arg in argv:
+        path = pathlib.Path(arg)
+        fpaths = [path] if path.is_file() else sorted(path.rglob("*.graphml"))
+        for fpath in fpaths:
+            plugin.convert_graphml(fpath)
+            n_converted += 1
+
+    print(f"Converted {n_converted} GraphML files")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
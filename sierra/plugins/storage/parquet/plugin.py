@@ -0,0 +1,55 @@
+# Copyright 2026 John Harwell, All rights reserved.
+#
+#  SPDX-License-Identifier: MIT
+"""
+Plugin for reading/writing apache .parquet files using polars.
+
+Parquet is columnar and stores per-row group statistics, so :func:`df_scan`
+lets polars read only the columns and row groups which are actually needed.
+"""
+
+# Core packages
+import pathlib
+import typing as tp
+
+# 3rd party packages
+import polars as pl
+
+# Project packages
+from sierra.core import fs
+
+
+def supports_input(fmt: str) -> bool:
+    return fmt == ".parquet"
+
+
+def supports_output(fmt: type) -> bool:
+    return fmt is pl.DataFrame
+
+
+@fs.retry_transient
+def df_read(
+    path: pathlib.Path, run_output_root: tp.Optional[pathlib.Path] = None, **kwargs
+) -> pl.DataFrame:
+    """
+    Read a polars dataframe from an apache .parquet file.
+    """
+    return pl.read_parquet(path, **kwargs)
+
+
+@fs.retry_transient
+def df_scan(
+    path: pathlib.Path, run_output_root: tp.Optional[pathlib.Path] = None, **kwargs
+) -> pl.LazyFrame:
+    """
+    Lazily scan a polars dataframe from an apache .parquet file.
+    """
+    return pl.scan_parquet(path, **kwargs)
+
+
+@fs.retry_transient
+def df_write(df: pl.DataFrame, path: pathlib.Path, **kwargs) -> None:
+    """
+    Write a polars dataframe to an apache .parquet file.
+    """
+    df.write_parquet(path, **kwargs)
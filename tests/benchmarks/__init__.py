@@ -0,0 +1,11 @@
+#
+# Copyright 2026 John Harwell, All rights reserved.
+#
+# SPDX-License-Identifier: MIT
+#
+
+# Core packages
+
+# 3rd party packages
+
+# Project packages
@@ -0,0 +1,63 @@
+#
+# Copyright 2026 John Harwell, All rights reserved.
+#
+# SPDX-License-Identifier: MIT
+#
+
+# Core packages
+
+# 3rd party packages
+import pytest
+
+# Project packages
+import sierra.core.logging
+from sierra.core.graphs import backends
+from tests.benchmarks import synth, stages
+
+SIZES = {
+    "small": synth.SynthSpec(),
+    "large": synth.SynthSpec(
+        n_exps=16,
+        n_runs=16,
+        n_files=8,
+        rows=10000,
+        cols=16,
+        dtypes=["float", "float", "int", "bool", "str"],
+    ),
+}
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--synth-size",
+        choices=list(SIZES),
+        default="small",
+        help="Size of the synthetic batch to benchmark with",
+    )
+
+
+@pytest.fixture(scope="session")
+def batch(request, tmp_path_factory) -> synth.SynthBatch:
+    """A synthetic batch, as output by stage 2."""
+    sierra.core.logging.initialize("WARNING")
+    synth.plugins_init()
+
+    # Don't require a LaTeX install to benchmark rendering
+    backends.mpl_quality_init("fast")
+
+    spec = SIZES[request.config.getoption("--synth-size")]
+    return synth.generate(tmp_path_factory.mktemp("sierra"), spec)
+
+
+@pytest.fixture(scope="session")
+def processed(batch) -> synth.SynthBatch:
+    """The synthetic batch, after stage 3."""
+    stages.stage3(batch)
+    return batch
+
+
+@pytest.fixture(scope="session")
+def collated(processed) -> synth.SynthBatch:
+    """The synthetic batch, after inter-experiment graph collation in stage 4."""
+    stages.stage4_collate(processed)
+    return processed
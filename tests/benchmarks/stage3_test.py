@@ -0,0 +1,40 @@
+#
+# Copyright 2026 John Harwell, All rights reserved.
+#
+# SPDX-License-Identifier: MIT
+#
+
+# Core packages
+
+# 3rd party packages
+import pytest
+
+# Project packages
+from sierra.plugins.proc.collate import plugin as collate
+from tests.benchmarks import stages
+
+
+def test_gather(benchmark, batch):
+    exp = batch.criteria.gen_exp_names()[0]
+
+    specs = benchmark(stages.gather_exp, batch, exp)
+
+    assert len({s.gather.item_stem_path for s in specs}) == batch.spec.n_files
+    assert all(len(s.dfs) == batch.spec.n_runs for s in specs)
+
+
+@pytest.mark.parametrize("dist_stats", ["none", "conf95", "bw"])
+def test_statistics(benchmark, batch, dist_stats):
+    specs = stages.gather_exp(batch, batch.criteria.gen_exp_names()[0])
+
+    benchmark(stages.statistics_exp, batch, specs, dist_stats)
+
+
+def test_collate(benchmark, batch):
+    exp = batch.criteria.gen_exp_names()[0]
+    specs = stages.gather_exp(batch, exp, collate.ExpDataGatherer)
+
+    benchmark(stages.collate_exp, batch, specs)
+
+    collated = list((batch.pathset.stat_interexp_root / exp).iterdir())
+    assert len(collated) == batch.spec.n_files
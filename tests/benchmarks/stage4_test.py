@@ -0,0 +1,104 @@
+#
+# Copyright 2026 John Harwell, All rights reserved.
+#
+# SPDX-License-Identifier: MIT
+#
+
+# Core packages
+
+# 3rd party packages
+import pytest
+
+# Project packages
+from sierra.core import graphs
+from sierra.plugins.prod.graphs import collate
+from tests.benchmarks import stages
+
+
+@pytest.mark.parametrize("graph_type", ["stacked_line", "summary_line"])
+def test_graph_collation(benchmark, processed, graph_type):
+    collator = collate.GraphCollator(
+        processed.main_config, processed.cmdopts, processed.pathset
+    )
+    targets = stages.graph_targets(processed, "inter-exp", graph_type)
+
+    def _collate() -> None:
+        for target in targets:
+            collator(processed.criteria, target)
+
+    benchmark(_collate)
+
+    for target in targets:
+        stem = target["dest_stem"]
+        assert (processed.pathset.stat_interexp_root / f"{stem}.mean").exists()
+
+
+@pytest.mark.parametrize("backend", ["matplotlib", "bokeh"])
+def test_intra_render(benchmark, processed, backend):
+    exp = processed.criteria.gen_exp_names()[0]
+    paths = graphs.PathSet(
+        input_root=processed.pathset.stat_root / exp,
+        output_root=processed.pathset.graph_root / exp,
+        batchroot=processed.pathset.root,
+        model_root=None,
+    )
+    targets = stages.graph_targets(processed, "intra-exp", "stacked_line")
+
+    def _render() -> None:
+        for target in targets:
+            assert graphs.stacked_line(
+                paths=paths,
+                input_stem=target["src_stem"],
+                output_stem=target["dest_stem"],
+                title=target["dest_stem"],
+                medium="storage.csv",
+                backend=backend,
+                cols=target["cols"],
+                stats="none",
+            )
+
+    paths.output_root.mkdir(parents=True, exist_ok=True)
+    benchmark(_render)
+
+
+@pytest.mark.parametrize("backend", ["matplotlib", "bokeh"])
+def test_inter_render(benchmark, collated, backend):
+    paths = graphs.PathSet(
+        input_root=collated.pathset.stat_interexp_root,
+        output_root=collated.pathset.graph_interexp_root,
+        batchroot=collated.pathset.root,
+        model_root=None,
+    )
+    stacked = stages.graph_targets(collated, "inter-exp", "stacked_line")
+    summary = stages.graph_targets(collated, "inter-exp", "summary_line")
+    n_exps = collated.criteria.n_exp()
+
+    def _render() -> None:
+        for target in stacked:
+            assert graphs.stacked_line(
+                paths=paths,
+                input_stem=target["dest_stem"],
+                output_stem=target["dest_stem"],
+                title=target["dest_stem"],
+                medium="storage.csv",
+                backend=backend,
+                stats="none",
+            )
+
+        for target in summary:
+            assert graphs.summary_line(
+                paths=paths,
+                input_stem=target["dest_stem"],
+                output_stem=target["dest_stem"],
+                medium="storage.csv",
+                title=target["dest_stem"],
+                xlabel="Experiment",
+                ylabel=target["col"],
+                backend=backend,
+                legend=[target["col"]],
+                xticks=list(range(n_exps)),
+                stats="none",
+            )
+
+    paths.output_root.mkdir(parents=True, exist_ok=True)
+    benchmark(_render)
@@ -0,0 +1,39 @@
+#
+# Copyright 2026 John Harwell, All rights reserved.
+#
+# SPDX-License-Identifier: MIT
+#
+
+# Core packages
+
+# 3rd party packages
+
+# Project packages
+from sierra.plugins.compare.graphs import preprocess
+from tests.benchmarks import stages
+
+
+def test_preprocess(benchmark, collated, tmp_path):
+    targets = stages.graph_targets(collated, "inter-exp", "stacked_line")
+    controllers = [f"controller{i}" for i in range(4)]
+
+    def _preprocess() -> None:
+        for target in targets:
+            preparer = preprocess.IntraExpPreparer(
+                ipath_stem=collated.pathset.stat_interexp_root,
+                ipath_leaf=target["dest_stem"],
+                opath_stem=tmp_path,
+                criteria=collated.criteria,
+            )
+            # Each controller being compared adds a column to the same file
+            for controller in controllers:
+                preparer.for_cc(
+                    controller=controller,
+                    opath_leaf=target["dest_stem"],
+                    index=-1,
+                    inc_exps=None,
+                )
+
+    benchmark(_preprocess)
+
+    assert len(list(tmp_path.iterdir())) == len(targets)
@@ -0,0 +1,103 @@
+#
+# Copyright 2026 John Harwell, All rights reserved.
+#
+# SPDX-License-Identifier: MIT
+#
+"""
+Run the parts of stages 3-5 which are benchmarked on a synthetic batch.
+
+Everything runs in the calling process, rather than in the process pools the
+plugins normally use, so that benchmarks measure the work itself and not pool
+startup/scheduling.
+"""
+
+# Core packages
+import queue
+import pathlib
+
+# 3rd party packages
+import yaml
+
+# Project packages
+from sierra.core import config
+from sierra.core.pipeline.stage3 import gather
+from sierra.plugins.proc.statistics import plugin as statistics
+from sierra.plugins.proc.collate import plugin as collate
+from sierra.plugins.prod.graphs import collate as graph_collate
+from tests.benchmarks import synth
+
+
+def stat_opts(batch: synth.SynthBatch, dist_stats: str = "none") -> dict:
+    """Get the options :mod:`~sierra.plugins.proc.statistics` would use."""
+    cmdopts = batch.cmdopts
+    return {
+        "template_input_leaf": pathlib.Path(cmdopts["expdef_template"]).stem,
+        "df_verify": cmdopts["df_verify"],
+        "dist_stats": dist_stats,
+        "dist_stats_bundle": cmdopts["dist_stats_bundle"],
+        "dist_stats_prune": cmdopts["dist_stats_prune"],
+        "processing_mem_limit": cmdopts["processing_mem_limit"],
+        "storage": cmdopts["storage"],
+        "project_config_root": cmdopts["project_config_root"],
+        "df_homogenize": cmdopts["df_homogenize"],
+        "confusion_targets": {},
+    }
+
+
+def gather_exp(
+    batch: synth.SynthBatch, exp: str, gatherer_type=statistics.DataGatherer
+) -> list[gather.ProcessSpec]:
+    """Gather the outputs from all runs in an experiment."""
+    processq = queue.Queue()  # type: queue.Queue
+    gatherer = gatherer_type(batch.main_config, stat_opts(batch), processq)
+    gatherer(batch.pathset.output_root / exp)
+    return list(processq.queue)
+
+
+def statistics_exp(
+    batch: synth.SynthBatch, specs: list[gather.ProcessSpec], dist_stats: str
+) -> None:
+    """Generate statistics for gathered outputs."""
+    opts = stat_opts(batch, dist_stats)
+    for spec in specs:
+        statistics._proc_single_exp(batch.main_config, opts, batch.pathset, spec)
+
+
+def collate_exp(batch: synth.SynthBatch, specs: list[gather.ProcessSpec]) -> None:
+    """Collate gathered outputs across runs."""
+    for spec in specs:
+        collate._proc_single_exp(
+            batch.main_config, batch.pathset.stat_interexp_root, stat_opts(batch), spec
+        )
+
+
+def graph_targets(batch: synth.SynthBatch, kind: str, graph_type: str) -> list[dict]:
+    """Get the ``graphs.yaml`` targets of a type for ``intra-exp``/``inter-exp``."""
+    config_root = pathlib.Path(batch.cmdopts["project_config_root"])
+    path = config_root / config.PROJECT_YAML.graphs
+    with path.open() as f:
+        graphs = yaml.safe_load(f)
+
+    return [
+        g
+        for category in graphs[kind].values()
+        for g in category
+        if g["type"] == graph_type
+    ]
+
+
+def stage3(batch: synth.SynthBatch) -> None:
+    """Generate statistics and collated outputs for all experiments."""
+    for exp in batch.criteria.gen_exp_names():
+        statistics_exp(batch, gather_exp(batch, exp), "none")
+        collate_exp(batch, gather_exp(batch, exp, collate.ExpDataGatherer))
+
+
+def stage4_collate(batch: synth.SynthBatch) -> None:
+    """Collate statistics across experiments for all inter-experiment graphs."""
+    collator = graph_collate.GraphCollator(
+        batch.main_config, batch.cmdopts, batch.pathset
+    )
+    for graph_type in ["stacked_line", "summary_line"]:
+        for target in graph_targets(batch, "inter-exp", graph_type):
+            collator(batch.criteria, target)
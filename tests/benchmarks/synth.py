@@ -0,0 +1,256 @@
+#
+# Copyright 2026 John Harwell, All rights reserved.
+#
+# SPDX-License-Identifier: MIT
+#
+"""
+Generate synthetic batch experiments, without needing an engine.
+
+The generated batch looks like the output of stages 1-2: a
+``<batch_root>/exp-outputs/<exp>/<template>_run<N>_output/<leaf>/`` directory
+for each run, containing ``n_files`` outputs in the selected ``--storage``
+format, along with the project configuration (``graphs.yaml``,
+``collate.yaml``) needed to process them in stages 3-5.
+
+Usage::
+
+  python3 -m tests.benchmarks.synth SIERRA_ROOT [--n-exps N] [--n-runs N]
+      [--n-files N] [--rows N] [--cols N] [--dtypes float,int,...]
+      [--storage storage.csv]
+"""
+
+# Core packages
+import typing as tp
+import sys
+import pathlib
+import argparse
+from dataclasses import dataclass, field
+
+# 3rd party packages
+import numpy as np
+import polars as pl
+import yaml
+
+# Project packages
+import sierra.core.plugin as pm
+from sierra.core import batchroot, config, storage
+
+DTYPES = ["float", "int", "bool", "str"]
+
+_CATEGORIES = ["idle", "explore", "forage", "return", "avoid"]
+
+
+@dataclass
+class SynthSpec:
+    """What to generate.
+
+    Attributes:
+        n_exps: # of experiments in the batch.
+
+        n_runs: # of runs in each experiment.
+
+        n_files: # of output files from each run.
+
+        rows: # of rows in each output file.
+
+        cols: # of columns in each output file.
+
+        dtypes: The types of the columns, assigned round-robin; any of
+                ``float``, ``int``, ``bool``, ``str``. The first is always
+                what is graphed, so it should be numeric.
+
+        storage: The ``--storage`` plugin to write outputs with.
+    """
+
+    n_exps: int = 4
+    n_runs: int = 8
+    n_files: int = 4
+    rows: int = 1000
+    cols: int = 8
+    dtypes: list[str] = field(default_factory=lambda: ["float", "float", "int"])
+    storage: str = "storage.csv"
+
+    def col_names(self) -> list[str]:
+        return [f"{self.dtypes[i % len(self.dtypes)]}{i}" for i in range(self.cols)]
+
+    def numeric_cols(self) -> list[str]:
+        return [c for c in self.col_names() if c.startswith(("float", "int"))]
+
+    def file_stems(self) -> list[str]:
+        return [f"output{i}" for i in range(self.n_files)]
+
+
+class SynthCriteria:
+    """The parts of :class:`~sierra.core.variables.batch_criteria.XVarBatchCriteria`
+    which processing outputs needs.
+    """
+
+    def __init__(self, n_exps: int) -> None:
+        self.n_exps = n_exps
+
+    def gen_exp_names(self) -> list[str]:
+        return [f"c1-exp{i}" for i in range(self.n_exps)]
+
+    def n_exp(self) -> int:
+        return self.n_exps
+
+
+@dataclass
+class SynthBatch:
+    """A generated batch, and what's needed to run stages 3-5 on it."""
+
+    spec: SynthSpec
+    pathset: batchroot.PathSet
+    criteria: SynthCriteria
+    main_config: dict[str, tp.Any]
+    cmdopts: dict[str, tp.Any]
+
+
+def plugins_init() -> None:
+    """Make the built-in plugins (e.g., storage) available."""
+    import sierra  # noqa: PLC0415
+
+    pm.pipeline.initialize(None, [pathlib.Path(sierra.__file__).parent / "plugins"])
+
+
+def generate(sierra_root: pathlib.Path, spec: SynthSpec, seed: int = 0) -> SynthBatch:
+    """Generate a batch experiment under ``sierra_root``."""
+    if bad := set(spec.dtypes) - set(DTYPES):
+        raise ValueError(f"Bad dtypes {bad}: must be in {DTYPES}")
+
+    leaf = batchroot.ExpRootLeaf(bc=["synth"], template_stem="template")
+    root = batchroot.ExpRoot(
+        sierra_root=str(sierra_root),
+        project="synth",
+        controller="synth.default",
+        scenario="synth",
+        leaf=leaf,
+    )
+    pathset = batchroot.PathSet.from_root(root)
+    criteria = SynthCriteria(spec.n_exps)
+    main_config = {"sierra": {"run": {"run_metrics_leaf": "metrics"}}}
+
+    config_root = sierra_root / "config"
+    _write_config(config_root, spec)
+
+    ext = config.STORAGE_EXT[spec.storage.split(".")[1]]
+    rng = np.random.default_rng(seed)
+    for exp in criteria.gen_exp_names():
+        for run in range(spec.n_runs):
+            run_root = pathset.output_root / exp / f"template_run{run}_output"
+            output_root = run_root / main_config["sierra"]["run"]["run_metrics_leaf"]
+            output_root.mkdir(parents=True)
+            for stem in spec.file_stems():
+                storage.df_write(
+                    _gen_df(spec, rng), output_root / (stem + ext), spec.storage
+                )
+
+    cmdopts = {
+        "project": "synth",
+        "controller": "synth.default",
+        "scenario": "synth",
+        "expdef_template": "template.xml",
+        "project_config_root": str(config_root),
+        "storage": spec.storage,
+        "exp_range": None,
+        "df_verify": False,
+        "df_homogenize": "zero",
+        "dist_stats": "none",
+        "dist_stats_bundle": False,
+        "dist_stats_prune": False,
+        "processing_mem_limit": 90,
+        "processing_parallelism": 1,
+        "processing_threads": None,
+    }
+
+    return SynthBatch(spec, pathset, criteria, main_config, cmdopts)
+
+
+def _gen_df(spec: SynthSpec, rng: np.random.Generator) -> pl.DataFrame:
+    cols = {}
+    for name in spec.col_names():
+        if name.startswith("float"):
+            # Random walks look more like real time series than white noise
+            cols[name] = rng.normal(size=spec.rows).cumsum()
+        elif name.startswith("int"):
+            cols[name] = rng.poisson(10, size=spec.rows)
+        elif name.startswith("bool"):
+            cols[name] = rng.random(spec.rows) < 0.5
+        else:
+            cols[name] = rng.choice(_CATEGORIES, size=spec.rows)
+
+    return pl.DataFrame(cols)
+
+
+def _write_config(config_root: pathlib.Path, spec: SynthSpec) -> None:
+    col = spec.col_names()[0]
+    stems = spec.file_stems()
+
+    graphs = {
+        "intra-exp": {
+            "LN_synth": [
+                {
+                    "src_stem": stem,
+                    "dest_stem": stem,
+                    "type": "stacked_line",
+                    "cols": spec.numeric_cols(),
+                }
+                for stem in stems
+            ]
+        },
+        "inter-exp": {
+            "LN_synth": [
+                {
+                    "src_stem": stem,
+                    "dest_stem": f"{stem}-{kind}",
+                    "type": kind,
+                    **({"cols": [col]} if kind == "stacked_line" else {"col": col}),
+                }
+                for stem in stems
+                for kind in ["stacked_line", "summary_line"]
+            ]
+        },
+    }
+    collate = {"intra-exp": [{"file": stem, "cols": [col]} for stem in stems]}
+
+    config_root.mkdir(parents=True)
+    with (config_root / config.PROJECT_YAML.graphs).open("w") as f:
+        yaml.dump(graphs, f)
+
+    with (config_root / config.PROJECT_YAML.collate).open("w") as f:
+        yaml.dump(collate, f)
+
+
+def main(argv: list[str]) -> int:
+    defaults = SynthSpec()
+    parser = argparse.ArgumentParser(
+        prog="python3 -m tests.benchmarks.synth", usage=__doc__
+    )
+    parser.add_argument("sierra_root", type=pathlib.Path)
+    parser.add_argument("--n-exps", type=int, default=defaults.n_exps)
+    parser.add_argument("--n-runs", type=int, default=defaults.n_runs)
+    parser.add_argument("--n-files", type=int, default=defaults.n_files)
+    parser.add_argument("--rows", type=int, default=defaults.rows)
+    parser.add_argument("--cols", type=int, default=defaults.cols)
+    parser.add_argument("--dtypes", default=",".join(defaults.dtypes))
+    parser.add_argument("--storage", default=defaults.storage)
+    args = parser.parse_args(argv)
+
+    spec = SynthSpec(
+        n_exps=args.n_exps,
+        n_runs=args.n_runs,
+        n_files=args.n_files,
+        rows=args.rows,
+        cols=args.cols,
+        dtypes=args.dtypes.split(","),
+        storage=args.storage,
+    )
+
+    plugins_init()
+    batch = generate(args.sierra_root, spec)
+    print(batch.pathset.root)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,50 @@
+# Copyright 2026 John Harwell, All rights reserved.
+#
+#  SPDX-License-Identifier: MIT
+
+# Core packages
+
+# 3rd party packages
+
+# Project packages
+from sierra.core import execenv, types
+
+JOBLOG = """Seq\tHost\tStarttime\tJobRuntime\tSend\tReceive\tExitval\tSignal\tCommand
+1\tuser@small\t0\t200.0\t0\t0\t0\t0\tcmd
+2\tuser@big\t0\t100.0\t0\t0\t0\t0\tcmd
+3\tuser@big\t0\t100.0\t0\t0\t0\t0\tcmd
+4\tuser@fast\t0\t100.0\t0\t0\t0\t0\tcmd
+5\tuser@fast\t0\t5.0\t0\t0\t1\t0\tcmd
+"""
+
+
+def _node(hostname: str, n_cores: int, port: int = 22) -> types.ParsedNodefileSpec:
+    return types.ParsedNodefileSpec(
+        hostname=hostname, n_cores=n_cores, login="user", port=port
+    )
+
+
+def test_joblog_runtimes(tmp_path):
+    (tmp_path / "parallel.log").write_text(JOBLOG)
+    runtimes = execenv.joblog_runtimes([tmp_path / "parallel.log"])
+
+    # Failed jobs are ignored
+    assert runtimes == {"small": 200.0, "big": 100.0, "fast": 100.0}
+
+
+def test_nodefile_weighted():
+    nodes = [_node("small", 8), _node("big", 64), _node("big", 64)]
+
+    # Proportional to cores, duplicates removed
+    assert execenv.nodefile_weighted(nodes, 2) == ["4/user@small", "32/user@big"]
+
+    # Slow hosts lose slots; fast hosts are never oversubscribed
+    runtimes = {"small": 200.0, "big": 100.0}
+    assert execenv.nodefile_weighted(nodes, 2, runtimes) == [
+        "2/user@small",
+        "32/user@big",
+    ]
+
+    assert execenv.nodefile_weighted([_node("robot", 1, 2222)], 4) == [
+        "1/ssh -p 2222 user@robot"
+    ]
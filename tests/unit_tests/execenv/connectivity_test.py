@@ -0,0 +1,67 @@
+# Copyright 2026 John Harwell, All rights reserved.
+#
+#  SPDX-License-Identifier: MIT
+
+# Core packages
+import os
+import time
+import subprocess
+
+# 3rd party packages
+import pytest
+
+# Project packages
+from sierra.core import execenv, types
+
+MOCK_SSH = """#!/bin/sh
+sleep 0.5
+case "$*" in
+    *unreachable*) exit 255 ;;
+esac
+"""
+
+
+@pytest.fixture
+def mock_path(tmp_path, monkeypatch):
+    bindir = tmp_path / "bin"
+    bindir.mkdir()
+    (bindir / "ssh").write_text(MOCK_SSH)
+    (bindir / "ping").write_text("#!/bin/sh\nexit 0\n")
+    for f in bindir.iterdir():
+        f.chmod(0o755)
+
+    monkeypatch.setenv("PATH", f"{bindir}:{os.environ['PATH']}")
+
+
+def _nodes(hostnames: list[str]) -> list[types.ParsedNodefileSpec]:
+    return [
+        types.ParsedNodefileSpec(hostname=h, n_cores=1, login="user", port=22)
+        for h in hostnames
+    ]
+
+
+def test_concurrent(mock_path):
+    cmdopts = {"online_check_method": "ping+ssh"}
+
+    start = time.time()
+    execenv.check_connectivity_all(
+        cmdopts, _nodes([f"robot{i}" for i in range(16)]), "robot"
+    )
+
+    # Serially, this would take 8s
+    assert time.time() - start < 4.0
+
+
+def test_unreachable(mock_path):
+    cmdopts = {"online_check_method": "ping+ssh"}
+
+    with pytest.raises(subprocess.CalledProcessError):
+        execenv.check_connectivity_all(
+            cmdopts, _nodes(["robot0", "unreachable", "robot2"]), "robot"
+        )
+
+
+def test_ssh_cmd():
+    cmd = execenv.ssh_cmd()
+    assert "ControlMaster=auto" in cmd
+    assert "ControlPath=" in cmd
@@ -0,0 +1,151 @@
+# Copyright 2026 John Harwell, All rights reserved.
+#
+#  SPDX-License-Identifier: MIT
+
+# Core packages
+import argparse
+import os
+import pathlib
+import shutil
+import subprocess
+
+# 3rd party packages
+import pytest
+
+# Project packages
+from sierra.plugins.execenv.hpc.slurm import plugin as slurm
+from sierra.plugins.engine.argos import plugin as argos
+from sierra.plugins.engine.ros1gazebo import plugin as ros1gazebo
+
+# Runs each array task in sequence, like SLURM would (eventually).
+MOCK_SBATCH = """#!/bin/bash
+for arg in "$@"; do
+    case $arg in
+        --array=*) range=${arg#--array=}; range=${range%%%*} ;;
+        --chdir=*) cd "${arg#--chdir=}" ;;
+        --wrap=*) wrap=${arg#--wrap=} ;;
+    esac
+done
+for i in $(seq ${range%-*} ${range#*-}); do
+    SLURM_ARRAY_TASK_ID=$i bash -c "$wrap" || exit 1
+done
+echo 1234
+"""
+
+# Runs the job step in place, logging the options it was given.
+MOCK_SRUN = """#!/bin/bash
+while [[ $1 == --* ]]; do
+    echo "$1" >> "$(dirname "$0")/srun.log"
+    shift
+done
+exec "$@"
+"""
+
+
+@pytest.fixture
+def slurm_env(monkeypatch):
+    monkeypatch.setenv("SLURM_CPUS_PER_TASK", "4")
+    monkeypatch.setenv("SLURM_TASKS_PER_NODE", "2(x3),1")
+    monkeypatch.setenv("SLURM_JOB_NODELIST", "node[1-4]")
+    monkeypatch.setenv("SLURM_JOB_ID", "1234")
+
+
+def _exec_opts(root: pathlib.Path) -> dict:
+    return {
+        "exp_input_root": str(root),
+        "exp_scratch_root": str(root),
+        "cmdfile_stem_path": str(root / "commands"),
+        "cmdfile_ext": ".txt",
+        "exec_resume": False,
+        "n_jobs": 2,
+    }
+
+
+def test_tasks_per_node_parse():
+    assert slurm.tasks_per_node_parse("4") == [4]
+    assert slurm.tasks_per_node_parse("2(x3),1") == [2, 2, 2, 1]
+
+
+@pytest.mark.parametrize("engine", [argos, ros1gazebo])
+def test_engine_heterogeneous(slurm_env, monkeypatch, engine):
+    monkeypatch.setenv("SLURM_TASKS_PER_NODE", "4,2")
+    args = argparse.Namespace(
+        pipeline=[1, 2], exec_jobs_per_node=None, physics_n_threads=1
+    )
+
+    # The smallest node limits the # runs on each
+    args = engine.cmdline_postparse_configure("hpc.slurm", args)
+    assert args.exec_jobs_per_node == 2
+
+
+def test_srun(slurm_env, tmp_path):
+    generator = slurm.ExpShellCmdsGenerator({"exec_slurm_launcher": "srun"}, 0)
+    specs = generator.exec_exp_cmds(_exec_opts(tmp_path))
+
+    assert len(specs) == 1
+    assert "srun --exclusive --nodes=1 --ntasks=1 --cpus-per-task=4" in specs[0].cmd
+    assert "--jobs 7 " in specs[0].cmd
+    assert "sshloginfile" not in specs[0].cmd
+
+
+def _mock(tmp_path: pathlib.Path, name: str, script: str) -> dict:
+    bindir = tmp_path / "bin"
+    bindir.mkdir(exist_ok=True)
+    (bindir / name).write_text(script)
+    (bindir / name).chmod(0o755)
+
+    env = os.environ.copy()
+    env["PATH"] = f"{bindir}:{env['PATH']}"
+    return env
+
+
+@pytest.mark.skipif(shutil.which("parallel") is None, reason="GNU parallel needed")
+def test_srun_steps(slurm_env, tmp_path):
+    with (tmp_path / "commands.txt").open("w") as f:
+        for i in range(3):
+            f.write(f"echo {i} > {tmp_path}/run{i}.out\n")
+
+    generator = slurm.ExpShellCmdsGenerator({"exec_slurm_launcher": "srun"}, 0)
+    specs = generator.exec_exp_cmds(_exec_opts(tmp_path))
+
+    env = _mock(tmp_path, "srun", MOCK_SRUN)
+    subprocess.run(specs[0].cmd, shell=True, check=True, env=env)
+
+    for i in range(3):
+        assert (tmp_path / f"run{i}.out").read_text().strip() == str(i)
+
+    # One exclusive job step per run
+    srun_log = (tmp_path / "bin" / "srun.log").read_text().split()
+    assert srun_log.count("--exclusive") == 3
+    assert srun_log.count("--cpus-per-task=4") == 3
+
+
+def test_array_postparse(slurm_env, monkeypatch):
+    args = argparse.Namespace(
+        engine_vc=False, exec_slurm_launcher="array", exec_resume=False
+    )
+
+    # Inside an allocation
+    with pytest.raises(AssertionError, match="login node"):
+        slurm.cmdline_postparse_configure(args)
+
+    # From a login node, without an allocation's environment
+    monkeypatch.delenv("SLURM_JOB_ID")
+    monkeypatch.delenv("SLURM_JOB_NODELIST")
+    assert slurm.cmdline_postparse_configure(args) is args
+
+
+def test_array(slurm_env, tmp_path):
+    with (tmp_path / "commands.txt").open("w") as f:
+        for i in range(3):
+            f.write(f"echo {i} > {tmp_path}/run{i}.out\n")
+
+    generator = slurm.ExpShellCmdsGenerator({"exec_slurm_launcher": "array"}, 0)
+    specs = generator.exec_exp_cmds(_exec_opts(tmp_path))
+    assert "--array=0-2%7" in specs[0].cmd
+
+    env = _mock(tmp_path, "sbatch", MOCK_SBATCH)
+    subprocess.run(specs[0].cmd, shell=True, check=True, env=env)
+
+    for i in range(3):
+        assert (tmp_path / f"run{i}.out").read_text().strip() == str(i)
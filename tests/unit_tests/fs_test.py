@@ -0,0 +1,85 @@
+# Copyright 2026 John Harwell, All rights reserved.
+#
+#  SPDX-License-Identifier: MIT
+
+# Core packages
+import errno
+import pathlib
+
+# 3rd party packages
+import pytest
+import polars as pl
+
+# Project packages
+from sierra.core import fs, config, storage
+
+
+def test_exists_cached(tmp_path: pathlib.Path):
+    fs.invalidate()
+    (tmp_path / "a").touch()
+
+    assert fs.exists(tmp_path / "a")
+    assert not fs.exists(tmp_path / "b")
+    assert not fs.exists(tmp_path / "missing" / "c")
+
+    # Created behind the cache's back: not visible until invalidated
+    (tmp_path / "b").touch()
+    assert not fs.exists(tmp_path / "b")
+    assert fs.exists(tmp_path / "b", cached=False)
+
+    fs.invalidate(tmp_path / "b")
+    assert fs.exists(tmp_path / "b")
+
+
+def test_exists_dangling_symlink(tmp_path: pathlib.Path):
+    fs.invalidate()
+    (tmp_path / "link").symlink_to(tmp_path / "nowhere")
+
+    assert not fs.exists(tmp_path / "link")
+
+
+def test_retry_transient(monkeypatch):
+    monkeypatch.setitem(config.FS, "retry_delay", 0.0)
+    calls = []
+
+    @fs.retry_transient
+    def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise OSError(errno.ESTALE, "Stale file handle")
+        return True
+
+    assert flaky()
+    assert len(calls) == 3
+
+    @fs.retry_transient
+    def missing():
+        calls.append(1)
+        raise FileNotFoundError(errno.ENOENT, "No such file")
+
+    calls.clear()
+    with pytest.raises(FileNotFoundError):
+        missing()
+    assert len(calls) == 1
+
+
+def test_is_transient_wrapped():
+    assert fs.is_transient(RuntimeError("read failed: Stale file handle (os error 116)"))
+    assert not fs.is_transient(RuntimeError("could not parse 'x' as float"))
+
+
+def test_collect_retried(monkeypatch):
+    monkeypatch.setitem(config.FS, "retry_delay", 0.0)
+    lf = pl.LazyFrame({"a": [1, 2]})
+    calls = []
+
+    # Lazily scanned data is only read when the query is collected
+    def flaky(self, **kwargs):
+        calls.append(kwargs)
+        if len(calls) < 2:
+            raise OSError(errno.EIO, "Input/output error")
+        return pl.DataFrame({"a": [1, 2]})
+
+    monkeypatch.setattr(pl.LazyFrame, "collect", flaky)
+    assert storage.collect(lf, engine="streaming")["a"].to_list() == [1, 2]
+    assert calls == [{"engine": "streaming"}] * 2
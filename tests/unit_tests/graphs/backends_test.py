@@ -0,0 +1,52 @@
+# Copyright 2026 John Harwell, All rights reserved.
+#
+#  SPDX-License-Identifier: MIT
+
+# Core packages
+import pathlib
+
+# 3rd party packages
+import matplotlib as mpl
+from matplotlib import texmanager
+
+# Project packages
+from sierra.core import config
+from sierra.core.graphs import backends
+
+
+def test_mpl_quality_fast(monkeypatch):
+    backends.initialize()
+    monkeypatch.setitem(backends._state, "quality", "publication")
+
+    with mpl.rc_context():
+        backends.mpl_quality_init("fast")
+        assert not mpl.rcParams["text.usetex"]
+        assert mpl.rcParams["mathtext.fontset"] == "cm"
+
+
+def test_mpl_quality_publication(tmp_path: pathlib.Path, monkeypatch):
+    backends.initialize()
+    monkeypatch.setitem(backends._state, "quality", "publication")
+    monkeypatch.setattr(config, "CACHE_ROOT", tmp_path)
+    monkeypatch.setattr(
+        texmanager.TexManager, "_cache_dir", texmanager.TexManager._cache_dir
+    )
+
+    with mpl.rc_context():
+        backends.mpl_quality_init("publication")
+        assert mpl.rcParams["text.usetex"]
+        assert texmanager.TexManager._cache_dir == tmp_path / "tex"
+        assert (tmp_path / "tex").is_dir()
+
+
+def test_mpl_quality_deferred(monkeypatch):
+    monkeypatch.setitem(backends._state, "initialized", False)
+    monkeypatch.setitem(backends._state, "quality", "publication")
+
+    with mpl.rc_context():
+        usetex = mpl.rcParams["text.usetex"]
+        backends.mpl_quality_init("fast")
+
+        # Applied when the backends are initialized, not before
+        assert mpl.rcParams["text.usetex"] == usetex
+        assert backends._state["quality"] == "fast"
@@ -0,0 +1,56 @@
+# Copyright 2026 John Harwell, All rights reserved.
+#
+#  SPDX-License-Identifier: MIT
+
+# Core packages
+
+# 3rd party packages
+import numpy as np
+import polars as pl
+
+# Project packages
+from sierra.core.graphs import downsample
+
+
+def test_lttb_keeps_endpoints_and_spike():
+    y = np.zeros(10000)
+    y[4321] = 100.0
+    rows = downsample.lttb_indices(np.arange(len(y)), y, 100)
+
+    assert len(rows) == 100
+    assert rows[0] == 0
+    assert rows[-1] == len(y) - 1
+    assert 4321 in rows
+    assert np.all(np.diff(rows) > 0)
+
+
+def test_minmax_keeps_envelope():
+    rng = np.random.default_rng(0)
+    y = rng.normal(size=10000)
+    rows = downsample.minmax_indices(y, 200)
+
+    assert len(rows) <= 202
+    assert int(np.argmin(y)) in rows
+    assert int(np.argmax(y)) in rows
+
+
+def test_short_series_untouched():
+    df = pl.DataFrame({"a": [1.0, 2.0, 3.0]})
+    assert downsample.rows_select(df, ["a"], 10) is None
+    assert downsample.rows_take(df, None) is df
+
+
+def test_rows_aligned_across_frames():
+    n = 5000
+    df = pl.DataFrame({"a": np.sin(np.arange(n) / 100.0), "b": np.arange(n) * 1.0})
+    stddev = pl.DataFrame({"a": np.arange(n) * 1.0, "b": np.arange(n) * 2.0})
+    model = pl.DataFrame({"m": np.arange(n // 2) * 1.0})
+
+    rows = downsample.rows_select(df, ["a", "b"], 500, "minmax")
+    assert rows is not None
+    assert len(rows) <= 510
+
+    sub = downsample.rows_take(df, rows)
+    assert downsample.rows_take(stddev, rows)["a"].to_list() == rows.tolist()
+    assert downsample.rows_take(model, rows)["m"].max() < n // 2
+    assert len(sub) == len(rows)
@@ -0,0 +1,78 @@
+# Copyright 2026 John Harwell, All rights reserved.
+#
+#  SPDX-License-Identifier: MIT
+
+# Core packages
+import pathlib
+
+# 3rd party packages
+import numpy as np
+import matplotlib as mpl
+import polars as pl
+
+# Project packages
+from sierra.core.graphs import mplrender
+from sierra.core.graphs.heatmap import grid_from_df
+
+
+def test_figure_reused():
+    fig = mplrender.figure()
+    fig.add_subplot().plot([0, 1], [0, 1])
+
+    assert mplrender.figure() is fig
+    assert not fig.axes
+    assert mplrender.figure(ncols=2) is not fig
+
+
+def test_save(tmp_path: pathlib.Path):
+    opath = tmp_path / "graph.png"
+
+    # Don't require a LaTeX install just to test saving
+    with mpl.rc_context({"text.usetex": False}):
+        fig = mplrender.figure()
+        ax = fig.add_subplot()
+        ax.plot([0, 1], [0, 1], label="line")
+        mplrender.decorate(ax, mplrender.text_sizes(False), xlabel="x", ylabel="y")
+        mplrender.legend(ax, mplrender.text_sizes(False))
+        mplrender.save(fig, opath)
+
+    assert opath.stat().st_size > 0
+    assert not fig.axes
+
+
+def test_grid_from_df():
+    df = pl.DataFrame({"x": [1, 0, 1, 0], "y": [0, 0, 2, 2], "z": [1.0, 2.0, 3.0, 4.0]})
+    xs, ys, grid = grid_from_df(df, ("x", "y", "z"))
+
+    assert list(xs) == [0, 1]
+    assert list(ys) == [0, 2]
+    np.testing.assert_array_equal(grid, [[2.0, 1.0], [4.0, 3.0]])
+
+
+def test_frame_sequence():
+    with mpl.rc_context({"text.usetex": False}):
+        fig = mplrender.figure()
+        ax = fig.add_subplot()
+        im = ax.imshow(np.zeros((4, 4)), vmin=0, vmax=1)
+        ax.set_title("frames")
+        frames = mplrender.FrameSequence(fig, [im])
+
+        first = frames.frame().copy()
+        im.set_data(np.ones((4, 4)))
+        second = frames.frame()
+
+    assert first.shape == second.shape
+    assert first.shape[2] == 4
+    assert (first != second).any()
+
+
+def test_ffmpeg_rawvideo_cmd():
+    cmd = mplrender.ffmpeg_rawvideo_cmd(
+        pathlib.Path("out.mp4"), 640, 480, "-r 10 -c:v libx264"
+    )
+
+    assert cmd[0] == "ffmpeg"
+    assert cmd[cmd.index("-f") + 1] == "rawvideo"
+    assert cmd[cmd.index("-s") + 1] == "640x480"
+    assert cmd[cmd.index("-i") + 1] == "-"
+    assert cmd[-5:] == ["-r", "10", "-c:v", "libx264", "out.mp4"]
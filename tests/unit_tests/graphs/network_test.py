@@ -0,0 +1,41 @@
+# Copyright 2026 John Harwell, All rights reserved.
+#
+#  SPDX-License-Identifier: MIT
+
+# Core packages
+
+# 3rd party packages
+import networkx as nx
+import numpy as np
+
+# Project packages
+from sierra.core.graphs.network import LayoutCache
+
+
+def test_layout_cache_reuse():
+    cache = LayoutCache()
+    G = nx.path_graph(10)
+
+    first = cache(G, "spring")
+    second = cache(G.copy(), "spring")
+
+    assert second is first
+    assert cache.n_reused == 1
+    assert cache.n_incremental == 0
+
+
+def test_layout_cache_incremental():
+    cache = LayoutCache()
+    G = nx.path_graph(10)
+    first = cache(G, "spring")
+
+    H = G.copy()
+    H.add_edge(9, 10)
+    second = cache(H, "spring")
+
+    assert cache.n_incremental == 1
+    assert set(second) == set(H.nodes())
+
+    # Nodes not touched by the change stay put
+    for n in range(9):
+        np.testing.assert_allclose(second[n], first[n])
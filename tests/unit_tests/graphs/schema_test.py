@@ -0,0 +1,42 @@
+# Copyright 2026 John Harwell, All rights reserved.
+#
+#  SPDX-License-Identifier: MIT
+
+# Core packages
+
+# 3rd party packages
+
+# Project packages
+from sierra.core.graphs import schema
+
+
+def test_columns_line():
+    target = {"type": "stacked_line", "cols": ["a", "b"]}
+    assert schema.columns(target) == ["a", "b"]
+    assert schema.columns({"type": "stacked_line"}) is None
+
+    assert schema.columns({"type": "summary_line", "col": "a"}) == ["a"]
+    assert schema.columns({"type": "summary_line"}) is None
+
+
+def test_columns_heatmap():
+    assert schema.columns({"type": "heatmap"}) == ["x", "y", "z"]
+
+    target = {"type": "heatmap", "x": "foo", "z": "bar"}
+    assert schema.columns(target) == ["foo", "y", "bar"]
+
+    target = {"type": "heatmap", "col": "a"}
+    assert schema.columns(target) == ["x", "y", "z", "a"]
+
+
+def test_columns_confusion():
+    target = {"type": "confusion_matrix"}
+    assert schema.columns(target) == ["truth", "predicted"]
+
+    target = {"type": "confusion_matrix", "truth_col": "t", "predicted_col": "p"}
+    assert schema.columns(target) == ["t", "p"]
+
+
+def test_columns_unknown():
+    assert schema.columns({"type": "network"}) is None
+    assert schema.columns({}) is None
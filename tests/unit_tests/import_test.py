@@ -0,0 +1,62 @@
+# Copyright 2026 John Harwell, All rights reserved.
+#
+#  SPDX-License-Identifier: MIT
+
+# Core packages
+import subprocess
+import sys
+
+# 3rd party packages
+import pytest
+
+# Project packages
+
+# Graphics/graph libraries which are only needed when rendering; importing them
+# on the stage 1-3 path is what made startup slow.
+HEAVY = {"holoviews", "matplotlib", "bokeh", "tornado", "networkx", "PIL"}
+
+# Generous: cold imports on a shared filesystem are slow, and this is only meant
+# to catch a heavy library creeping back in.
+CONFIG_BUDGET_US = 1_500_000
+
+
+def _importtime(module: str) -> dict[str, int]:
+    """Get the cumulative import time (us) of each top-level package."""
+    res = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in res.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        fields = line[len("import time:") :].split("|")
+        if not fields[1].strip().isdigit():
+            continue
+        name = fields[2].strip().split(".")[0]
+        times[name] = max(times.get(name, 0), int(fields[1]))
+
+    return times
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "sierra.core.config",
+        "sierra.core.utils",
+        "sierra.core.storage",
+        "sierra.core.variables.batch_criteria",
+        "sierra.core.pipeline.stage3.gather",
+        "sierra.core.pipeline.pipeline",
+        "sierra.main",
+    ],
+)
+def test_no_heavy_imports(module):
+    assert not HEAVY & set(_importtime(module))
+
+
+def test_config_budget():
+    elapsed = min(_importtime("sierra.core.config")["sierra"] for _ in range(3))
+    assert elapsed < CONFIG_BUDGET_US
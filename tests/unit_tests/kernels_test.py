@@ -0,0 +1,97 @@
+# Copyright 2026 John Harwell, All rights reserved.
+#
+#  SPDX-License-Identifier: MIT
+
+# Core packages
+import math
+
+# 3rd party packages
+import numpy as np
+import polars as pl
+from polars.testing import assert_frame_equal
+
+# Project packages
+from sierra.plugins.proc.statistics import kernels
+
+
+def _runs(n_runs: int = 5, n_rows: int = 20) -> list[pl.DataFrame]:
+    rng = np.random.default_rng(0)
+    return [
+        pl.DataFrame(
+            {
+                "a": rng.normal(size=n_rows),
+                "b": rng.integers(0, 10, n_rows),
+                "c_mean": rng.random(n_rows),
+            }
+        )
+        for _ in range(n_runs)
+    ]
+
+
+def _eager(runs: list[pl.DataFrame], stat: pl.Expr) -> pl.DataFrame:
+    """Compute a statistic the eager way, as stage 3 used to."""
+    cols = runs[0].columns
+    return (
+        pl.concat([df.with_row_index("row_idx") for df in runs])
+        .group_by("row_idx")
+        .agg(stat(pl.col(c)).alias(c) for c in cols)
+        .sort("row_idx")
+        .drop("row_idx")
+    )
+
+
+def test_mean():
+    runs = _runs()
+    dfs = kernels.compute([df.lazy() for df in runs], ["mean"])
+
+    assert list(dfs) == [".mean"]
+    assert_frame_equal(dfs[".mean"], _eager(runs, lambda c: c.mean()))
+
+
+def test_conf95():
+    runs = _runs()
+    dfs = kernels.compute([df.lazy() for df in runs], ["mean", "conf95"])
+
+    assert_frame_equal(dfs[".mean"], _eager(runs, lambda c: c.mean().round(8)))
+    assert_frame_equal(dfs[".stddev"], _eager(runs, lambda c: c.std().round(8)))
+
+
+def test_bw():
+    runs = _runs()
+
+    # Runs of different lengths have fewer runs contributing to later rows
+    runs[0] = runs[0].head(10)
+    dfs = kernels.compute([df.lazy() for df in runs], ["bw"])
+
+    median = _eager(runs, lambda c: c.median().round(8))
+    q1 = _eager(runs, lambda c: c.quantile(0.25).round(8))
+    q3 = _eager(runs, lambda c: c.quantile(0.75).round(8))
+    assert_frame_equal(dfs[".median"], median)
+    assert_frame_equal(dfs[".q1"], q1)
+    assert_frame_equal(dfs[".q3"], q3)
+
+    iqr = (q3.to_numpy() - q1.to_numpy())[:, 0]
+    assert np.allclose(
+        dfs[".cilo"]["a"].to_numpy()[:10],
+        median["a"].to_numpy()[:10] - 1.57 * iqr[:10] / math.sqrt(5),
+    )
+    assert np.allclose(
+        dfs[".cilo"]["a"].to_numpy()[10:],
+        median["a"].to_numpy()[10:] - 1.57 * iqr[10:] / math.sqrt(4),
+    )
+
+
+def test_non_numeric():
+    runs = [
+        pl.DataFrame({"a": [1.0, 2.0], "s": ["x", "y"]}),
+        pl.DataFrame({"a": [3.0, 4.0], "s": ["x", "z"]}),
+        pl.DataFrame({"a": [5.0, 6.0], "s": ["w", "z"]}),
+    ]
+    dfs = kernels.compute([df.lazy() for df in runs], ["mean", "conf95"])
+
+    # conf95 overwrites the mean, and doesn't support non-numeric data
+    assert dfs[".mean"]["a"].to_list() == [3.0, 4.0]
+    assert dfs[".mean"]["s"].to_list() == [None, None]
+
+    dfs = kernels.compute([df.lazy() for df in runs], ["mean"])
+    assert dfs[".mean"]["s"].to_list() == ["x", "z"]
@@ -0,0 +1,110 @@
+# Copyright 2026 John Harwell, All rights reserved.
+#
+#  SPDX-License-Identifier: MIT
+
+# Core packages
+import argparse
+import functools
+import pathlib
+
+# 3rd party packages
+import pytest
+
+# Project packages
+from sierra.core import types
+from sierra.core.pipeline.stage2 import autotune, runner
+from sierra.plugins.engine.argos import plugin as argos
+
+
+def test_levels_calc():
+    assert autotune.levels_calc(4, 16, 10) == [2, 4, 8]
+    assert autotune.levels_calc(4, 6, 10) == [2, 4, 6]
+    assert autotune.levels_calc(1, 16, 10) == [1, 2]
+    assert autotune.levels_calc(8, 16, 3) == [3]
+
+
+def test_level_select():
+    assert autotune.level_select({2: 100.0, 4: 180.0, 8: 185.0}, 0.05) == 4
+    assert autotune.level_select({2: 100.0, 4: 180.0, 8: 250.0}, 0.05) == 8
+
+
+def test_cache(tmp_path: pathlib.Path):
+    cmdopts = {
+        "engine": "engine.argos",
+        "execenv": "hpc.local",
+        "scenario": "SS.12x6",
+        "exec_jobs_per_node": 4,
+    }
+    tuner = autotune.ConcurrencyTuner(
+        cmdopts, None, None, cache_path=tmp_path / "cache.json"
+    )
+    key = tuner.cache_key()
+    tuner.cache_store(key, {"jobs_per_node": 6, "runs_per_hour": 10.0})
+
+    # Cache hit doesn't touch the cmdfile or shell
+    assert tuner(tmp_path / "nonexistent.txt") == 6
+
+
+def test_stale_threads_refused(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("PBS_NUM_PPN", "16")
+    args = argparse.Namespace(pipeline=[1, 2], exec_jobs_per_node=4)
+
+    # Threads/run are computed from --exec-jobs-per-node in stage 1
+    args.exec_autotune = True
+    with pytest.raises(AssertionError, match="exec-autotune"):
+        argos.cmdline_postparse_configure("hpc.pbs", args)
+
+    args.exec_autotune = False
+    assert argos.cmdline_postparse_configure("hpc.pbs", args).physics_n_engines == 4
+
+
+class _Generator:
+    def __init__(self, name: str, _cmdopts: dict, _exp_num: int) -> None:
+        self.name = name
+
+    def pre_exp_cmds(self) -> list[types.ShellCmdSpec]:
+        return [types.ShellCmdSpec(cmd=f"{self.name}-pre", shell=True, wait=True)]
+
+    def post_exp_cmds(self) -> list[types.ShellCmdSpec]:
+        return [types.ShellCmdSpec(cmd=f"{self.name}-post", shell=True, wait=True)]
+
+
+class _Shell:
+    def __init__(self) -> None:
+        self.cmds = []  # type: list[str]
+
+    def run_from_spec(self, spec: types.ShellCmdSpec) -> bool:
+        self.cmds.append(spec.cmd)
+        return True
+
+
+def test_calibration_env(monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path):
+    shell = _Shell()
+    for module in [runner.execenv, runner.engine]:
+        generator = functools.partial(_Generator, module.__name__.split(".")[-1])
+        monkeypatch.setattr(module, "ExpShellCmdsGenerator", generator)
+
+    class _Tuner:
+        def __init__(self, *_args) -> None:
+            pass
+
+        def __call__(self, _cmdfile: pathlib.Path) -> int:
+            shell.cmds.append("tune")
+            return 6
+
+    monkeypatch.setattr(autotune, "ConcurrencyTuner", _Tuner)
+
+    batch = runner.BatchExpRunner.__new__(runner.BatchExpRunner)
+    batch.cmdopts = {"execenv": "hpc.local", "exec_jobs_per_node": 4}
+    batch.pathset = None
+    batch._autotune(shell, "per-exp", tmp_path, [tmp_path])
+
+    # Calibration runs in the same environment as the real runs
+    assert shell.cmds == [
+        "execenv-pre",
+        "engine-pre",
+        "tune",
+        "execenv-post",
+        "engine-post",
+    ]
+    assert batch.cmdopts["exec_jobs_per_node"] == 6
@@ -0,0 +1,160 @@
+# Copyright 2026 John Harwell, All rights reserved.
+#
+#  SPDX-License-Identifier: MIT
+
+# Core packages
+import multiprocessing as mp
+import threading
+import pathlib
+import queue
+import time
+
+# 3rd party packages
+import pytest
+import polars as pl
+import yaml
+
+# Project packages
+import sierra.core.plugin as pm
+import sierra.core.logging
+from sierra.core import config
+from sierra.core.pipeline.stage3 import gather
+from sierra.plugins.proc.statistics import plugin as statistics
+
+
+@pytest.fixture
+def budget():
+    with mp.Manager() as manager:
+        budget = gather.MemoryBudget(manager, 100)
+        budget.capacity = 100
+        yield budget
+
+
+def _run(budget: gather.MemoryBudget, footprint: int, log: list, name: str):
+    with budget.admit(footprint):
+        log.append(f"+{name}")
+        time.sleep(0.2)
+        log.append(f"-{name}")
+
+
+def _start(budget: gather.MemoryBudget, footprint: int, log: list, name: str):
+    thread = threading.Thread(target=_run, args=(budget, footprint, log, name))
+    thread.start()
+    time.sleep(0.05)
+    return thread
+
+
+def test_admit(budget: gather.MemoryBudget):
+    log = []  # type: list[str]
+
+    # a and b fit together, c waits for one of them
+    threads = [
+        _start(budget, 40, log, "a"),
+        _start(budget, 40, log, "b"),
+        _start(budget, 40, log, "c"),
+    ]
+    for t in threads:
+        t.join()
+
+    assert log[:2] == ["+a", "+b"]
+    assert log.index("+c") > log.index("-a")
+
+
+def test_admit_oversized(budget: gather.MemoryBudget):
+    log = []  # type: list[str]
+
+    # big waits for a to finish, and c waits for big even though it fits
+    threads = [
+        _start(budget, 10, log, "a"),
+        _start(budget, 500, log, "big"),
+        _start(budget, 10, log, "c"),
+    ]
+    for t in threads:
+        t.join()
+
+    assert log == ["+a", "-a", "+big", "-big", "+c", "-c"]
+
+
+def test_footprint(tmp_path: pathlib.Path):
+    path = tmp_path / "output.csv"
+    path.write_text("a,b\n" + "1.0,2.0\n" * 100)
+    size = path.stat().st_size
+
+    assert gather.footprint(path, 2, 2) == int(size * 3.0)
+    assert gather.footprint(path, 2, 1) == int(size * 1.5)
+
+    path = path.rename(tmp_path / "output.unknown")
+    assert gather.footprint(path, 2, 2) == int(size * 4.0)
+
+
+def _gatherer(
+    tmp_path: pathlib.Path, graphs: dict, prune: bool
+) -> statistics.DataGatherer:
+    sierra.core.logging.initialize("WARNING")
+    pm.pipeline.initialize(None, [pathlib.Path(pm.__file__).parent.parent / "plugins"])
+
+    with (tmp_path / config.PROJECT_YAML.graphs).open("w") as f:
+        yaml.dump(graphs, f)
+
+    gather_opts = {
+        "template_input_leaf": "template",
+        "df_verify": False,
+        "storage": "storage.csv",
+        "project_config_root": str(tmp_path),
+        "dist_stats_prune": prune,
+    }
+    main_config = {"sierra": {"run": {"run_metrics_leaf": "metrics"}}}
+    return statistics.DataGatherer(main_config, gather_opts, queue.Queue())
+
+
+_GRAPHS = {
+    "intra-exp": {
+        "LN_foo": [
+            {"src_stem": "output", "type": "stacked_line", "cols": ["a", "b"]},
+            {"src_stem": "other", "type": "stacked_line"},
+        ],
+        "HM_foo": [{"src_stem": "output", "type": "heatmap"}],
+    },
+    "inter-exp": {
+        "LN_foo": [{"src_stem": "output", "type": "summary_line", "col": "c"}],
+    },
+}
+
+
+def test_calc_cols(tmp_path: pathlib.Path):
+    gatherer = _gatherer(tmp_path, _GRAPHS, prune=True)
+
+    # Union of the columns all matching graphs use
+    cols = gatherer._calc_cols(pathlib.Path("output.csv"))
+    assert sorted(cols) == ["a", "b", "c", "x", "y", "z"]
+
+    # A matching graph uses all columns
+    assert gatherer._calc_cols(pathlib.Path("other.csv")) is None
+
+    gatherer = _gatherer(tmp_path, _GRAPHS, prune=False)
+    assert gatherer._calc_cols(pathlib.Path("output.csv")) is None
+
+
+def test_gather_pruned(tmp_path: pathlib.Path):
+    gatherer = _gatherer(tmp_path, _GRAPHS, prune=True)
+
+    df = pl.DataFrame({c: [1.0, 2.0] for c in ["x", "unused", "a", "b", "c", "y", "z"]})
+    exp_root = tmp_path / "c1-exp0"
+    for run in range(2):
+        metrics_root = exp_root / f"template_run{run}_output" / "metrics"
+        metrics_root.mkdir(parents=True)
+        df.write_csv(metrics_root / "output.csv")
+
+    gatherer(exp_root)
+    specs = list(gatherer.processq.queue)
+    assert len(specs) == 1
+
+    # Every column the graphs need is kept, in file order
+    assert len(specs[0].dfs) == 2
+    for lf in specs[0].dfs:
+        assert lf.collect().columns == ["x", "a", "b", "c", "y", "z"]
+
+    # Fewer columns read means a smaller estimated footprint
+    full = sum(gather.footprint(p, 7, 7) for p in specs[0].paths)
+    assert specs[0].footprint == sum(gather.footprint(p, 7, 6) for p in specs[0].paths)
+    assert specs[0].footprint < full
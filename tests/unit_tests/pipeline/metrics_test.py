@@ -0,0 +1,106 @@
+# Copyright 2026 John Harwell, All rights reserved.
+#
+#  SPDX-License-Identifier: MIT
+
+# Core packages
+import json
+import pathlib
+import multiprocessing as mp
+
+# 3rd party packages
+import pytest
+
+# Project packages
+from sierra.core.pipeline import metrics
+
+EXPS = ["exp0", "exp1", "exp1"]
+
+
+def _write(path: pathlib.Path) -> None:
+    path.write_text("x" * 100)
+    metrics.io("w", path)
+
+
+@pytest.fixture(autouse=True)
+def state(monkeypatch):
+    monkeypatch.setattr(metrics, "_state", dict(metrics._state, frames=[]))
+    monkeypatch.delenv("SIERRA_METRICS_DIR", raising=False)
+
+
+def _records(path: pathlib.Path) -> list[dict]:
+    with path.open() as f:
+        return [json.loads(line) for line in f]
+
+
+def test_measure(tmp_path: pathlib.Path):
+    path = tmp_path / "metrics.jsonl"
+    metrics.initialize(path, ["exp0", "exp1"])
+
+    outputs = [tmp_path / exp / f"out{i}.csv" for i, exp in enumerate(EXPS)]
+    for exp in EXPS:
+        (tmp_path / exp).mkdir(exist_ok=True)
+
+    with metrics.measure(3):
+        with metrics.measure(3, "proc.test"), mp.get_context("fork").Pool(2) as pool:
+            pool.map(_write, outputs)
+        metrics.add("exp0", wall_secs=2.0)
+
+    records = _records(path)
+    assert [(r["plugin"], r["exp"]) for r in records] == [
+        ("proc.test", None),
+        ("proc.test", "exp0"),
+        ("proc.test", "exp1"),
+        (None, None),
+        (None, "exp0"),
+    ]
+    plugin, exp0, exp1, stage, stage_exp0 = records
+
+    # Writes in workers count towards the plugin, its experiments, and the stage
+    assert plugin["files_written"] == stage["files_written"] == 3
+    assert plugin["bytes_written"] == 300
+    assert (exp0["files_written"], exp1["files_written"]) == (1, 2)
+    assert stage_exp0["wall_secs"] == 2.0
+    assert stage_exp0["files_written"] == 0
+
+    assert stage["wall_secs"] >= plugin["wall_secs"] > 0
+    assert stage["rss_peak"] > 0
+
+
+def test_compare(tmp_path: pathlib.Path):
+    def _record(invocation: str, plugin, wall_secs: float) -> dict:
+        return {
+            "invocation": invocation,
+            "stage": 3,
+            "plugin": plugin,
+            "exp": None,
+            "wall_secs": wall_secs,
+            "bytes_read": 1_000_000,
+            "bytes_written": 0,
+        }
+
+    batches = {
+        # Only the most recent run of each stage/plugin is compared
+        "a": [_record("1", None, 10.0), _record("2", "proc.test", 4.0)],
+        "b": [_record("1", None, 5.0), _record("1", "proc.test", 2.0)],
+    }
+    for batch, records in batches.items():
+        path = tmp_path / batch / "statistics" / "exec" / "metrics.jsonl"
+        path.parent.mkdir(parents=True)
+        path.write_text("".join(json.dumps(r) + "\n" for r in records))
+
+    df = metrics.compare(metrics.load(tmp_path / "a"), metrics.load(tmp_path / "b"))
+    assert df["plugin"].to_list() == ["-", "proc.test"]
+
+    row = df.filter(plugin="proc.test").row(0, named=True)
+    assert (row["wall_secs_a"], row["wall_secs_b"]) == (4.0, 2.0)
+    assert row["wall_secs_%"] == -50.0
+    assert row["io_mb_per_sec_%"] == 100.0
+
+
+def test_disabled(tmp_path: pathlib.Path):
+    metrics.initialize(None, [])
+    with metrics.measure(3):
+        _write(tmp_path / "out.csv")
+        metrics.add("exp0", wall_secs=1.0)
+
+    assert list(tmp_path.iterdir()) == [tmp_path / "out.csv"]
@@ -0,0 +1,77 @@
+#
+# Copyright 2026 John Harwell, All rights reserved.
+#
+# SPDX-License-Identifier: MIT
+#
+
+# Core packages
+import pathlib
+import subprocess
+import types
+
+# 3rd party packages
+import polars as pl
+
+# Project packages
+import sierra.core.plugin as pm
+from sierra.core.pipeline.stage2 import telemetry
+
+
+def test_monitor_attributes_runs(tmp_path: pathlib.Path):
+    # Two "runs" as children of a GNU parallel-like process, which is itself
+    # run in a shell, as in ExpShell.
+    parallel = tmp_path / "parallel"
+    parallel.write_text(
+        "#!/bin/sh\n"
+        "sh -c 'sleep 0.6; : /c1-exp1/template_run0' &\n"
+        "sh -c 'sleep 0.6; : /c1-exp1/template_run1' &\n"
+        "wait\n"
+    )
+    parallel.chmod(0o755)
+
+    monitor = telemetry.ProcessTreeMonitor(0.05, ["c1-exp0", "c1-exp1"], "unknown")
+    proc = subprocess.Popen(f'"{parallel}" --jobs 2 < /dev/null; true', shell=True)
+    monitor.start(proc.pid)
+    proc.wait()
+    runs = monitor.stop()
+
+    assert sorted(r.run for r in runs) == ["run0", "run1"]
+    assert all(r.exp == "c1-exp1" for r in runs)
+    assert all(r.wall_secs > 0.3 for r in runs)
+    assert all(r.rss_peak > 0 for r in runs)
+
+
+def test_to_df():
+    tel = telemetry.BatchTelemetry(
+        {"exec_telemetry": True, "exec_telemetry_interval": 1.0}, None, ["c1-exp0"]
+    )
+    tel.runs.append(
+        telemetry.RunTelemetry(
+            exp="c1-exp0", run="run0", cmd="", start=0.0, end=10.0, rss_peak=4096
+        )
+    )
+    df = tel.to_df()
+
+    assert df.height == 1
+    assert df["wall_secs"][0] == 10.0
+    assert df["rss_peak"][0] == 4096
+
+
+def test_finalize(tmp_path: pathlib.Path):
+    pm.pipeline.initialize(None, [pathlib.Path(pm.__file__).parent.parent / "plugins"])
+    pathset = types.SimpleNamespace(root=tmp_path, stat_exec_root=tmp_path / "exec")
+    tel = telemetry.BatchTelemetry(
+        {"exec_telemetry": True, "exec_telemetry_interval": 1.0}, pathset, ["c1-exp0"]
+    )
+    tel.runs.append(
+        telemetry.RunTelemetry(
+            exp="c1-exp0", run="run0", cmd="", start=0.0, end=10.0, rss_peak=4096
+        )
+    )
+
+    # Columnar, with column types preserved
+    opath = tel.finalize("stamp")
+    assert opath == tmp_path / "exec" / "stamp-telemetry.parquet"
+    df = pl.read_parquet(opath)
+    assert df["rss_peak"].dtype.is_integer()
+    assert df["wall_secs"][0] == 10.0
@@ -0,0 +1,44 @@
+# Copyright 2026 John Harwell, All rights reserved.
+#
+#  SPDX-License-Identifier: MIT
+
+# Core packages
+import pathlib
+
+# 3rd party packages
+
+# Project packages
+from sierra.core import plugin, config
+
+
+def _make_plugin(root: pathlib.Path, name: str) -> None:
+    pdir = root / "storage" / name
+    pdir.mkdir(parents=True)
+    (pdir / ".sierraplugin").touch()
+    (pdir / "__init__.py").write_text(
+        "def sierra_plugin_type():\n    return 'pipeline'\n"
+    )
+    (pdir / "plugin.py").write_text("LOADED = True\n")
+
+
+def test_index_and_lazy_load(tmp_path: pathlib.Path, monkeypatch):
+    monkeypatch.setattr(config, "CACHE_ROOT", tmp_path / "cache")
+    root = tmp_path / "plugins"
+    _make_plugin(root, "fake1")
+
+    manager = plugin.DirectoryPluginManager()
+    manager.initialize(None, [root])
+    assert set(manager.available_plugins()) == {"storage.fake1"}
+    assert (tmp_path / "cache" / config.PLUGIN_INDEX["cache_leaf"]).exists()
+
+    # Nothing is loaded until it is needed
+    assert manager.loaded_plugins() == {}
+    assert manager.has_plugin("storage.fake1")
+    assert manager.get_plugin_module("storage.fake1").LOADED
+    assert not manager.has_cmdline("storage.fake1")
+
+    # Adding a plugin invalidates the index
+    _make_plugin(root, "fake2")
+    manager = plugin.DirectoryPluginManager()
+    manager.initialize(None, [root])
+    assert set(manager.available_plugins()) == {"storage.fake1", "storage.fake2"}
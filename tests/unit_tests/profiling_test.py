@@ -0,0 +1,77 @@
+# Copyright 2026 John Harwell, All rights reserved.
+#
+#  SPDX-License-Identifier: MIT
+
+# Core packages
+import os
+import json
+import pstats
+import pathlib
+import multiprocessing as mp
+
+# 3rd party packages
+import pytest
+
+# Project packages
+from sierra.core import profiling
+
+
+@profiling.worker
+def _square(x: int) -> int:
+    with profiling.span("kernel", x=x):
+        return x * x
+
+
+@pytest.fixture(autouse=True)
+def state(monkeypatch):
+    monkeypatch.setattr(profiling, "_state", dict(profiling._state))
+    monkeypatch.delenv("SIERRA_PROFILE", raising=False)
+    monkeypatch.delenv("SIERRA_PROFILE_DIR", raising=False)
+
+
+def _run_stage() -> None:
+    with profiling.stage("stage3"), mp.get_context("fork").Pool(2) as pool:
+        assert pool.map(_square, range(4), chunksize=1) == [0, 1, 4, 9]
+
+
+def test_trace_merges_workers(tmp_path: pathlib.Path):
+    profiling.initialize("trace", tmp_path)
+    _run_stage()
+
+    with (tmp_path / "stage3" / "trace.json").open() as f:
+        events = json.load(f)["traceEvents"]
+
+    spans = [e for e in events if e["ph"] == "X"]
+    assert [e["name"] for e in spans if e["cat"] == "stage"] == ["stage3"]
+
+    kernels = [e for e in spans if e["name"] == "kernel"]
+    assert sorted(e["args"]["x"] for e in kernels) == [0, 1, 2, 3]
+    assert all(e["pid"] != os.getpid() for e in kernels)
+
+    # Every process is labeled
+    labeled = {e["pid"] for e in events if e["ph"] == "M"}
+    assert {e["pid"] for e in spans} <= labeled
+
+
+def test_cprofile_merges_workers(tmp_path: pathlib.Path):
+    profiling.initialize("cprofile", tmp_path)
+    _run_stage()
+
+    stage_dir = tmp_path / "stage3"
+    assert list(stage_dir.glob("worker-*.prof"))
+    assert (stage_dir / "report.txt").exists()
+
+    stats = pstats.Stats(str(stage_dir / "merged.prof"))
+    calls = [
+        stat[1] for func, stat in stats.stats.items() if func[2] == "_square"
+    ]
+    assert sum(calls) == 4
+
+
+def test_disabled():
+    profiling.initialize(None, None)
+
+    with profiling.stage("stage3"):
+        assert _square(3) == 9
+        with profiling.span("read"):
+            pass
@@ -0,0 +1,74 @@
+# Copyright 2026 John Harwell, All rights reserved.
+#
+#  SPDX-License-Identifier: MIT
+
+# Core packages
+import pathlib
+
+# 3rd party packages
+import pytest
+
+# Project packages
+from sierra.core import startup, types, config
+
+PACKAGES = types.OSPackagesSpec(
+    "linux",
+    "test",
+    pkgs={
+        "core": types.PackageSpec(True),
+        "fonts": types.PackageSpec(False, ["prod.graphs"]),
+        "video": types.PackageSpec(False, ["prod.render"]),
+        "robots": types.PackageSpec(True, ["execenv.robot"]),
+    },
+)
+
+
+class FakeQuery:
+    def __init__(self, installed: set[str]) -> None:
+        self.installed = installed
+        self.calls = []
+
+    def __call__(self, pkgs: list[str]) -> set[str]:
+        self.calls.append(pkgs)
+        return self.installed & set(pkgs)
+
+
+@pytest.fixture(autouse=True)
+def cache_root(tmp_path: pathlib.Path, monkeypatch):
+    monkeypatch.setattr(config, "CACHE_ROOT", tmp_path)
+
+
+def test_only_selected_plugins():
+    query = FakeQuery({"core", "fonts"})
+    startup._do_pkg_checks("test", "deb", PACKAGES, ["prod.graphs"], query)
+
+    # One bulk query, for only what the selected plugins need
+    assert query.calls == [["core", "fonts"]]
+
+    with pytest.raises(RuntimeError):
+        startup._do_pkg_checks(
+            "test", "deb", PACKAGES, ["execenv.robot.turtlebot3"], query
+        )
+
+
+def test_cached():
+    query = FakeQuery({"core"})
+    startup._do_pkg_checks("test", "deb", PACKAGES, ["prod.render"], query)
+    startup._do_pkg_checks("test", "deb", PACKAGES, ["prod.render"], query)
+    assert len(query.calls) == 1
+
+    # Only packages without a cached result are queried for
+    startup._do_pkg_checks("test", "deb", PACKAGES, ["prod.graphs"], query)
+    assert query.calls[1] == ["fonts"]
+
+
+def test_stale_required_rechecked():
+    with pytest.raises(RuntimeError):
+        startup._do_pkg_checks(
+            "test", "deb", PACKAGES, ["execenv.robot"], FakeQuery({"core"})
+        )
+
+    # Installed since the last check
+    query = FakeQuery({"core", "robots"})
+    startup._do_pkg_checks("test", "deb", PACKAGES, ["execenv.robot"], query)
+    assert query.calls == [["core", "robots"]]
@@ -0,0 +1,122 @@
+# Copyright 2026 John Harwell, All rights reserved.
+#
+#  SPDX-License-Identifier: MIT
+
+# Core packages
+import pathlib
+
+# 3rd party packages
+import polars as pl
+from polars.testing import assert_frame_equal
+
+# Project packages
+import sierra.core.plugin as pm
+from sierra.core import statistics, config
+from sierra.plugins.compare.graphs import preprocess
+
+
+def test_bundle_roundtrip():
+    mean = pl.DataFrame({"a": [1.0, 2.0], "b.c": [3.0, 4.0]})
+    stddev = pl.DataFrame({"a": [0.1, 0.2], "b.c": [0.3, 0.4]})
+    whislo = pl.DataFrame({"a": [0.5, 1.5], "b.c": [2.5, 3.5]})
+
+    bundled = statistics.bundle(
+        {".mean": mean, ".stddev": stddev, ".whislo": whislo}
+    )
+    assert bundled.columns == [
+        "a.mean",
+        "b.c.mean",
+        "a.stddev",
+        "b.c.stddev",
+        "a.whislo",
+        "b.c.whislo",
+    ]
+
+    exts = {
+        "mean": ".mean",
+        **config.STATS["conf95"].exts,
+        **config.STATS["bw"].exts,
+    }
+    dfs = statistics.unbundle(bundled, exts)
+
+    assert set(dfs) == {"mean", "stddev", "whislo"}
+    assert_frame_equal(dfs["mean"], mean)
+    assert_frame_equal(dfs["stddev"], stddev)
+    assert_frame_equal(dfs["whislo"], whislo)
+
+
+def test_counts_across_runs():
+    run1 = pl.DataFrame({"truth": ["a", "b", "c"], "predicted": ["a", "a", "d"]})
+    run2 = pl.DataFrame({"truth": ["a", "b", None], "predicted": ["a", "b", "x"]})
+
+    counts = statistics.confusion_counts([run1, run2], "truth", "predicted")
+
+    # Every pair of categories is present, sorted by truth then predicted
+    assert len(counts) == 16
+    assert counts["truth"].to_list() == [c for c in "abcd" for _ in range(4)]
+    assert counts["predicted"].to_list() == list("abcd") * 4
+
+    grid = counts["count"].to_numpy().reshape(4, 4)
+    assert grid[0, 0] == 2
+    assert grid[1, 0] == 1
+    assert grid[1, 1] == 1
+    assert grid[2, 3] == 1
+    assert grid.sum() == 5
+
+
+def test_counts_summed_across_exps():
+    exp1 = statistics.confusion_counts(
+        [pl.DataFrame({"t": [1, 1], "p": [1, 2]})], "t", "p"
+    )
+    exp2 = statistics.confusion_counts(
+        [pl.DataFrame({"t": [3, 1], "p": [3, 1]})], "t", "p"
+    )
+
+    total = statistics.confusion_counts([exp1, exp2], "t", "p", count_col="count")
+
+    assert total["t"].to_list() == [1, 1, 1, 2, 2, 2, 3, 3, 3]
+    assert total["count"].to_list() == [2, 1, 0, 0, 0, 0, 0, 0, 1]
+
+
+class _Criteria:
+    def gen_exp_names(self) -> list[str]:
+        return ["c1-exp0", "c1-exp1"]
+
+
+def test_stage5_bundled(tmp_path: pathlib.Path):
+    pm.pipeline.initialize(None, [pathlib.Path(pm.__file__).parent.parent / "plugins"])
+
+    # Inter-experiment statistics for two controllers, as collated in stage 4
+    for i, controller in enumerate(["c1", "c2"]):
+        (tmp_path / controller).mkdir()
+        mean = {"c1-exp0": [float(i), i + 1.0], "c1-exp1": [2.0, 3.0]}
+        stddev = {"c1-exp0": [0.1, 0.2], "c1-exp1": [float(i), 0.4]}
+        statistics.write(
+            {".mean": pl.DataFrame(mean), ".stddev": pl.DataFrame(stddev)},
+            tmp_path / controller / "output",
+            "storage.csv",
+            True,
+        )
+        assert not (tmp_path / controller / "output.stddev").exists()
+
+        preprocess.IntraExpPreparer(
+            ipath_stem=tmp_path / controller,
+            ipath_leaf="output",
+            opath_stem=tmp_path,
+            criteria=_Criteria(),
+            bundled=True,
+        ).for_cc(controller=controller, opath_leaf="cc-output", index=-1, inc_exps=None)
+
+    assert not (tmp_path / "cc-output.stddev").exists()
+    dfs = statistics.read(
+        tmp_path,
+        "cc-output",
+        {"mean": ".mean", **config.STATS["conf95"].exts},
+        "storage.csv",
+    )
+
+    assert dfs["mean"].columns == ["Experiment ID", "c1", "c2"]
+    assert dfs["mean"]["c1"].to_list() == [1.0, 3.0]
+    assert dfs["mean"]["c2"].to_list() == [2.0, 3.0]
+    assert dfs["stddev"]["c1"].to_list() == [0.2, 0.4]
+    assert dfs["stddev"]["c2"].to_list() == [0.2, 0.4]
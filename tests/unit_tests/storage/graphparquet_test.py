@@ -0,0 +1,56 @@
+# Copyright 2026 John Harwell, All rights reserved.
+#
+#  SPDX-License-Identifier: MIT
+
+# Core packages
+import pathlib
+
+# 3rd party packages
+import networkx as nx
+import pytest
+
+# Project packages
+import sierra.core.plugin as pm
+from sierra.core import storage
+from sierra.plugins.storage.graphparquet import plugin as graphparquet
+
+
+def test_rdwr(tmp_path: pathlib.Path):
+    G = nx.DiGraph(name="test")
+    G.add_node("a", color="red", size=3.0)
+    G.add_node("b", size=5.0)
+    G.add_node("c")
+    G.add_edge("a", "b", weight=2.0)
+    G.add_edge("b", "c")
+
+    path = tmp_path / "graph.gparquet"
+    graphparquet.graph_write(G, path)
+    G2 = graphparquet.graph_read(path)
+
+    assert G2.is_directed()
+    assert G2.graph == {"name": "test"}
+    assert dict(G2.nodes(data=True)) == dict(G.nodes(data=True))
+    assert list(G2.edges(data=True)) == list(G.edges(data=True))
+
+
+def test_convert_graphml(tmp_path: pathlib.Path):
+    G = nx.path_graph(5)
+    nx.set_node_attributes(G, 1.5, "size")
+
+    src = tmp_path / "graph.graphml"
+    nx.write_graphml(G, src)
+    dest = graphparquet.convert_graphml(src)
+
+    assert dest.suffix == ".gparquet"
+    assert nx.utils.graphs_equal(graphparquet.graph_read(dest), nx.read_graphml(src))
+
+
+def test_graph_medium():
+    pm.pipeline.initialize(None, [pathlib.Path(pm.__file__).parent.parent / "plugins"])
+
+    # Chosen by extension, not by --storage
+    assert storage.graph_medium(pathlib.Path("g.gparquet")) == "storage.graphparquet"
+    assert storage.graph_medium(pathlib.Path("g.graphml")) == "storage.graphml"
+
+    with pytest.raises(ValueError, match="csv"):
+        storage.graph_medium(pathlib.Path("g.csv"))
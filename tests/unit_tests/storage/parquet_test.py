@@ -0,0 +1,44 @@
+# Copyright 2026 John Harwell, All rights reserved.
+#
+#  SPDX-License-Identifier: MIT
+
+# Core packages
+import pathlib
+
+# 3rd party packages
+import polars as pl
+import numpy as np
+
+# Project packages
+import sierra.core.plugin as pm
+from sierra.core import storage
+from sierra.plugins.storage.parquet import plugin as parquet
+
+
+def test_rdwr(tmp_path: pathlib.Path):
+    df = pl.DataFrame(np.random.randint(1, 10, size=(5, 3)), schema=["A", "B", "C"])
+
+    path = tmp_path / "random1.parquet"
+    parquet.df_write(df, path)
+
+    assert df.equals(parquet.df_read(path))
+    assert df.equals(parquet.df_scan(path).collect())
+
+
+def test_pushdown(tmp_path: pathlib.Path):
+    pm.pipeline.initialize(None, [pathlib.Path(pm.__file__).parent.parent / "plugins"])
+    df = pl.DataFrame({"A": range(10), "B": range(10, 20), "C": range(20, 30)})
+
+    for medium in ["storage.parquet", "storage.graphml"]:
+        assert storage.supports_scan(medium) == (medium == "storage.parquet")
+
+    path = tmp_path / "random1.parquet"
+    parquet.df_write(df, path)
+
+    # Columns not in the file are ignored, and the predicate can use columns
+    # which aren't selected.
+    df2 = storage.df_read(
+        path, "storage.parquet", columns=["C", "A", "D"], predicate=pl.col("B") >= 15
+    )
+    assert df2.columns == ["A", "C"]
+    assert df2["A"].to_list() == list(range(5, 10))
@@ -0,0 +1,44 @@
+# Copyright 2026 John Harwell, All rights reserved.
+#
+#  SPDX-License-Identifier: MIT
+
+# Core packages
+import os
+
+# 3rd party packages
+import pytest
+
+# Project packages
+from sierra.core import threads
+
+
+def test_budget(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(threads, "n_cpus", lambda: 64)
+
+    # Available CPUs divided among workers
+    assert threads.budget({"processing_parallelism": 16}) == (16, 4)
+    assert threads.budget({"processing_parallelism": 128}) == (128, 1)
+
+    # Processes traded for threads
+    cmdopts = {"processing_parallelism": 64, "processing_threads": 8}
+    assert threads.budget(cmdopts) == (8, 8)
+    cmdopts = {"processing_parallelism": 4, "processing_threads": 8}
+    assert threads.budget(cmdopts) == (1, 8)
+
+
+def test_limit(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.delenv("POLARS_MAX_THREADS", raising=False)
+    monkeypatch.setenv("OMP_NUM_THREADS", "3")
+
+    with threads.limit(2):
+        assert os.environ["POLARS_MAX_THREADS"] == "2"
+        assert os.environ["OMP_NUM_THREADS"] == "3"
+
+    assert "POLARS_MAX_THREADS" not in os.environ
+    assert os.environ["OMP_NUM_THREADS"] == "3"
+
+
+def test_ffmpeg_opts():
+    assert threads.ffmpeg_opts("", 2) == "-threads 2"
+    assert threads.ffmpeg_opts("-r 10", 2) == "-r 10 -threads 2"
+    assert threads.ffmpeg_opts("-threads 8 -r 10", 2) == "-threads 8 -r 10"